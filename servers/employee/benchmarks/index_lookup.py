@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import bindparam, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from employee.migrations import migrate
+from employee.models.user import User
+from employee.repositories.address_repository import address_repository
+from employee.repositories.user_repository import user_repository
+from employee.seed import seed
+
+INDEXES = ("ix_users_last_name", "ix_addresses_user_id")
+QUERIES = 200
+
+
+async def measure(engine: AsyncEngine, last_names: list[str], user_ids: list[int]):
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as session:
+        started = time.perf_counter()
+        for last_name in last_names:
+            await user_repository.get_by_last_name(session, last_name)
+        by_last_name = (time.perf_counter() - started) / len(last_names)
+
+        started = time.perf_counter()
+        for user_id in user_ids:
+            await address_repository.get_by_user_id(session, user_id)
+        by_user_id = (time.perf_counter() - started) / len(user_ids)
+    return by_last_name, by_user_id
+
+
+async def run(users: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(directory) / 'benchmark.db'}"
+        )
+        report = await seed(engine, users)
+        print(f"seeded:         {users} users in {report.seconds:.1f} s")
+
+        rng = random.Random(1)
+        user_ids = rng.sample(range(1, users + 1), QUERIES)
+        last_names = [f"Benchmark{user_id}" for user_id in user_ids]
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(User)
+                .where(User.id == bindparam("user_id"))
+                .values(last_name=bindparam("name")),
+                [
+                    {"user_id": user_id, "name": name}
+                    for user_id, name in zip(user_ids, last_names, strict=True)
+                ],
+            )
+
+        async with engine.begin() as conn:
+            for name in INDEXES:
+                await conn.execute(text(f"DROP INDEX {name}"))
+        unindexed = await measure(engine, last_names, user_ids)
+
+        async with engine.begin() as conn:
+            await conn.run_sync(migrate)
+        indexed = await measure(engine, last_names, user_ids)
+        await engine.dispose()
+
+    for label, before, after in zip(
+        ("by last name:", "address by user:"), unindexed, indexed, strict=True
+    ):
+        print(
+            f"{label:<16}{before * 1e3:9.2f} ms -> {after * 1e3:.3f} ms "
+            f"({before / after:.0f}x)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark indexed lookups.")
+    parser.add_argument("users", type=int, nargs="?", default=1_000_000)
+    asyncio.run(run(parser.parse_args().users))
+
+
+if __name__ == "__main__":
+    main()
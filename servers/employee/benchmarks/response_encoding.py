@@ -0,0 +1,51 @@
+import argparse
+import random
+import timeit
+
+from employee.encoding import encode_page
+from employee.schemas import PageDto, UserDto
+from employee.seed import ValuePools
+
+NUMBER = 20
+
+
+def users_page(size: int) -> PageDto:
+    pools = ValuePools.generate(seed=42)
+    rng = random.Random(42)
+    items = [
+        UserDto(
+            id=user_id,
+            first_name=rng.choice(pools.first_names),
+            last_name=rng.choice(pools.last_names),
+            email=f"user{user_id}@example.com",
+            age=rng.randint(18, 80),
+            gender=rng.choice(["male", "female", "other"]),
+        ).model_dump(mode="json")
+        for user_id in range(1, size + 1)
+    ]
+    return PageDto.from_items(items, size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("users", type=int, nargs="?", default=1000)
+    args = parser.parse_args()
+
+    page = users_page(args.users)
+    baseline = len(page.model_dump_json())
+    print(f"{args.users} users")
+    for response_format in ("json", "table", "csv"):
+
+        def serialize() -> str:
+            return encode_page(page, response_format).model_dump_json()  # noqa: B023
+
+        size = len(serialize().encode())
+        seconds = timeit.timeit(serialize, number=NUMBER) / NUMBER
+        print(
+            f"{response_format:>5}: {size:>8} bytes ({size / baseline:5.0%}), "
+            f"{seconds * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from employee.connect import _session_factory, create_engines
+from employee.models.user import User
+from employee.seed import seed
+
+USERS = 10_000
+WORKERS = 200
+OPERATIONS = 40
+WRITE_RATIO = 0.5
+
+
+async def worker(
+    session_factory: async_sessionmaker[AsyncSession], rng: random.Random
+) -> tuple[int, int]:
+    done = errors = 0
+    for _ in range(OPERATIONS):
+        user_id = rng.randint(1, USERS)
+        try:
+            async with session_factory() as session:
+                if rng.random() < WRITE_RATIO:
+                    await session.execute(
+                        update(User).where(User.id == user_id).values(age=User.age + 1)
+                    )
+                    await session.commit()
+                else:
+                    await session.execute(select(User).where(User.id == user_id))
+            done += 1
+        except OperationalError:
+            errors += 1
+    return done, errors
+
+
+async def measure(
+    label: str, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    rng = random.Random(1)
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(worker(session_factory, random.Random(rng.random())) for _ in range(WORKERS))
+    )
+    elapsed = time.perf_counter() - started
+    done = sum(result[0] for result in results)
+    errors = sum(result[1] for result in results)
+    print(f"{label:<16}{done / elapsed:8.0f} ops/s, {errors} locked errors")
+
+
+async def run(directory: Path) -> None:
+    url = f"sqlite+aiosqlite:///{directory / 'benchmark.db'}"
+    setup = create_async_engine(url)
+    await seed(setup, USERS)
+    await setup.dispose()
+
+    default = create_async_engine(url, pool_size=20, max_overflow=30)
+    await measure("default engine:", async_sessionmaker(bind=default))
+    await default.dispose()
+
+    writer, (reader,) = create_engines(url)
+    await measure("sqlite profile:", _session_factory(writer, reader))
+    await writer.dispose()
+    await reader.dispose()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(Path(directory)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, Generic, TypeVar
+
+from employee.config import settings
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 3)}
+
+
+class LookupCache(Generic[T]):
+    """Read-through LRU cache with a TTL for single-row lookups.
+
+    Only found rows are cached. Every invalidation bumps a generation
+    counter, so a load that raced with a write is returned but not stored.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.clock = clock
+        self.entries: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+        self.stats = CacheStats()
+        self._generation = 0
+
+    async def get_or_load(
+        self, key: Hashable, load: Callable[[], Awaitable[T | None]]
+    ) -> T | None:
+        if not self.enabled:
+            return await load()
+
+        entry = self.entries.get(key)
+        if entry and self.clock() < entry[1]:
+            self.entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+        self.stats.misses += 1
+        generation = self._generation
+        value = await load()
+        if value is None:
+            self.entries.pop(key, None)
+        elif generation == self._generation:
+            self._store(key, value)
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        self._generation += 1
+        for key in keys:
+            if self.entries.pop(key, None):
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self.stats.invalidations += len(self.entries)
+        self.entries.clear()
+
+    def _store(self, key: Hashable, value: T) -> None:
+        self.entries[key] = (value, self.clock() + self.ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+def _from_settings() -> LookupCache[Any]:
+    return LookupCache(
+        ttl=settings.cache_ttl,
+        max_entries=settings.cache_max_entries,
+        enabled=settings.cache_enabled,
+    )
+
+
+user_cache = _from_settings()
+address_cache = _from_settings()
@@ -9,6 +9,12 @@ class Settings(BaseSettings):
     database_url: str = Field(default=None)
     log_level: str = Field(default="INFO")
     initial_users_count: int = Field(default=10)
+    export_dir: Path = Field(default=Path("data/exports"))
+    slow_query_ms: float = Field(default=100.0)
+    read_replica_urls: list[str] = Field(default_factory=list)
+    cache_enabled: bool = Field(default=True)
+    cache_ttl: float = Field(default=60.0)
+    cache_max_entries: int = Field(default=1024)
 
     model_config = SettingsConfigDict(env_file=Path.home() / ".env")
 
@@ -1,41 +1,262 @@
 import logging
+import time
+from collections.abc import Callable, Sequence
+from functools import partial
 from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import Delete, Insert, Update, event, make_url
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, SessionTransaction
 
 from employee.config import settings
+from employee.instrumentation import instrument
 
 logger = logging.getLogger(__name__)
 
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "busy_timeout": 5000,
+}
+SQLITE_READERS = 8
+SQLITE_WRITE_TIMEOUT = 30
+REPLICA_COOLDOWN = 30.0
+
+
+class RoutingSession(Session):
+    """Session sending flushes and DML to the writer engine, reads to the reader.
+
+    Once a transaction has written, its reads go to the writer as well, so
+    they see the transaction's own uncommitted changes.
+    """
+
+    write_transaction: SessionTransaction | None = None
+
+    def get_bind(self, mapper=None, *, clause=None, **kw: Any) -> Engine:
+        if (
+            self._flushing
+            or isinstance(clause, (Insert, Update, Delete))
+            or self.write_transaction is not None
+            and self.write_transaction is self.get_transaction()
+        ):
+            return self.info["writer"]
+        return self.info["reader"]
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def _track_write_transaction(
+    session: RoutingSession, transaction: SessionTransaction, connection: Connection
+) -> None:
+    if connection.engine is session.info["writer"]:
+        session.write_transaction = session.get_transaction()
+
+
+class ReplicaSet:
+    """Round-robin over read engines, skipping engines that recently failed.
+
+    An engine is taken out of rotation for `cooldown` seconds when it fails
+    to connect or loses its connection; if no engine is healthy, reads fall
+    back to the primary.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        fallback: AsyncEngine,
+        cooldown: float = REPLICA_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.engines = list(engines)
+        self.fallback = fallback
+        self.cooldown = cooldown
+        self.clock = clock
+        self.unhealthy_until: dict[AsyncEngine, float] = {}
+        self._next = 0
+        for engine in self.engines:
+            if engine is not fallback:
+                event.listen(
+                    engine.sync_engine, "handle_error", partial(self._on_error, engine)
+                )
+
+    def choose(self) -> AsyncEngine:
+        now = self.clock()
+        for _ in range(len(self.engines)):
+            engine = self.engines[self._next % len(self.engines)]
+            self._next += 1
+            if self.unhealthy_until.get(engine, 0.0) <= now:
+                return engine
+        return self.fallback
+
+    def mark_unhealthy(self, engine: AsyncEngine) -> None:
+        now = self.clock()
+        if self.unhealthy_until.get(engine, 0.0) > now:
+            return
+        self.unhealthy_until[engine] = now + self.cooldown
+        logger.warning(f"⚠️ Read replica {engine.url!r} unavailable, skipping it")
+
+    def _on_error(self, engine: AsyncEngine, context: ExceptionContext) -> None:
+        if context.is_disconnect or context.connection is None:
+            self.mark_unhealthy(engine)
+
+
+class ReplicaSession(AsyncSession):
+    """Read-only session connecting to the next healthy read engine on entry.
+
+    A replica that fails to connect is marked unhealthy and the next one is
+    tried, down to the primary, so the failure never reaches the caller.
+    """
+
+    async def __aenter__(self) -> "ReplicaSession":
+        replicas: ReplicaSet = self.info["replicas"]
+        while True:
+            engine = replicas.choose()
+            self.sync_session.bind = engine.sync_engine
+            try:
+                await self.connection()
+                return self
+            except OperationalError:
+                await self.close()
+                if engine is replicas.fallback:
+                    raise
+                replicas.mark_unhealthy(engine)
+
 
 class Database:
     @classmethod
-    async def connect(cls) -> "Database":
+    async def connect(
+        cls,
+        database_url: str | None = None,
+        replica_urls: Sequence[str] | None = None,
+    ) -> "Database":
         logger.info("🔌 Start SQLAlchemy Engine...")
-        _create_db_directory(settings.database_url)
-        cls.engine = create_async_engine(
-            settings.database_url,
-            pool_size=20,
-            max_overflow=30,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=settings.log_level == "DEBUG",
+        database_url = database_url or settings.database_url
+        replica_urls = (
+            settings.read_replica_urls if replica_urls is None else replica_urls
         )
-        cls.async_session_local = async_sessionmaker(
-            bind=cls.engine, expire_on_commit=False
+        _create_db_directory(database_url)
+        cls.engine, readers = create_engines(database_url, replica_urls)
+        for engine in dict.fromkeys((cls.engine, *readers)):
+            instrument(engine, settings.slow_query_ms)
+        cls.replicas = ReplicaSet(readers, fallback=cls.engine)
+        cls.async_session_local = _session_factory(
+            cls.engine, _local_reader(cls.engine, readers)
+        )
+        cls.read_session_local = async_sessionmaker(
+            class_=ReplicaSession,
+            expire_on_commit=False,
+            info={"replicas": cls.replicas},
         )
         return cls()
 
     async def disconnect(self) -> None:
         logger.info("🧹 Close SQLAlchemy Engine...")
-        if self.engine:
-            await self.engine.dispose()
+        for engine in dict.fromkeys((self.engine, *self.replicas.engines)):
+            if engine:
+                await engine.dispose()
 
-    def get_async_session(self) -> AsyncSession:
+    def get_async_session(self, read_only: bool = False) -> AsyncSession:
+        if read_only:
+            return self.read_session_local()
         return self.async_session_local()
 
 
+def create_engines(
+    database_url: str, replica_urls: Sequence[str] = ()
+) -> tuple[AsyncEngine, list[AsyncEngine]]:
+    """Create the primary engine and the read engines for a database URL.
+
+    SQLite files get a single-connection writer engine, which queues all
+    writers instead of failing with "database is locked", and a pool of
+    reader connections that read concurrently thanks to WAL mode. Read
+    replicas come after that local reader. Without replicas, other backends
+    and in-memory SQLite read from the primary.
+    """
+    url = make_url(database_url)
+    replicas = [_create_read_engine(replica_url) for replica_url in replica_urls]
+    if url.get_backend_name() != "sqlite":
+        engine = _create_pooled_engine(database_url)
+        return engine, replicas or [engine]
+
+    if url.database in (None, "", ":memory:"):
+        engine = create_async_engine(database_url, echo=_echo())
+        return engine, replicas or [engine]
+
+    writer = create_async_engine(
+        database_url,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=SQLITE_WRITE_TIMEOUT,
+        echo=_echo(),
+    )
+    event.listen(writer.sync_engine, "connect", _apply_sqlite_pragmas)
+    logger.info(f"⚙️ SQLite profile: 1 writer, {SQLITE_READERS} readers, WAL")
+    return writer, [_create_read_engine(database_url), *replicas]
+
+
+def _create_read_engine(database_url: str) -> AsyncEngine:
+    if make_url(database_url).get_backend_name() != "sqlite":
+        return _create_pooled_engine(database_url)
+    engine = create_async_engine(
+        database_url, pool_size=SQLITE_READERS, max_overflow=0, echo=_echo()
+    )
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def _create_pooled_engine(database_url: str) -> AsyncEngine:
+    return create_async_engine(
+        database_url,
+        pool_size=20,
+        max_overflow=30,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=_echo(),
+    )
+
+
+def _echo() -> bool:
+    return settings.log_level == "DEBUG"
+
+
+def _local_reader(writer: AsyncEngine, readers: Sequence[AsyncEngine]) -> AsyncEngine:
+    """Return the engine write sessions read from.
+
+    Only the WAL reader of a SQLite file sees the writer's commits at once;
+    replicas may lag, so every other setup reads from the primary.
+    """
+    return readers[0] if readers[0].url == writer.url else writer
+
+
+def _session_factory(
+    writer: AsyncEngine, reader: AsyncEngine
+) -> async_sessionmaker[AsyncSession]:
+    if writer is reader:
+        return async_sessionmaker(bind=writer, expire_on_commit=False)
+    return async_sessionmaker(
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        info={"writer": writer.sync_engine, "reader": reader.sync_engine},
+    )
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+
 def _create_db_directory(db_url: str) -> None:
     file_path = urlparse(db_url).path.lstrip("/")
     Path(file_path).parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,29 @@
+import csv
+import io
+from typing import Literal
+
+from employee.schemas import CsvPageDto, PageDto, TablePageDto
+
+ResponseFormat = Literal["json", "table", "csv"]
+
+
+def encode_page(
+    page: PageDto, response_format: ResponseFormat = "json"
+) -> PageDto | TablePageDto | CsvPageDto:
+    """Re-encode a page of flat items without repeating the keys per item.
+
+    "table" returns a header row and one value array per item, "csv" the
+    same as CSV text with empty cells for null values. "json" keeps the page.
+    """
+    if response_format == "json":
+        return page
+    columns = list(page.items[0]) if page.items else []
+    rows = [[item[column] for column in columns] for item in page.items]
+    if response_format == "table":
+        return TablePageDto(columns=columns, rows=rows, next_cursor=page.next_cursor)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return CsvPageDto(csv=buffer.getvalue(), next_cursor=page.next_cursor)
@@ -0,0 +1,120 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+NO_TOOL = "-"
+SAMPLE_SIZE = 1000
+PERCENTILES = (50, 95, 99)
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+current_tool: ContextVar[str] = ContextVar("current_tool", default=NO_TOOL)
+
+
+class QueryStats:
+    """Keep the latest statement durations per MCP tool."""
+
+    def __init__(self, sample_size: int = SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self.samples: dict[str, deque[float]] = {}
+        self.counts: dict[str, int] = {}
+
+    def record(self, tool: str, milliseconds: float) -> None:
+        self.samples.setdefault(tool, deque(maxlen=self.sample_size)).append(
+            milliseconds
+        )
+        self.counts[tool] = self.counts.get(tool, 0) + 1
+
+    def percentiles(self) -> dict[str, dict[str, float]]:
+        """Return statement count and p50/p95/p99 in milliseconds per tool."""
+        result = {}
+        for tool, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            result[tool] = {
+                "count": self.counts[tool],
+                **{
+                    f"p{p}": round(ordered[-(-len(ordered) * p // 100) - 1], 3)
+                    for p in PERCENTILES
+                },
+            }
+        return result
+
+    def reset(self) -> None:
+        self.samples.clear()
+        self.counts.clear()
+
+
+query_stats = QueryStats()
+
+
+def tagged(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Attribute all statements run by the decorated coroutine to a tool."""
+
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            token = current_tool.set(name)
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                current_tool.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument(
+    engine: AsyncEngine | Engine,
+    slow_query_ms: float,
+    stats: QueryStats = query_stats,
+) -> None:
+    """Time every statement of the engine and explain the slow ones."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def start_timer(conn: Connection, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def stop_timer(conn: Connection, cursor, statement, parameters, context, many):
+        started = conn.info["query_start"].pop()
+        if conn.info.get("explaining"):
+            return
+        milliseconds = (time.perf_counter() - started) * 1000
+        tool = current_tool.get()
+        stats.record(tool, milliseconds)
+        if milliseconds >= slow_query_ms:
+            plan = _explain(conn, statement, parameters) if not many else ""
+            logger.warning(
+                f"🐢 Slow query ({milliseconds:.1f} ms) in '{tool}': "
+                f"{' '.join(statement.split())}{plan}"
+            )
+
+
+def _explain(conn: Connection, statement: str, parameters: Any) -> str:
+    if not statement.lstrip().upper().startswith(EXPLAINABLE):
+        return ""
+    prefix = "EXPLAIN QUERY PLAN" if conn.dialect.name == "sqlite" else "EXPLAIN"
+    conn.info["explaining"] = True
+    try:
+        rows = conn.exec_driver_sql(f"{prefix} {statement}", parameters).all()
+    except Exception as e:
+        return f"\n  (no plan: {e})"
+    finally:
+        conn.info["explaining"] = False
+    return "".join(f"\n  {row[-1]}" for row in rows)
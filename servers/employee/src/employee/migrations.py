@@ -0,0 +1,32 @@
+import logging
+
+from sqlalchemy import Connection, inspect, text
+
+from employee.models.base import Base
+
+logger = logging.getLogger(__name__)
+
+OBSOLETE_INDEXES = ("idx_user_email_lastname",)
+
+
+def migrate(conn: Connection) -> list[str]:
+    """Bring the indexes of an existing database in line with the models.
+
+    Creates every model index that is missing and drops indexes that were
+    replaced. Tables are expected to exist already. Returns the changes.
+    """
+    inspector = inspect(conn)
+    changes: list[str] = []
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for name in OBSOLETE_INDEXES:
+            if name in existing:
+                conn.execute(text(f"DROP INDEX {name}"))
+                changes.append(f"dropped {name}")
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                changes.append(f"created {index.name}")
+    for change in changes:
+        logger.info(f"🛠️ Index {change}")
+    return changes
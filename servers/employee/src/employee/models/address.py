@@ -18,8 +18,9 @@ class Address(Base):
     street: Mapped[str] = mapped_column(String(255))
     city: Mapped[str] = mapped_column(String(100))
     postal_code: Mapped[str] = mapped_column(String(20))
-    country_code: Mapped[str] = mapped_column(String(2))  # ISO 3166-1 alpha-2
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    # ISO 3166-1 alpha-2
+    country_code: Mapped[str] = mapped_column(String(2), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
 
     user: Mapped[User] = relationship("User", back_populates="address")
 
@@ -27,6 +28,14 @@ class Address(Base):
 @event.listens_for(Address.country_code, "set")
 def validate_country_code(target, value, old_value, initiator):
     """Validate ISO 3166-1 alpha-2 country code."""
+    return normalize_country_code(value)
+
+
+def normalize_country_code(value: str | None) -> str | None:
+    """Validate an ISO 3166-1 alpha-2 country code and return it upper case.
+
+    Also used for UPDATE statements, which bypass the attribute event.
+    """
     if value and not pycountry.countries.get(alpha_2=value.upper()):
         raise ValueError(
             f"Invalid country code '{value}'. Must be ISO 3166-1 alpha-2 "
@@ -3,7 +3,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from employee.models.base import Base
-from sqlalchemy import Index, String, Enum as SQLEnum
+from sqlalchemy import String, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -22,7 +22,7 @@ class User(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     first_name: Mapped[str] = mapped_column(String(255))
-    last_name: Mapped[str] = mapped_column(String(255))
+    last_name: Mapped[str] = mapped_column(String(255), index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True)
     age: Mapped[int | None]
     gender: Mapped[Gender | None] = mapped_column(SQLEnum(Gender))
@@ -33,7 +33,3 @@ class User(Base):
     work_status: Mapped[WorkStatus | None] = relationship(
         "WorkStatus", back_populates="user", uselist=False
     )
-
-    __table_args__ = (
-        Index("idx_user_email_lastname", "email", "last_name"),  # Composite index
-    )
@@ -1,10 +1,13 @@
 from typing import Optional
-from employee.models.address import Address
+from employee.models.address import Address, normalize_country_code
 from employee.repositories.repository import Repository
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+ADDRESS_FILTER_FIELDS = ("city", "postal_code", "country_code")
+
+
 class AddressRepository(Repository):
     def __init__(self):
         super().__init__(Address)
@@ -12,7 +15,7 @@ class AddressRepository(Repository):
     @staticmethod
     async def get_by_user_id(session: AsyncSession, user_id: int) -> Address | None:
         result = await session.execute(
-            select(Address).where(Address.user_id == user_id)
+            select(Address).where(Address.user_id == user_id).limit(1)
         )
         return result.scalars().first()
 
@@ -43,21 +46,59 @@ class AddressRepository(Repository):
         postal_code: Optional[str] = None,
         country_code: Optional[str] = None,
     ) -> bool:
-        address = await self.get_by_id(session, address_id)
-        if not address:
-            return False
-
-        if street is not None:
-            address.street = street
-        if city is not None:
-            address.city = city
-        if postal_code is not None:
-            address.postal_code = postal_code
-        if country_code is not None:
-            address.country_code = country_code
-
-        await session.commit()
-        return True
+        values = _address_values(street, city, postal_code, country_code)
+        if not values:
+            return await self.get_by_id(session, address_id) is not None
+        return await self.update_one(session, [Address.id == address_id], values)
+
+    async def update_matching(
+        self,
+        session: AsyncSession,
+        where: dict[str, str],
+        street: Optional[str] = None,
+        city: Optional[str] = None,
+        postal_code: Optional[str] = None,
+        country_code: Optional[str] = None,
+    ) -> int:
+        """Update all addresses matching the filter in one UPDATE statement."""
+        values = _address_values(street, city, postal_code, country_code)
+        if not values:
+            return 0
+        return await self.update_where(session, _address_criteria(where), values)
+
+    async def delete_matching(
+        self, session: AsyncSession, where: dict[str, str]
+    ) -> int:
+        """Delete all addresses matching the filter in one DELETE statement."""
+        return await self.delete_where(session, _address_criteria(where))
+
+
+def _address_values(
+    street: Optional[str],
+    city: Optional[str],
+    postal_code: Optional[str],
+    country_code: Optional[str],
+) -> dict[str, str]:
+    """Collect the new column values; None and "" both leave a column unchanged."""
+    values = {"street": street, "city": city, "postal_code": postal_code}
+    if country_code:
+        values["country_code"] = normalize_country_code(country_code)
+    return {key: value for key, value in values.items() if value}
+
+
+def _address_criteria(where: dict[str, str]) -> list:
+    """Build equality criteria from a filter on city, postal code and country."""
+    unknown = [key for key in where if key not in ADDRESS_FILTER_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown filter fields {', '.join(unknown)}. "
+            f"Valid fields: {', '.join(ADDRESS_FILTER_FIELDS)}"
+        )
+    if not where:
+        raise ValueError("At least one filter field is required")
+    if "country_code" in where:
+        where = {**where, "country_code": normalize_country_code(where["country_code"])}
+    return [getattr(Address, key) == value for key, value in where.items()]
 
 
 address_repository = AddressRepository()
@@ -1,9 +1,15 @@
-from typing import TypeVar, Type, Optional
-from sqlalchemy import delete, select
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, TypeVar, Type, Optional
+from pydantic_core import to_jsonable_python
+from sqlalchemy import ColumnElement, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 T = TypeVar("T")
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_CHUNK_SIZE = 1000
+
 
 class Repository:
     def __init__(self, model: Type[T]):
@@ -13,6 +19,59 @@ class Repository:
         result = await session.execute(select(self.model))
         return list(result.scalars().all())
 
+    async def get_page(
+        self, session: AsyncSession, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[T]:
+        result = await session.execute(
+            select(self.model)
+            .where(self.model.id > after_id)  # type: ignore
+            .order_by(self.model.id)  # type: ignore
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_page_columns(
+        self,
+        session: AsyncSession,
+        fields: list[str],
+        after_id: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[dict[str, Any]]:
+        """Load a page of the given columns as JSON-compatible dicts.
+
+        Values are converted like a DTO dumped in JSON mode, so enums come
+        back as their values.
+        """
+        columns = self.model.__table__.columns  # type: ignore
+        unknown = [field for field in fields if field not in columns]
+        if unknown:
+            raise ValueError(
+                f"Unknown fields {', '.join(unknown)}. "
+                f"Valid fields: {', '.join(columns.keys())}"
+            )
+        result = await session.execute(
+            select(*(columns[field] for field in dict.fromkeys(["id", *fields])))
+            .where(columns["id"] > after_id)
+            .order_by(columns["id"])
+            .limit(limit)
+        )
+        return [to_jsonable_python(dict(row)) for row in result.mappings()]
+
+    async def stream(
+        self, session: AsyncSession, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[Sequence[T]]:
+        result = await session.stream(
+            select(self.model)
+            .order_by(self.model.id)  # type: ignore
+            .execution_options(yield_per=chunk_size)
+        )
+        async for chunk in result.scalars().partitions():
+            yield chunk
+
+    async def count(self, session: AsyncSession) -> int:
+        result = await session.execute(select(func.count()).select_from(self.model))
+        return result.scalar_one()
+
     async def get_by_id(self, session: AsyncSession, id_: int) -> Optional[T]:
         result = await session.execute(select(self.model).where(self.model.id == id_))  # type: ignore
         return result.scalars().first()
@@ -31,6 +90,47 @@ class Repository:
         await session.refresh(entity)
         return entity
 
+    async def update_where(
+        self,
+        session: AsyncSession,
+        criteria: Sequence[ColumnElement[bool]],
+        values: dict[str, Any],
+    ) -> int:
+        """Update all matching rows in one UPDATE statement and commit."""
+        result = await session.execute(
+            update(self.model).where(*criteria).values(**values)
+        )
+        await session.commit()
+        return result.rowcount  # type: ignore
+
+    async def update_one(
+        self,
+        session: AsyncSession,
+        criteria: Sequence[ColumnElement[bool]],
+        values: dict[str, Any],
+    ) -> bool:
+        """Update a single row in one statement and commit.
+
+        Uses UPDATE ... RETURNING where the backend supports it and the row
+        count otherwise. Returns whether a row matched.
+        """
+        statement = update(self.model).where(*criteria).values(**values)
+        if session.get_bind(clause=statement).dialect.update_returning:
+            result = await session.execute(statement.returning(self.model.id))  # type: ignore
+            updated = result.scalar_one_or_none() is not None
+        else:
+            result = await session.execute(statement)
+            updated = result.rowcount > 0  # type: ignore
+        await session.commit()
+        return updated
+
+    async def delete_where(
+        self, session: AsyncSession, criteria: Sequence[ColumnElement[bool]]
+    ) -> int:
+        result = await session.execute(delete(self.model).where(*criteria))
+        await session.commit()
+        return result.rowcount  # type: ignore
+
     async def delete_by_id(self, session: AsyncSession, id_: int) -> bool:
         result = await session.execute(delete(self.model).where(self.model.id == id_))  # type: ignore
         await session.commit()
@@ -0,0 +1,53 @@
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from employee.models.user import User
+from employee.repositories.repository import DEFAULT_PAGE_SIZE
+from employee.search import fts5_query, search_table, search_terms, tsquery
+
+
+class SearchRepository:
+    @staticmethod
+    async def search_users(
+        session: AsyncSession,
+        query: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[tuple[User, float]]:
+        """Find users by full-text search, best match first, in one query.
+
+        Every term of the query must prefix-match one of first name, last
+        name, email, street or city. Returns (user, score) pairs with address
+        and work status loaded; a higher score is a better match.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+
+        if session.get_bind().dialect.name == "postgresql":
+            text_query = func.to_tsquery("simple", tsquery(terms))
+            document = search_table.c.document
+            score = func.ts_rank(document, text_query) + func.similarity(
+                search_table.c.content, " ".join(terms)
+            )
+            match = document.op("@@")(text_query)
+            user_id = search_table.c.user_id
+        else:
+            score = -search_table.c.rank
+            match = literal_column(search_table.name).op("MATCH")(fts5_query(terms))
+            user_id = search_table.c.rowid
+
+        result = await session.execute(
+            select(User, score.label("score"))
+            .join(search_table, user_id == User.id)
+            .options(joinedload(User.address), joinedload(User.work_status))
+            .where(match)
+            .order_by(score.desc(), User.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [(user, score) for user, score in result.all()]
+
+
+search_repository = SearchRepository()
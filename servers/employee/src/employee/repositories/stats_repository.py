@@ -0,0 +1,50 @@
+from sqlalchemy import String, case, cast, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from employee.models.address import Address
+from employee.models.user import User
+from employee.models.work_status import WorkStatus
+
+AGE_BANDS = ((18, "0-17"), (30, "18-29"), (40, "30-39"), (50, "40-49"), (60, "50-59"))
+OLDEST_AGE_BAND = "60+"
+
+
+class StatsRepository:
+    @staticmethod
+    async def get_grouped_counts(
+        session: AsyncSession,
+    ) -> list[tuple[str, str | None, int]]:
+        """Count users and addresses per group in a single UNION ALL query.
+
+        Returns (group, value, count) rows for the groups "users",
+        "addresses", "country", "gender", "age_band" and "home_office".
+        """
+        age_band = case(
+            *((User.age < limit, band) for limit, band in AGE_BANDS),
+            (User.age.is_not(None), OLDEST_AGE_BAND),
+        )
+        query = union_all(
+            select(literal("users"), literal(None, String), func.count()).select_from(
+                User
+            ),
+            select(
+                literal("addresses"), literal(None, String), func.count()
+            ).select_from(Address),
+            select(literal("country"), Address.country_code, func.count()).group_by(
+                Address.country_code
+            ),
+            select(literal("gender"), cast(User.gender, String), func.count()).group_by(
+                User.gender
+            ),
+            select(literal("age_band"), age_band, func.count()).group_by(age_band),
+            select(
+                literal("home_office"),
+                cast(WorkStatus.is_home_office, String),
+                func.count(),
+            ).group_by(WorkStatus.is_home_office),
+        )
+        result = await session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+
+stats_repository = StatsRepository()
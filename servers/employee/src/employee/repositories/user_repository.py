@@ -1,12 +1,27 @@
 from typing import Optional
-from employee.models.user import User
-from employee.repositories.repository import Repository
-from sqlalchemy import delete, select
+from employee.models.address import Address, normalize_country_code
+from employee.models.user import Gender as UserGender, User
+from employee.models.work_status import WorkStatus
+from employee.repositories.repository import DEFAULT_PAGE_SIZE, Repository
+from employee.validation import ImportUserRequest, QueryUsersRequest
+from sqlalchemy import delete, exists, insert, literal, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from employee.schemas import Gender
 
+IMPORT_BATCH_SIZE = 500
+QUERY_SORT_COLUMNS = {
+    "id": User.id,
+    "first_name": User.first_name,
+    "last_name": User.last_name,
+    "email": User.email,
+    "age": User.age,
+    "city": Address.city,
+    "country_code": Address.country_code,
+}
+
 
 class UserRepository(Repository):
     def __init__(self):
@@ -14,9 +29,70 @@ class UserRepository(Repository):
 
     @staticmethod
     async def get_by_last_name(session: AsyncSession, last_name: str) -> User | None:
-        result = await session.execute(select(User).where(User.last_name == last_name))
+        result = await session.execute(
+            select(User).where(User.last_name == last_name).limit(1)
+        )
         return result.scalars().first()
 
+    @staticmethod
+    async def get_page_with_details(
+        session: AsyncSession, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[User]:
+        """Load a page of users with address and work status in one query."""
+        result = await session.execute(
+            select(User)
+            .options(joinedload(User.address), joinedload(User.work_status))
+            .where(User.id > after_id)
+            .order_by(User.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def query(
+        session: AsyncSession, request: QueryUsersRequest, limit: int
+    ) -> list[User]:
+        """Load the users matching a filter spec in one SELECT.
+
+        Address and work status are outer joined, so they can be filtered and
+        sorted on, and are loaded with the users.
+        """
+        genders = request.gender and [UserGender[g.name] for g in request.gender]
+        conditions = [
+            column.in_(values)
+            for column, values in (
+                (User.last_name, request.last_name),
+                (User.gender, genders),
+                (Address.country_code, request.country_code),
+                (Address.city, request.city),
+            )
+            if values is not None
+        ]
+        if request.first_name is not None:
+            conditions.append(User.first_name == request.first_name)
+        if request.email is not None:
+            conditions.append(User.email == request.email)
+        if request.min_age is not None:
+            conditions.append(User.age >= request.min_age)
+        if request.max_age is not None:
+            conditions.append(User.age <= request.max_age)
+        if request.is_home_office is not None:
+            conditions.append(WorkStatus.is_home_office == request.is_home_office)
+
+        sort_column = QUERY_SORT_COLUMNS[request.sort_by]
+        result = await session.execute(
+            select(User)
+            .outerjoin(User.address)
+            .outerjoin(User.work_status)
+            .options(contains_eager(User.address), contains_eager(User.work_status))
+            .where(*conditions)
+            .order_by(
+                sort_column.desc() if request.descending else sort_column, User.id
+            )
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def create(
         self,
         session: AsyncSession,
@@ -48,31 +124,103 @@ class UserRepository(Repository):
         age: Optional[int] = None,
         gender: Optional[Gender] = None,
     ) -> bool:
-        user = await self.get_by_last_name(session, last_name)
-        if not user:
-            return False
-
-        if first_name is not None:
-            user.first_name = first_name
-        if email is not None:
-            user.email = email
-        if age is not None:
-            user.age = age
+        values = {"first_name": first_name, "email": email, "age": age}
         if gender is not None:
-            user.gender = gender
+            values["gender"] = UserGender[gender.name]
+        values = {key: value for key, value in values.items() if value is not None}
+        if not values:
+            return await self.get_by_last_name(session, last_name) is not None
 
+        first_match = (
+            select(User.id).where(User.last_name == last_name).limit(1)
+        ).scalar_subquery()
         try:
-            await session.commit()
-            return True
+            return await self.update_one(session, [User.id == first_match], values)
         except IntegrityError as err:
             await session.rollback()
             raise ValueError("Email already exists") from err
 
+    @staticmethod
+    async def set_home_office_by_country(
+        session: AsyncSession, country_code: str, is_home_office: bool
+    ) -> tuple[int, int]:
+        """Set the home office flag of all users living in a country.
+
+        One INSERT ... SELECT creates the missing work status rows with the
+        flag, then one UPDATE changes the rows that held the other value.
+        Returns the number of created and of updated rows.
+        """
+        residents = select(Address.user_id).where(
+            Address.country_code == normalize_country_code(country_code)
+        )
+        created = await session.execute(
+            insert(WorkStatus).from_select(
+                ["user_id", "is_home_office"],
+                residents.add_columns(literal(is_home_office))
+                .where(~exists().where(WorkStatus.user_id == Address.user_id))
+                .distinct(),
+            )
+        )
+        updated = await session.execute(
+            update(WorkStatus)
+            .where(
+                WorkStatus.user_id.in_(residents),
+                WorkStatus.is_home_office != is_home_office,
+            )
+            .values(is_home_office=is_home_office)
+        )
+        await session.commit()
+        return created.rowcount, updated.rowcount  # type: ignore
+
     @staticmethod
     async def delete_by_last_name(session: AsyncSession, last_name: str) -> bool:
         result = await session.execute(delete(User).where(User.last_name == last_name))
         await session.commit()
         return result.rowcount > 0
 
+    @staticmethod
+    async def get_existing_emails(session: AsyncSession, emails: list[str]) -> set[str]:
+        result = await session.execute(select(User.email).where(User.email.in_(emails)))
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def bulk_insert(
+        session: AsyncSession, users: list[ImportUserRequest]
+    ) -> None:
+        """Insert users with address and work status as executemany batches.
+
+        The caller owns the transaction; nothing is committed here.
+        """
+        result = await session.execute(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [
+                {
+                    "first_name": user.first_name,
+                    "last_name": user.last_name,
+                    "email": user.email,
+                    "age": user.age,
+                    "gender": UserGender[user.gender.name] if user.gender else None,
+                }
+                for user in users
+            ],
+        )
+        user_ids = result.scalars().all()
+
+        addresses = [
+            {**user.address.model_dump(), "user_id": user_id}
+            for user, user_id in zip(users, user_ids, strict=True)
+            if user.address
+        ]
+        if addresses:
+            await session.execute(insert(Address), addresses)
+
+        work_statuses = [
+            {"is_home_office": user.is_home_office, "user_id": user_id}
+            for user, user_id in zip(users, user_ids, strict=True)
+            if user.is_home_office is not None
+        ]
+        if work_statuses:
+            await session.execute(insert(WorkStatus), work_statuses)
+
 
 user_repository = UserRepository()
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
@@ -33,3 +33,58 @@ class AddressBase(BaseModel):
 class AddressDto(AddressBase):
     id: int
     model_config = ConfigDict(from_attributes=True)
+
+
+class WorkStatusDto(BaseModel):
+    is_home_office: bool
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserWithDetailsDto(UserDto):
+    address: AddressDto | None = None
+    work_status: WorkStatusDto | None = None
+
+
+class QueryResultDto(BaseModel):
+    items: list[UserWithDetailsDto]
+    truncated: bool
+
+
+class PageDto(BaseModel):
+    items: list[dict[str, Any]]
+    next_cursor: int | None = None
+
+    @classmethod
+    def from_items(cls, items: list[dict[str, Any]], limit: int) -> "PageDto":
+        next_cursor = items[-1]["id"] if items and len(items) == limit else None
+        return cls(items=items, next_cursor=next_cursor)
+
+
+class TablePageDto(BaseModel):
+    columns: list[str]
+    rows: list[list[Any]]
+    next_cursor: int | None = None
+
+
+class CsvPageDto(BaseModel):
+    csv: str
+    next_cursor: int | None = None
+
+
+class ImportErrorDto(BaseModel):
+    row: int
+    error: str
+
+
+class ImportResultDto(BaseModel):
+    imported: int
+    errors: list[ImportErrorDto]
+
+
+class StatsDto(BaseModel):
+    total_users: int
+    total_addresses: int
+    by_country: dict[str, int]
+    by_gender: dict[str, int]
+    by_age_band: dict[str, int]
+    by_home_office: dict[str, int]
@@ -0,0 +1,159 @@
+import logging
+import re
+
+from sqlalchemy import Column, Connection, Float, Integer, MetaData, Table, inspect
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = "user_search"
+SEARCH_COLUMNS = ("first_name", "last_name", "email", "street", "city")
+
+# Kept out of Base.metadata, create_search_index creates the table. rowid and
+# rank are the FTS5 columns, user_id, document and content the Postgres ones.
+search_table = Table(
+    SEARCH_TABLE,
+    MetaData(),
+    Column("rowid", Integer),
+    Column("rank", Float),
+    Column("user_id", Integer),
+    Column("document"),
+    Column("content"),
+)
+
+_SEARCH_ROW = """
+    SELECT u.id, u.first_name, u.last_name, u.email, a.street, a.city
+    FROM users u
+    LEFT JOIN addresses a
+        ON a.id = (SELECT min(id) FROM addresses WHERE user_id = u.id)
+    WHERE {where}
+"""
+
+
+def _sqlite_refresh(user_id: str) -> str:
+    return (
+        f"DELETE FROM {SEARCH_TABLE} WHERE rowid = {user_id}; "
+        f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMNS)}) "
+        f"{_SEARCH_ROW.format(where=f'u.id = {user_id}')};"
+    )
+
+
+SQLITE_DDL = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    f"{', '.join(SEARCH_COLUMNS)}, tokenize = 'unicode61 remove_diacritics 2')",
+    f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMNS)}) "
+    f"{_SEARCH_ROW.format(where='1 = 1')}",
+    f"""CREATE TRIGGER IF NOT EXISTS users_search_insert AFTER INSERT ON users
+    BEGIN {_sqlite_refresh("new.id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS users_search_update AFTER UPDATE ON users
+    BEGIN DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    {_sqlite_refresh("new.id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS users_search_delete AFTER DELETE ON users
+    BEGIN DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id; END""",
+    f"""CREATE TRIGGER IF NOT EXISTS addresses_search_insert
+    AFTER INSERT ON addresses BEGIN {_sqlite_refresh("new.user_id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS addresses_search_update
+    AFTER UPDATE ON addresses BEGIN {_sqlite_refresh("old.user_id")}
+    {_sqlite_refresh("new.user_id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS addresses_search_delete
+    AFTER DELETE ON addresses BEGIN {_sqlite_refresh("old.user_id")} END""",
+)
+
+POSTGRES_DOCUMENT = (
+    "to_tsvector('simple', concat_ws(' ', u.first_name, u.last_name, u.email, "
+    "a.street, a.city))"
+)
+POSTGRES_CONTENT = (
+    "lower(concat_ws(' ', u.first_name, u.last_name, u.email, a.street, a.city))"
+)
+POSTGRES_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""CREATE TABLE {SEARCH_TABLE} (
+        user_id integer PRIMARY KEY,
+        document tsvector NOT NULL,
+        content text NOT NULL
+    )""",
+    f"CREATE INDEX ix_{SEARCH_TABLE}_document ON {SEARCH_TABLE} USING gin (document)",
+    f"CREATE INDEX ix_{SEARCH_TABLE}_content ON {SEARCH_TABLE} "
+    "USING gin (content gin_trgm_ops)",
+    f"""CREATE OR REPLACE FUNCTION refresh_{SEARCH_TABLE}(target integer)
+    RETURNS void LANGUAGE sql AS $$
+        DELETE FROM {SEARCH_TABLE} WHERE user_id = target;
+        INSERT INTO {SEARCH_TABLE} (user_id, document, content)
+        SELECT u.id, {POSTGRES_DOCUMENT}, {POSTGRES_CONTENT}
+        FROM users u
+        LEFT JOIN addresses a
+            ON a.id = (SELECT min(id) FROM addresses WHERE user_id = u.id)
+        WHERE u.id = target;
+    $$""",
+    f"""INSERT INTO {SEARCH_TABLE} (user_id, document, content)
+    SELECT u.id, {POSTGRES_DOCUMENT}, {POSTGRES_CONTENT}
+    FROM users u
+    LEFT JOIN addresses a
+        ON a.id = (SELECT min(id) FROM addresses WHERE user_id = u.id)""",
+    f"""CREATE OR REPLACE FUNCTION {SEARCH_TABLE}_users() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM refresh_{SEARCH_TABLE}(OLD.id);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM refresh_{SEARCH_TABLE}(NEW.id);
+        END IF;
+        RETURN NULL;
+    END $$""",
+    f"""CREATE OR REPLACE FUNCTION {SEARCH_TABLE}_addresses() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM refresh_{SEARCH_TABLE}(OLD.user_id);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM refresh_{SEARCH_TABLE}(NEW.user_id);
+        END IF;
+        RETURN NULL;
+    END $$""",
+    f"""CREATE OR REPLACE TRIGGER users_search
+    AFTER INSERT OR UPDATE OR DELETE ON users
+    FOR EACH ROW EXECUTE FUNCTION {SEARCH_TABLE}_users()""",
+    f"""CREATE OR REPLACE TRIGGER addresses_search
+    AFTER INSERT OR UPDATE OR DELETE ON addresses
+    FOR EACH ROW EXECUTE FUNCTION {SEARCH_TABLE}_addresses()""",
+)
+
+
+def create_search_index(conn: Connection) -> list[str]:
+    """Create the full-text search table and its triggers if missing.
+
+    SQLite gets an FTS5 table, Postgres a tsvector table with a trigram
+    index. Triggers on users and addresses keep one search row per user in
+    sync; existing users are indexed on creation. Returns the changes.
+    """
+    if inspect(conn).has_table(SEARCH_TABLE):
+        return []
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_DDL
+    elif dialect == "postgresql":
+        statements = POSTGRES_DDL
+    else:
+        logger.warning(f"⚠️ No full-text search for {dialect}")
+        return []
+    for statement in statements:
+        conn.exec_driver_sql(statement)
+    logger.info(f"🛠️ Search index {SEARCH_TABLE} created")
+    return [f"created {SEARCH_TABLE}"]
+
+
+def search_terms(query: str) -> list[str]:
+    """Split a search query into lower-case word tokens."""
+    return re.findall(r"\w+", query.casefold())
+
+
+def fts5_query(terms: list[str]) -> str:
+    """Build an FTS5 query matching rows that contain all term prefixes."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def tsquery(terms: list[str]) -> str:
+    """Build a Postgres tsquery matching documents with all term prefixes."""
+    return " & ".join(f"{term}:*" for term in terms)
@@ -0,0 +1,182 @@
+import argparse
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import pycountry
+from faker import Faker
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from employee.config import settings
+from employee.models.address import Address
+from employee.models.base import Base
+from employee.models.user import Gender, User
+from employee.models.work_status import WorkStatus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEED = 42
+SEED_BATCH_SIZE = 10_000
+POOL_SIZE = 1_000
+GENDERS = [Gender.MALE, Gender.FEMALE, Gender.OTHER, None]
+COUNTRY_CODES = [country.alpha_2 for country in pycountry.countries]
+
+Row = dict[str, Any]
+
+
+@dataclass
+class ValuePools:
+    first_names: list[str]
+    last_names: list[str]
+    streets: list[str]
+    cities: list[str]
+    postal_codes: list[str]
+
+    @classmethod
+    def generate(cls, seed: int, size: int = POOL_SIZE) -> "ValuePools":
+        fake = Faker()
+        fake.seed_instance(seed)
+        return cls(
+            first_names=[fake.first_name() for _ in range(size)],
+            last_names=[fake.last_name() for _ in range(size)],
+            streets=[fake.street_address() for _ in range(size)],
+            cities=[fake.city() for _ in range(size)],
+            postal_codes=[fake.postcode() for _ in range(size)],
+        )
+
+
+@dataclass
+class SeedReport:
+    users: int
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def generate_batches(
+    pools: ValuePools, count: int, first_id: int, seed: int, batch_size: int
+) -> Iterator[tuple[list[Row], list[Row], list[Row]]]:
+    """Yield user, address and work status rows in batches.
+
+    Values are drawn from pre-generated pools with one `choices` call per
+    column and batch; equal seeds yield equal data.
+    """
+    rng = random.Random(seed)
+    for start in range(first_id, first_id + count, batch_size):
+        size = min(batch_size, first_id + count - start)
+        ids = range(start, start + size)
+        first_names = rng.choices(pools.first_names, k=size)
+        last_names = rng.choices(pools.last_names, k=size)
+        users = [
+            {
+                "id": id_,
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": f"{first_name}.{last_name}.{id_}@example.com".lower(),
+                "age": age,
+                "gender": gender,
+            }
+            for id_, first_name, last_name, age, gender in zip(
+                ids,
+                first_names,
+                last_names,
+                rng.choices(range(18, 81), k=size),
+                rng.choices(GENDERS, k=size),
+                strict=True,
+            )
+        ]
+        addresses = [
+            {
+                "id": id_,
+                "street": street,
+                "city": city,
+                "postal_code": postal_code,
+                "country_code": country_code,
+                "user_id": id_,
+            }
+            for id_, street, city, postal_code, country_code in zip(
+                ids,
+                rng.choices(pools.streets, k=size),
+                rng.choices(pools.cities, k=size),
+                rng.choices(pools.postal_codes, k=size),
+                rng.choices(COUNTRY_CODES, k=size),
+                strict=True,
+            )
+        ]
+        work_statuses = [
+            {"id": id_, "is_home_office": is_home_office, "user_id": id_}
+            for id_, is_home_office in zip(
+                ids, rng.choices((True, False), k=size), strict=True
+            )
+        ]
+        yield users, addresses, work_statuses
+
+
+async def seed(
+    engine: AsyncEngine,
+    users: int,
+    seed_value: int = DEFAULT_SEED,
+    batch_size: int = SEED_BATCH_SIZE,
+) -> SeedReport:
+    """Insert synthetic users with address and work status via Core inserts.
+
+    IDs continue after the highest existing user, address and work status ID,
+    and every batch is committed on its own.
+    """
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        first_id = 1 + max(
+            [
+                (await conn.execute(select(func.max(model.id)))).scalar() or 0
+                for model in (User, Address, WorkStatus)
+            ]
+        )
+
+    pools = ValuePools.generate(seed_value)
+    rows = 0
+    for batch in generate_batches(pools, users, first_id, seed_value, batch_size):
+        async with engine.begin() as conn:
+            for model, values in zip((User, Address, WorkStatus), batch, strict=True):
+                await conn.execute(insert(model.__table__), values)
+        rows += sum(len(values) for values in batch)
+        elapsed = time.perf_counter() - started
+        logger.info(f"🌱 {rows} rows inserted ({rows / elapsed:,.0f} rows/s)")
+
+    return SeedReport(users=users, rows=rows, seconds=time.perf_counter() - started)
+
+
+async def _run(args: argparse.Namespace) -> SeedReport:
+    engine = create_async_engine(args.database_url)
+    try:
+        return await seed(engine, args.users, args.seed, args.batch_size)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the employee database.")
+    parser.add_argument("users", type=int, help="number of users to generate")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--batch-size", type=int, default=SEED_BATCH_SIZE)
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    report = asyncio.run(_run(args))
+    logger.info(
+        f"✅ {report.users} users seeded: {report.rows} rows in "
+        f"{report.seconds:.1f} s ({report.rows_per_second:,.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
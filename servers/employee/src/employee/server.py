@@ -1,8 +1,10 @@
 import logging
 from asyncio import CancelledError
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
 from faker import Faker
 
@@ -10,19 +12,47 @@ from employee.connect import Database
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.session import ServerSession
 
+from employee.cache import address_cache, user_cache
 from employee.config import settings
+from employee.instrumentation import query_stats, tagged
+from employee.migrations import migrate
 from employee.models.address import Address
 from employee.models.base import Base
 from employee.models.user import User, Gender
 from employee.models.work_status import WorkStatus
-from employee.schemas import UserDto, AddressDto
-from employee.validation import CreateUserRequest, UpdateUserRequest
-from employee.services.user_service import user_service
+from employee.encoding import ResponseFormat, encode_page
+from employee.search import create_search_index
+from employee.repositories.address_repository import ADDRESS_FILTER_FIELDS
+from employee.repositories.repository import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from employee.repositories.user_repository import IMPORT_BATCH_SIZE
+from employee.schemas import (
+    UserDto,
+    AddressDto,
+    ImportResultDto,
+    CsvPageDto,
+    PageDto,
+    QueryResultDto,
+    StatsDto,
+    TablePageDto,
+)
+from employee.validation import (
+    CreateUserRequest,
+    QueryUsersRequest,
+    UpdateUserRequest,
+)
+from employee.services.user_service import parse_import_payload, user_service
 from employee.services.address_service import address_service
+from employee.services.stats_service import stats_service
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
+ToolFunction = Callable[..., Awaitable[Any]]
+RESPONSE_FORMAT_DESCRIPTION = (
+    "'response_format' 'table' returns 'columns' and one value array per row, "
+    "'csv' the rows as CSV text; both are smaller than the default 'json'."
+)
+
 
 @dataclass
 class AppContext:
@@ -36,6 +66,8 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
 
     async with db.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(migrate)
+        await conn.run_sync(create_search_index)
     logger.info("✅ Tables created")
 
     # await _setup(db)
@@ -88,25 +120,141 @@ async def _cleanup(db: "Database"):
 mcp = FastMCP("Employee Database Demo", lifespan=server_lifespan)
 
 
-def _get_db(ctx: Context[ServerSession, AppContext]) -> Database:
-    return ctx.request_context.lifespan_context.db
+def tool(name: str, description: str) -> Callable[[ToolFunction], ToolFunction]:
+    def decorator(fn: ToolFunction) -> ToolFunction:
+        return mcp.tool(name=name, description=description)(tagged(name)(fn))
 
+    return decorator
 
-@mcp.tool(name="Find all users", description="Get all users from database.")
-async def find_all_users(ctx: Context[ServerSession, AppContext]) -> list[UserDto]:
-    async with _get_db(ctx).get_async_session() as session:
-        return await user_service.get_all_users(session)
 
+def _get_db(ctx: Context[ServerSession, AppContext]) -> Database:
+    return ctx.request_context.lifespan_context.db
 
-@mcp.tool(name="Find user by last name", description="Get an user by name.")
+
+@tool(
+    name="Find all users",
+    description="Get one page of users ordered by ID, starting after the user ID "
+    "'after_id'. Pass the 'next_cursor' of a page as 'after_id' to get the next "
+    "page; it is null on the last page. 'limit' is the page size (max "
+    f"{MAX_PAGE_SIZE}). Optional 'fields' restricts the returned columns, "
+    f"e.g. ['last_name', 'email']. {RESPONSE_FORMAT_DESCRIPTION}",
+)
+async def find_all_users(
+    ctx: Context[ServerSession, AppContext],
+    after_id: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+    fields: list[str] | None = None,
+    response_format: ResponseFormat = "json",
+) -> PageDto | TablePageDto | CsvPageDto:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        page = await user_service.get_users_page(session, after_id, limit, fields)
+    return encode_page(page, response_format)
+
+
+@tool(
+    name="Find all users with details",
+    description="Get one page of users ordered by ID together with their "
+    "address and work status, starting after the user ID 'after_id'. Pass the "
+    "'next_cursor' of a page as 'after_id' to get the next page; it is null on "
+    f"the last page. 'limit' is the page size (max {MAX_PAGE_SIZE}).",
+)
+async def find_all_users_with_details(
+    ctx: Context[ServerSession, AppContext],
+    after_id: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> PageDto:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        return await user_service.get_users_with_details_page(session, after_id, limit)
+
+
+@tool(
+    name="Query users",
+    description="Find users with address and work status matching a filter in "
+    "one query instead of loading all users and addresses. All given conditions "
+    "must hold: first_name and email match exactly; last_name, gender, "
+    "country_code and city match any of the listed values; min_age and max_age "
+    "are inclusive. Sort by id, first_name, last_name, email, age, city or "
+    f"country_code. At most {MAX_PAGE_SIZE} users are returned; 'truncated' is "
+    "true if more users match.",
+)
+async def query_users(
+    ctx: Context[ServerSession, AppContext], spec: QueryUsersRequest
+) -> QueryResultDto:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        return await user_service.query_users(session, spec)
+
+
+@tool(
+    name="Search users",
+    description="Full-text search over first name, last name, email, street "
+    "and city, best match first. Every word of 'query' must match the start of "
+    "a word, e.g. 'Müller Hamburg' finds the Müllers living in Hamburg. Pass the "
+    "'next_cursor' of a page as 'offset' to get the next page; it is null on "
+    f"the last page. 'limit' is the page size (max {MAX_PAGE_SIZE}).",
+)
+async def search_users(
+    ctx: Context[ServerSession, AppContext],
+    query: str,
+    offset: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> PageDto:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        return await user_service.search_users(session, query, offset, limit)
+
+
+@tool(
+    name="Export users",
+    description="Export all users as JSON lines into a file in the export "
+    "directory. Rows are streamed from the database in chunks and progress is "
+    "reported per chunk, so even very large tables are exported in constant "
+    "memory. Returns the number of exported users and the file path.",
+)
+async def export_users(
+    ctx: Context[ServerSession, AppContext], file_name: str = "users.jsonl"
+) -> str:
+    try:
+        target = _export_path(file_name)
+    except ValueError as e:
+        logger.error(str(e))
+        return str(e)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    exported = 0
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        total = await user_service.count_users(session)
+        with open(target, "w", encoding="utf-8") as file:
+            async for users in user_service.stream_users(session):
+                file.writelines(f"{user.model_dump_json()}\n" for user in users)
+                exported += len(users)
+                await ctx.report_progress(exported, total)
+    logger.info(f"✅ {exported} users exported to {target}")
+    return f"{exported} users exported to {target}"
+
+
+def _export_path(file_name: str) -> Path:
+    """Return the export file path, keeping only the last part of file_name."""
+    name = Path(file_name).name
+    if name in ("", ".", ".."):
+        raise ValueError(f"Invalid export file name '{file_name}'")
+    return settings.export_dir / name
+
+
+@tool(name="Count users", description="Get the total number of users.")
+async def count_users(ctx: Context[ServerSession, AppContext]) -> int:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        return await user_service.count_users(session)
+
+
+@tool(name="Find user by last name", description="Get an user by name.")
 async def find_user_by_last_name(
     ctx: Context[ServerSession, AppContext], name: str
 ) -> UserDto | None:
+    # Cached lookups load from the primary: a lagging replica could put a row
+    # back into the cache right after a write invalidated it.
     async with _get_db(ctx).get_async_session() as session:
         return await user_service.get_user_by_last_name(session, name)
 
 
-@mcp.tool(
+@tool(
     name="Add a user",
     description="Add a user with name, email, age and gender "
     "(male/female/other) to the database.",
@@ -143,7 +291,34 @@ async def add_user(
         return str(e)
 
 
-@mcp.tool(
+@tool(
+    name="Import users",
+    description="Add many users in one call, optionally with address (street, "
+    "city, postal_code, ISO 3166-1 alpha-2 country_code) and is_home_office. "
+    "Pass them either as 'users' (list of objects) or as 'payload' in the "
+    "format 'json', 'jsonl' or 'csv' (header row with the field names). Rows "
+    "are inserted in batches of 'batch_size' in one transaction; invalid rows "
+    "are skipped and reported with their row number.",
+)
+async def import_users(
+    ctx: Context[ServerSession, AppContext],
+    users: list[dict[str, Any]] | None = None,
+    payload: str = "",
+    payload_format: str = "json",
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ImportResultDto | str:
+    try:
+        rows = [*(users or []), *parse_import_payload(payload, payload_format)]
+    except ValueError as e:
+        logger.error(str(e))
+        return str(e)
+    async with _get_db(ctx).get_async_session() as session:
+        result = await user_service.import_users(session, rows, batch_size)
+    logger.info(f"✅ {result.imported} users imported, {len(result.errors)} errors")
+    return result
+
+
+@tool(
     name="Update user",
     description="Update a user by last name with optional new values. "
     "Gender options: male/female/other.",
@@ -183,7 +358,28 @@ async def update_user(
         return str(e)
 
 
-@mcp.tool(
+@tool(
+    name="Set home office by country",
+    description="Set the home office flag of all users whose address is in a "
+    "country (ISO 3166-1 alpha-2 code, e.g. 'DE'), creating missing work "
+    "statuses, in two set-based statements.",
+)
+async def set_home_office_by_country(
+    ctx: Context[ServerSession, AppContext], country_code: str, is_home_office: bool
+) -> str:
+    try:
+        async with _get_db(ctx).get_async_session() as session:
+            result = await user_service.set_home_office_by_country(
+                session, country_code, is_home_office
+            )
+            logger.info(f"✅ {result}")
+            return result
+    except ValueError as e:
+        logger.error(str(e))
+        return str(e)
+
+
+@tool(
     name="Delete user by last name",
     description="Delete a user by last name from the database.",
 )
@@ -199,7 +395,7 @@ async def delete_user_by_last_name(
         return result
 
 
-@mcp.tool(name="Delete all users", description="Deletes all users from the database.")
+@tool(name="Delete all users", description="Deletes all users from the database.")
 async def delete_all_users(ctx: Context[ServerSession, AppContext]) -> str:
     async with _get_db(ctx).get_async_session() as session:
         result = await user_service.delete_all_users(session)
@@ -207,23 +403,44 @@ async def delete_all_users(ctx: Context[ServerSession, AppContext]) -> str:
         return result
 
 
-@mcp.tool(name="Find all addresses", description="Get all addresses from database.")
+@tool(
+    name="Find all addresses",
+    description="Get one page of addresses ordered by ID, starting after the "
+    "address ID 'after_id'. Pass the 'next_cursor' of a page as 'after_id' to get "
+    "the next page; it is null on the last page. 'limit' is the page size (max "
+    f"{MAX_PAGE_SIZE}). Optional 'fields' restricts the returned columns, "
+    f"e.g. ['country_code', 'user_id']. {RESPONSE_FORMAT_DESCRIPTION}",
+)
 async def find_all_addresses(
     ctx: Context[ServerSession, AppContext],
-) -> list[AddressDto]:
-    async with _get_db(ctx).get_async_session() as session:
-        return await address_service.get_all_addresses(session)
+    after_id: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+    fields: list[str] | None = None,
+    response_format: ResponseFormat = "json",
+) -> PageDto | TablePageDto | CsvPageDto:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        page = await address_service.get_addresses_page(
+            session, after_id, limit, fields
+        )
+    return encode_page(page, response_format)
 
 
-@mcp.tool(name="Find address by ID", description="Get address by ID.")
+@tool(name="Count addresses", description="Get the total number of addresses.")
+async def count_addresses(ctx: Context[ServerSession, AppContext]) -> int:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        return await address_service.count_addresses(session)
+
+
+@tool(name="Find address by ID", description="Get address by ID.")
 async def find_address_by_id(
     ctx: Context[ServerSession, AppContext], address_id: int
 ) -> AddressDto | None:
+    # Loads from the primary like find_user_by_last_name.
     async with _get_db(ctx).get_async_session() as session:
         return await address_service.get_address_by_id(session, address_id)
 
 
-@mcp.tool(
+@tool(
     name="Add address",
     description="Add a new address to the database. Use ISO 3166-1 alpha-2 "
     "country code (e.g., 'DE', 'US', 'FR').",
@@ -248,10 +465,10 @@ async def add_address(
         return str(e)
 
 
-@mcp.tool(
+@tool(
     name="Update address",
-    description="Update an address by ID. Use ISO 3166-1 alpha-2 "
-    "country code (e.g., 'DE', 'US', 'FR').",
+    description="Update an address by ID. Empty values are left unchanged. Use "
+    "ISO 3166-1 alpha-2 country code (e.g., 'DE', 'US', 'FR').",
 )
 async def update_address(
     ctx: Context[ServerSession, AppContext],
@@ -276,7 +493,57 @@ async def update_address(
         return str(e)
 
 
-@mcp.tool(name="Delete address by ID", description="Delete an address by ID.")
+@tool(
+    name="Update addresses matching filter",
+    description="Update all addresses matching a filter in one update. The "
+    f"filter maps {', '.join(ADDRESS_FILTER_FIELDS)} to the value to match, e.g. "
+    "{'city': 'Berlin'}. Empty new values are left unchanged. Use ISO 3166-1 "
+    "alpha-2 country codes.",
+)
+async def update_addresses_matching(
+    ctx: Context[ServerSession, AppContext],
+    where: dict[str, str],
+    street: str = "",
+    city: str = "",
+    postal_code: str = "",
+    country_code: str = "",
+) -> str:
+    try:
+        async with _get_db(ctx).get_async_session() as session:
+            result = await address_service.update_addresses_matching(
+                session,
+                where,
+                street=street,
+                city=city,
+                postal_code=postal_code,
+                country_code=country_code,
+            )
+            logger.info(f"✅ {result}")
+            return result
+    except ValueError as e:
+        logger.error(str(e))
+        return str(e)
+
+
+@tool(
+    name="Delete addresses matching filter",
+    description="Delete all addresses matching a filter in one delete. The "
+    f"filter maps {', '.join(ADDRESS_FILTER_FIELDS)} to the value to match.",
+)
+async def delete_addresses_matching(
+    ctx: Context[ServerSession, AppContext], where: dict[str, str]
+) -> str:
+    try:
+        async with _get_db(ctx).get_async_session() as session:
+            result = await address_service.delete_addresses_matching(session, where)
+            logger.info(f"✅ {result}")
+            return result
+    except ValueError as e:
+        logger.error(str(e))
+        return str(e)
+
+
+@tool(name="Delete address by ID", description="Delete an address by ID.")
 async def delete_address_by_id(
     ctx: Context[ServerSession, AppContext], address_id: int
 ) -> str:
@@ -289,9 +556,49 @@ async def delete_address_by_id(
         return result
 
 
+@tool(
+    name="Get statistics",
+    description="Get the number of users and addresses and the number of users "
+    "per country code, gender, age band and home office status, computed in the "
+    "database with a single query.",
+)
+async def get_statistics(ctx: Context[ServerSession, AppContext]) -> StatsDto:
+    async with _get_db(ctx).get_async_session(read_only=True) as session:
+        return await stats_service.get_stats(session)
+
+
+@mcp.resource(
+    "stats://queries",
+    name="query_latency",
+    description="Number of SQL statements and their p50/p95/p99 latency in "
+    "milliseconds per tool.",
+    mime_type="application/json",
+)
+async def get_query_latency() -> dict[str, dict[str, float]]:
+    return query_stats.percentiles()
+
+
+@mcp.resource(
+    "stats://cache",
+    name="lookup_cache",
+    description="Hits, misses, hit rate, evictions and invalidations of the "
+    "user and address lookup caches.",
+    mime_type="application/json",
+)
+async def get_cache_stats() -> dict[str, dict[str, float]]:
+    return {
+        "users": {**user_cache.stats.to_dict(), "entries": len(user_cache.entries)},
+        "addresses": {
+            **address_cache.stats.to_dict(),
+            "entries": len(address_cache.entries),
+        },
+    }
+
+
 @mcp.prompt("zeige-mitarbeiter-anzahl")
 async def get_number_of_employees():
     return """Wie viele Mitarbeiter sind aktuell in der Datenbank gespeichert?
+    Verwende dafür ausschliesslich das Tool "Get statistics".
     Zeige das Ergebnis zunächst sortiert nach Länderkennung und die dann die
     Gesamtzahl aller Mitarbeiter!
     """
@@ -302,7 +609,10 @@ async def list_employees() -> str:
     return """Gib eine Liste aller Mitarbeiter zurück, die in der Datenbank
     gespeichert sind!
 
-    1. Hole zunächst alle Mitarbeiter mit ihrer Adresse aus der Datenbank.
+    1. Hole zunächst alle Mitarbeiter mit ihrer Adresse aus der Datenbank mit
+       dem Tool "Find all users with details". Lade dazu Seite für Seite,
+       indem du "next_cursor" als "after_id" der nächsten Seite übergibst,
+       bis "next_cursor" leer ist.
     2. Formatiere das Ergebnis, so dass pro Mitarbeiter eine Zeile angezeigt
        wird und tenne die einzelnen Daten durch Komma voneinander.
     3. Stelle jeder Zeile eine fortlaufende Nummer voran, die rechtsbündig
@@ -314,4 +624,6 @@ async def list_employees() -> str:
 def employee_database_populate(anzahl: int, land: str):
     return f"""Füge {anzahl} Mitarbeiter in die Mitarbeiter-Datenbank ein,
     die ihren Wohnsitz ausschliesslich in {land} haben!
+    Verwende dafür einen einzigen Aufruf des Tools "Import users" mit allen
+    Mitarbeitern samt Adresse.
     """
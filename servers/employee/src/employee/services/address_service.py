@@ -1,7 +1,9 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from employee.cache import address_cache
+from employee.repositories.repository import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from employee.repositories.address_repository import address_repository
-from employee.schemas import AddressDto
+from employee.schemas import AddressDto, PageDto
 
 
 class AddressService:
@@ -10,10 +12,37 @@ class AddressService:
         addresses = await address_repository.get_all(session)
         return [AddressDto.model_validate(addr) for addr in addresses]
 
+    @staticmethod
+    async def get_addresses_page(
+        session: AsyncSession,
+        after_id: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: list[str] | None = None,
+    ) -> PageDto:
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        if fields:
+            items = await address_repository.get_page_columns(
+                session, fields, after_id, limit
+            )
+        else:
+            addresses = await address_repository.get_page(session, after_id, limit)
+            items = [
+                AddressDto.model_validate(address).model_dump(mode="json")
+                for address in addresses
+            ]
+        return PageDto.from_items(items, limit)
+
+    @staticmethod
+    async def count_addresses(session: AsyncSession) -> int:
+        return await address_repository.count(session)
+
     @staticmethod
     async def get_address_by_id(session: AsyncSession, address_id: int) -> AddressDto:
-        address = await address_repository.get_by_id(session, address_id)
-        return AddressDto.model_validate(address) if address else None
+        async def load() -> AddressDto | None:
+            address = await address_repository.get_by_id(session, address_id)
+            return AddressDto.model_validate(address) if address else None
+
+        return await address_cache.get_or_load(address_id, load)
 
     @staticmethod
     async def create_address(
@@ -43,21 +72,59 @@ class AddressService:
         postal_code: Optional[str] = None,
         country_code: Optional[str] = None,
     ) -> str:
-        updated = await address_repository.update_by_id(
-            session,
-            address_id=address_id,
-            street=street,
-            city=city,
-            postal_code=postal_code,
-            country_code=country_code,
-        )
+        try:
+            updated = await address_repository.update_by_id(
+                session,
+                address_id=address_id,
+                street=street,
+                city=city,
+                postal_code=postal_code,
+                country_code=country_code,
+            )
+        finally:
+            address_cache.invalidate(address_id)
         if updated:
             return f"Address ID {address_id} updated"
         return f"Address ID {address_id} not found"
 
+    @staticmethod
+    async def update_addresses_matching(
+        session: AsyncSession,
+        where: dict[str, str],
+        street: Optional[str] = None,
+        city: Optional[str] = None,
+        postal_code: Optional[str] = None,
+        country_code: Optional[str] = None,
+    ) -> str:
+        try:
+            updated = await address_repository.update_matching(
+                session,
+                where,
+                street=street,
+                city=city,
+                postal_code=postal_code,
+                country_code=country_code,
+            )
+        finally:
+            address_cache.clear()
+        return f"{updated} addresses updated"
+
+    @staticmethod
+    async def delete_addresses_matching(
+        session: AsyncSession, where: dict[str, str]
+    ) -> str:
+        try:
+            deleted = await address_repository.delete_matching(session, where)
+        finally:
+            address_cache.clear()
+        return f"{deleted} addresses deleted"
+
     @staticmethod
     async def delete_address_by_id(session: AsyncSession, address_id: int) -> str:
-        deleted = await address_repository.delete_by_id(session, address_id)
+        try:
+            deleted = await address_repository.delete_by_id(session, address_id)
+        finally:
+            address_cache.invalidate(address_id)
         if deleted:
             return f"Address ID {address_id} deleted"
         return f"Address ID {address_id} not found"
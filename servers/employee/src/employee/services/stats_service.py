@@ -1,19 +1,48 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from employee.repositories.user_repository import user_repository
-from employee.repositories.address_repository import address_repository
+from employee.repositories.stats_repository import stats_repository
+from employee.schemas import StatsDto
+
+UNKNOWN = "unknown"
+HOME_OFFICE_VALUES = {"1": "yes", "0": "no", "true": "yes", "false": "no"}
 
 
 class StatsService:
+    @staticmethod
+    async def get_stats(session: AsyncSession) -> StatsDto:
+        totals: dict[str, int] = {}
+        groups: dict[str, dict[str, int]] = {}
+        for group, value, count in await stats_repository.get_grouped_counts(session):
+            if group in ("users", "addresses"):
+                totals[group] = count
+            elif value is None:
+                groups.setdefault(group, {})[UNKNOWN] = count
+            elif group == "gender":
+                groups.setdefault(group, {})[value.lower()] = count
+            elif group == "home_office":
+                groups.setdefault(group, {})[HOME_OFFICE_VALUES[value.lower()]] = count
+            else:
+                groups.setdefault(group, {})[value] = count
+
+        return StatsDto(
+            total_users=totals.get("users", 0),
+            total_addresses=totals.get("addresses", 0),
+            by_country=_by_count(groups.get("country", {})),
+            by_gender=_by_count(groups.get("gender", {})),
+            by_age_band=dict(sorted(groups.get("age_band", {}).items())),
+            by_home_office=_by_count(groups.get("home_office", {})),
+        )
+
     @staticmethod
     async def get_database_stats(session: AsyncSession) -> str:
-        users = await user_repository.get_all(session)
-        addresses = await address_repository.get_all(session)
-        user_count = len(users)
-        address_count = len(addresses)
-        return f"""Total users: {user_count}
-        Total addresses: {address_count}
+        stats = await StatsService.get_stats(session)
+        return f"""Total users: {stats.total_users}
+        Total addresses: {stats.total_addresses}
         Database: SQLite
         Status: Active"""
 
 
+def _by_count(counts: dict[str, int]) -> dict[str, int]:
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
 stats_service = StatsService()
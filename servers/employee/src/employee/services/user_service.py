@@ -1,7 +1,34 @@
-from typing import Optional
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from employee.repositories.user_repository import user_repository
-from employee.schemas import Gender, UserDto
+from employee.cache import user_cache
+from employee.repositories.repository import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    STREAM_CHUNK_SIZE,
+)
+from employee.repositories.search_repository import search_repository
+from employee.repositories.user_repository import IMPORT_BATCH_SIZE, user_repository
+from employee.schemas import (
+    Gender,
+    ImportErrorDto,
+    ImportResultDto,
+    PageDto,
+    QueryResultDto,
+    UserDto,
+    UserWithDetailsDto,
+)
+from employee.validation import (
+    ImportAddressRequest,
+    ImportUserRequest,
+    QueryUsersRequest,
+)
+
+PAYLOAD_FORMATS = ("json", "jsonl", "csv")
 
 
 class UserService:
@@ -10,10 +37,88 @@ class UserService:
         users = await user_repository.get_all(session)
         return [UserDto.model_validate(user) for user in users]
 
+    @staticmethod
+    async def get_users_page(
+        session: AsyncSession,
+        after_id: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: list[str] | None = None,
+    ) -> PageDto:
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        if fields:
+            items = await user_repository.get_page_columns(
+                session, fields, after_id, limit
+            )
+        else:
+            users = await user_repository.get_page(session, after_id, limit)
+            items = [
+                UserDto.model_validate(user).model_dump(mode="json") for user in users
+            ]
+        return PageDto.from_items(items, limit)
+
+    @staticmethod
+    async def get_users_with_details_page(
+        session: AsyncSession, after_id: int = 0, limit: int = DEFAULT_PAGE_SIZE
+    ) -> PageDto:
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        users = await user_repository.get_page_with_details(session, after_id, limit)
+        items = [
+            UserWithDetailsDto.model_validate(user).model_dump(mode="json")
+            for user in users
+        ]
+        return PageDto.from_items(items, limit)
+
+    @staticmethod
+    async def query_users(
+        session: AsyncSession, request: QueryUsersRequest
+    ) -> QueryResultDto:
+        """Return the users matching a filter spec, at most MAX_PAGE_SIZE."""
+        limit = min(request.limit, MAX_PAGE_SIZE)
+        users = await user_repository.query(session, request, limit + 1)
+        return QueryResultDto(
+            items=[UserWithDetailsDto.model_validate(user) for user in users[:limit]],
+            truncated=len(users) > limit,
+        )
+
+    @staticmethod
+    async def search_users(
+        session: AsyncSession,
+        query: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> PageDto:
+        """Return one page of ranked search hits; the cursor is the next offset."""
+        offset = max(offset, 0)
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        hits = await search_repository.search_users(session, query, offset, limit)
+        items = [
+            {
+                **UserWithDetailsDto.model_validate(user).model_dump(mode="json"),
+                "score": score,
+            }
+            for user, score in hits
+        ]
+        next_cursor = offset + limit if len(items) == limit else None
+        return PageDto(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    async def stream_users(
+        session: AsyncSession, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[list[UserDto]]:
+        async for users in user_repository.stream(session, chunk_size):
+            yield [UserDto.model_validate(user) for user in users]
+
+    @staticmethod
+    async def count_users(session: AsyncSession) -> int:
+        return await user_repository.count(session)
+
     @staticmethod
     async def get_user_by_last_name(session: AsyncSession, last_name: str) -> UserDto:
-        user = await user_repository.get_by_last_name(session, last_name)
-        return UserDto.model_validate(user) if user else None
+        async def load() -> UserDto | None:
+            user = await user_repository.get_by_last_name(session, last_name)
+            return UserDto.model_validate(user) if user else None
+
+        return await user_cache.get_or_load(last_name, load)
 
     @staticmethod
     async def create_user(
@@ -24,16 +129,77 @@ class UserService:
         age: int,
         gender: str | None = None,
     ) -> str:
-        await user_repository.create(
-            session,
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            age=age,
-            gender=gender,
-        )
+        try:
+            await user_repository.create(
+                session,
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                age=age,
+                gender=gender,
+            )
+        finally:
+            user_cache.invalidate(last_name)
         return f"User '{first_name} {last_name}' added"
 
+    @staticmethod
+    async def import_users(
+        session: AsyncSession,
+        rows: list[Any],
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> ImportResultDto:
+        """Validate and insert many users in batches inside one transaction.
+
+        Invalid rows, including rows that are not objects, and rows with an
+        email that already exists are reported by their 1-based row number
+        and skipped; all other rows are imported.
+        """
+        errors: list[ImportErrorDto] = []
+        valid: list[tuple[int, ImportUserRequest]] = []
+        emails: set[str] = set()
+        for number, row in enumerate(rows, start=1):
+            if not isinstance(row, dict):
+                errors.append(ImportErrorDto(row=number, error="Row must be an object"))
+                continue
+            try:
+                request = ImportUserRequest.model_validate(_nest_address(row))
+            except ValidationError as e:
+                errors.append(ImportErrorDto(row=number, error=_describe(e)))
+                continue
+            if request.email in emails:
+                errors.append(ImportErrorDto(row=number, error="Email already exists"))
+                continue
+            emails.add(request.email)
+            valid.append((number, request))
+
+        imported = 0
+        try:
+            for start in range(0, len(valid), max(batch_size, 1)):
+                batch = valid[start : start + max(batch_size, 1)]
+                existing = await user_repository.get_existing_emails(
+                    session, [request.email for _, request in batch]
+                )
+                errors.extend(
+                    ImportErrorDto(row=number, error="Email already exists")
+                    for number, request in batch
+                    if request.email in existing
+                )
+                users = [
+                    request for _, request in batch if request.email not in existing
+                ]
+                if users:
+                    await user_repository.bulk_insert(session, users)
+                imported += len(users)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            user_cache.invalidate(*(request.last_name for _, request in valid))
+
+        errors.sort(key=lambda error: error.row)
+        return ImportResultDto(imported=imported, errors=errors)
+
     @staticmethod
     async def update_user(
         session: AsyncSession,
@@ -43,29 +209,92 @@ class UserService:
         age: Optional[int] = None,
         gender: Optional[Gender] = None,
     ) -> str:
-        updated = await user_repository.update_by_last_name(
-            session,
-            last_name=last_name,
-            first_name=first_name,
-            email=email,
-            age=age,
-            gender=gender,
-        )
+        try:
+            updated = await user_repository.update_by_last_name(
+                session,
+                last_name=last_name,
+                first_name=first_name,
+                email=email,
+                age=age,
+                gender=gender,
+            )
+        finally:
+            user_cache.invalidate(last_name)
         if updated:
             return f"User '{last_name}' updated"
         return f"User '{last_name}' not found"
 
+    @staticmethod
+    async def set_home_office_by_country(
+        session: AsyncSession, country_code: str, is_home_office: bool
+    ) -> str:
+        created, updated = await user_repository.set_home_office_by_country(
+            session, country_code, is_home_office
+        )
+        return (
+            f"Home office set to {is_home_office}: {updated} users updated, "
+            f"{created} work statuses created"
+        )
+
     @staticmethod
     async def delete_user_by_last_name(session: AsyncSession, last_name: str) -> str:
-        deleted = await user_repository.delete_by_last_name(session, last_name)
+        try:
+            deleted = await user_repository.delete_by_last_name(session, last_name)
+        finally:
+            user_cache.invalidate(last_name)
         if deleted:
             return f"User '{last_name}' deleted"
         return f"User '{last_name}' not found"
 
     @staticmethod
     async def delete_all_users(session: AsyncSession) -> str:
-        deleted_count = await user_repository.delete_all(session)
+        try:
+            deleted_count = await user_repository.delete_all(session)
+        finally:
+            user_cache.clear()
         return f"{deleted_count} users deleted"
 
 
+def parse_import_payload(payload: str, payload_format: str) -> list[Any]:
+    """Parse a JSON array, JSON lines or CSV payload with a header row.
+
+    JSON rows are returned as parsed; import_users reports rows that are
+    not objects.
+    """
+    if not payload.strip():
+        return []
+    if payload_format == "json":
+        rows = json.loads(payload)
+        if not isinstance(rows, list):
+            raise ValueError("JSON payload must be an array of users")
+        return rows
+    if payload_format == "jsonl":
+        return [json.loads(line) for line in payload.splitlines() if line.strip()]
+    if payload_format == "csv":
+        return [
+            {key: value for key, value in row.items() if value not in ("", None)}
+            for row in csv.DictReader(io.StringIO(payload))
+        ]
+    raise ValueError(
+        f"Invalid format '{payload_format}'. "
+        f"Valid options: {', '.join(PAYLOAD_FORMATS)}"
+    )
+
+
+def _nest_address(row: dict[str, Any]) -> dict[str, Any]:
+    if "address" in row:
+        return row
+    fields = ImportAddressRequest.model_fields
+    address = {key: value for key, value in row.items() if key in fields}
+    user = {key: value for key, value in row.items() if key not in fields}
+    return {**user, "address": address} if address else user
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
 user_service = UserService()
@@ -1,10 +1,22 @@
-from typing import Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, field_validator
+import pycountry
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 from employee.schemas import Gender
 
 
+def _to_gender(v: object) -> Gender:
+    """Parse a gender case-insensitively; non-strings are invalid too."""
+    if isinstance(v, str):
+        try:
+            return Gender(v.lower())
+        except ValueError:
+            pass
+    valid_options = [g.value for g in Gender]
+    raise ValueError(f"Invalid gender '{v}'. Valid options: {', '.join(valid_options)}")
+
+
 class CreateUserRequest(BaseModel):
     first_name: str
     last_name: str
@@ -17,13 +29,7 @@ class CreateUserRequest(BaseModel):
     def validate_gender(cls, v: str | None) -> Optional[Gender]:
         if v is None:
             return None
-        try:
-            return Gender(v.lower())
-        except ValueError as error:
-            valid_options = [g.value for g in Gender]
-            raise ValueError(
-                f"Invalid gender '{v}'. Valid options: {', '.join(valid_options)}"
-            ) from error
+        return _to_gender(v)
 
 
 class UpdateUserRequest(BaseModel):
@@ -38,10 +44,86 @@ class UpdateUserRequest(BaseModel):
     def validate_gender(cls, v: str | None) -> Optional[Gender]:
         if v is None:
             return None
-        try:
-            return Gender(v.lower())
-        except ValueError as error:
-            valid_options = [g.value for g in Gender]
+        return _to_gender(v)
+
+
+class ImportAddressRequest(BaseModel):
+    street: Annotated[str, Field(min_length=1, max_length=255)]
+    city: Annotated[str, Field(min_length=1, max_length=100)]
+    postal_code: Annotated[str, Field(min_length=1, max_length=20)]
+    country_code: str
+
+    @field_validator("country_code")
+    @classmethod
+    def validate_country_code(cls, v: str) -> str:
+        if not pycountry.countries.get(alpha_2=v.upper()):
+            raise ValueError(
+                f"Invalid country code '{v}'. Must be ISO 3166-1 alpha-2 "
+                f"format (e.g., 'DE', 'US', 'FR')."
+            )
+        return v.upper()
+
+
+class ImportUserRequest(CreateUserRequest):
+    """One imported user, held to the constraints of UserBase and AddressBase."""
+
+    first_name: Annotated[str, Field(min_length=1, max_length=255)]
+    last_name: Annotated[str, Field(min_length=1, max_length=255)]
+    email: EmailStr
+    age: Annotated[int, Field(ge=0, le=150)]
+    address: ImportAddressRequest | None = None
+    is_home_office: bool | None = None
+
+
+QUERY_SORT_FIELDS = Literal[
+    "id", "first_name", "last_name", "email", "age", "city", "country_code"
+]
+
+
+class QueryUsersRequest(BaseModel):
+    """Filter spec for users; all given conditions must hold."""
+
+    first_name: str | None = None
+    last_name: list[str] | None = None
+    email: str | None = None
+    gender: list[Gender] | None = None
+    min_age: int | None = Field(default=None, ge=0)
+    max_age: int | None = Field(default=None, ge=0)
+    country_code: list[str] | None = None
+    city: list[str] | None = None
+    is_home_office: bool | None = None
+    sort_by: QUERY_SORT_FIELDS = "id"
+    descending: bool = False
+    limit: int = Field(default=100, ge=1)
+
+    @field_validator("gender", mode="before")
+    @classmethod
+    def validate_gender(cls, v: list[str] | None) -> Optional[list[Gender]]:
+        if v is None:
+            return None
+        if not isinstance(v, list):
+            raise ValueError(f"Gender must be a list, got {v!r}")
+        return [_to_gender(value) for value in v]
+
+    @field_validator("country_code")
+    @classmethod
+    def validate_country_code(cls, v: list[str] | None) -> Optional[list[str]]:
+        if v is None:
+            return None
+        invalid = [code for code in v if not pycountry.countries.get(alpha_2=code)]
+        if invalid:
             raise ValueError(
-                f"Invalid gender '{v}'. Valid options: {', '.join(valid_options)}"
-            ) from error
+                f"Invalid country codes {', '.join(invalid)}. Must be ISO 3166-1 "
+                f"alpha-2 format (e.g., 'DE', 'US', 'FR')."
+            )
+        return [code.upper() for code in v]
+
+    @model_validator(mode="after")
+    def validate_age_range(self) -> "QueryUsersRequest":
+        if (
+            self.min_age is not None
+            and self.max_age is not None
+            and self.min_age > self.max_age
+        ):
+            raise ValueError("min_age must not be greater than max_age")
+        return self
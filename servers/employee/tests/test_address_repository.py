@@ -83,13 +83,16 @@ async def test_update_address(async_db_session):
     updated = await address_repository.update_by_id(
         async_db_session,
         address_id=address_id,
+        street="",
         city="New City",
+        postal_code="",
         country_code="GB",
     )
     assert updated is True
 
     address = await address_repository.get_by_id(async_db_session, address_id)
     assert address.street == "789 Pine St"  # unchanged
+    assert address.postal_code == "11111"  # unchanged
     assert address.city == "New City"  # updated
     assert address.country_code == "GB"  # updated
 
@@ -132,3 +135,45 @@ async def test_get_address_by_user_id(async_db_session):
     assert address is not None
     assert address.street == "User St"
     assert address.user_id == 5
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_addresses_matching(async_db_session):
+    """Test set-based update and delete of addresses matching a filter."""
+    for user_id, city in enumerate(["Berlin", "Berlin", "Hamburg"], start=1):
+        await address_repository.create(
+            async_db_session,
+            street="Street",
+            city=city,
+            postal_code="10115",
+            country_code="DE",
+            user_id=user_id,
+        )
+
+    updated = await address_repository.update_matching(
+        async_db_session, {"city": "Berlin", "country_code": "de"}, postal_code="10117"
+    )
+    addresses = await address_repository.get_all(async_db_session)
+    assert updated == 2
+    assert [address.postal_code for address in addresses] == ["10117", "10117", "10115"]
+
+    deleted = await address_repository.delete_matching(
+        async_db_session, {"postal_code": "10117"}
+    )
+    assert deleted == 2
+    assert await address_repository.count(async_db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_addresses_matching_rejects_invalid_filters(async_db_session):
+    """Test that empty or unknown filters and country codes are rejected."""
+    with pytest.raises(ValueError, match="At least one filter"):
+        await address_repository.delete_matching(async_db_session, {})
+    with pytest.raises(ValueError, match="Unknown filter fields street"):
+        await address_repository.update_matching(
+            async_db_session, {"street": "Main"}, city="Berlin"
+        )
+    with pytest.raises(ValueError, match="Invalid country code"):
+        await address_repository.update_matching(
+            async_db_session, {"city": "Berlin"}, country_code="XX"
+        )
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from employee.cache import LookupCache, address_cache, user_cache
+from employee.models.base import Base
+from employee.services.address_service import address_service
+from employee.services.user_service import user_service
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    user_cache.clear()
+    address_cache.clear()
+    yield
+    user_cache.clear()
+    address_cache.clear()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_db_session():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_local = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with async_session_local() as session:
+        yield session
+
+    await engine.dispose()
+
+
+def _loader(values):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return values.pop(0)
+
+    return load, calls
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_hits_expire_and_evict():
+    """Test cached hits, TTL expiry and LRU eviction."""
+    now = [0.0]
+    cache = LookupCache(ttl=10, max_entries=2, clock=lambda: now[0])
+    load, calls = _loader(["a", "b", "c", "a2"])
+
+    assert await cache.get_or_load("a", load) == "a"
+    assert await cache.get_or_load("a", load) == "a"
+    await cache.get_or_load("b", load)
+    await cache.get_or_load("c", load)
+    assert list(cache.entries) == ["b", "c"]
+
+    now[0] = 11.0
+    assert await cache.get_or_load("a", load) == "a2"
+    assert len(calls) == 4
+    assert cache.stats.to_dict() == {
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+        "invalidations": 0,
+        "hit_rate": 0.2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_skips_missing_and_disabled():
+    """Test that missing rows are not cached and a disabled cache always loads."""
+    cache = LookupCache(ttl=10, max_entries=10)
+    load, calls = _loader([None, None])
+    await cache.get_or_load("a", load)
+    await cache.get_or_load("a", load)
+    assert len(calls) == 2
+
+    cache.enabled = False
+    load, calls = _loader(["a", "a"])
+    await cache.get_or_load("a", load)
+    await cache.get_or_load("a", load)
+    assert len(calls) == 2
+    assert not cache.entries
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_does_not_store_load_racing_with_invalidation():
+    """Test that a value loaded while the key was invalidated is not cached."""
+    cache = LookupCache(ttl=10, max_entries=10)
+    loading = asyncio.Event()
+    written = asyncio.Event()
+
+    async def load():
+        loading.set()
+        await written.wait()
+        return "old"
+
+    task = asyncio.create_task(cache.get_or_load("a", load))
+    await loading.wait()
+    cache.invalidate("a")
+    written.set()
+
+    assert await task == "old"
+    assert "a" not in cache.entries
+
+
+@pytest.mark.asyncio
+async def test_user_lookup_is_cached_and_invalidated_by_writes(async_db_session):
+    """Test that user and address lookups are cached until a write."""
+    await user_service.create_user(async_db_session, "John", "Doe", "j@d.com", 30)
+    first = await user_service.get_user_by_last_name(async_db_session, "Doe")
+    assert await user_service.get_user_by_last_name(async_db_session, "Doe") is first
+
+    await user_service.update_user(async_db_session, "Doe", first_name="Jane")
+    updated = await user_service.get_user_by_last_name(async_db_session, "Doe")
+    assert updated.first_name == "Jane"
+
+    await address_service.create_address(
+        async_db_session, "Main St 1", "Berlin", "10115", "DE", first.id
+    )
+    address = await address_service.get_address_by_id(async_db_session, 1)
+    assert await address_service.get_address_by_id(async_db_session, 1) is address
+    await address_service.update_address(async_db_session, 1, city="Hamburg")
+    address = await address_service.get_address_by_id(async_db_session, 1)
+    assert address.city == "Hamburg"
+
+    await address_service.delete_address_by_id(async_db_session, 1)
+    await user_service.delete_user_by_last_name(async_db_session, "Doe")
+    assert await address_service.get_address_by_id(async_db_session, 1) is None
+    assert await user_service.get_user_by_last_name(async_db_session, "Doe") is None
+    assert user_cache.stats.hits == 1
@@ -1,24 +1,41 @@
+import shutil
+
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
-from employee.connect import Database
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from employee.connect import (
+    Database,
+    ReplicaSet,
+    _local_reader,
+    _session_factory,
+    create_engines,
+)
+from employee.models.base import Base
+from employee.models.user import User
 
 
 @pytest.mark.asyncio
 async def test_database_connect():
     """Test Database.connect method."""
     with (
-        patch("employee.connect.create_async_engine") as mock_engine,
+        patch("employee.connect.create_engines") as mock_engines,
         patch("employee.connect.async_sessionmaker") as mock_sessionmaker,
+        patch("employee.connect.instrument") as mock_instrument,
     ):
-        mock_engine.return_value = MagicMock()
+        mock_engine = MagicMock()
+        mock_engines.return_value = (mock_engine, [mock_engine])
         mock_sessionmaker.return_value = MagicMock()
 
         db = await Database.connect()
 
         assert isinstance(db, Database)
-        mock_engine.assert_called_once()
-        mock_sessionmaker.assert_called_once()
+        mock_engines.assert_called_once()
+        assert mock_sessionmaker.call_count == 2
+        mock_instrument.assert_called_once()
+        assert db.replicas.choose() is mock_engine
 
 
 @pytest.mark.asyncio
@@ -28,6 +45,7 @@ async def test_database_disconnect():
     mock_engine = MagicMock()
     mock_engine.dispose = AsyncMock()
     db.engine = mock_engine
+    db.replicas = ReplicaSet([mock_engine], fallback=mock_engine)
 
     await db.disconnect()
 
@@ -44,3 +62,140 @@ def test_get_async_session():
 
     mock_session_local.assert_called_once()
     assert session == mock_session_local.return_value
+
+
+@pytest.mark.asyncio
+async def test_create_engines_sqlite_profile(tmp_path):
+    """Test SQLite pragmas and routing of reads and writes."""
+    writer, (reader,) = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    session_factory = _session_factory(writer, reader)
+    try:
+        async with writer.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            journal_mode = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+            busy_timeout = (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar()
+
+        async with session_factory() as session:
+            session.add(User(first_name="A", last_name="B", email="a@example.com"))
+            await session.commit()
+            result = await session.execute(select(User.email))
+            binds = (
+                session.sync_session.get_bind(clause=select(User)),
+                session.sync_session.get_bind(clause=delete(User)),
+            )
+
+        assert journal_mode == "wal"
+        assert busy_timeout == 5000
+        assert result.scalars().all() == ["a@example.com"]
+        assert binds == (reader.sync_engine, writer.sync_engine)
+        assert writer.pool.size() == 1
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_routing_session_reads_its_own_writes(tmp_path):
+    """Test that reads after a write in one transaction go to the writer."""
+    writer, (reader,) = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    session_factory = _session_factory(writer, reader)
+    try:
+        async with writer.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with session_factory() as session:
+            assert (await session.scalars(select(User.email))).all() == []
+            session.add(User(first_name="A", last_name="B", email="a@example.com"))
+            pending = (await session.scalars(select(User.email))).all()
+            await session.execute(update(User).values(email="b@example.com"))
+            updated = (await session.scalars(select(User.email))).all()
+            await session.rollback()
+            after_rollback = (await session.scalars(select(User.email))).all()
+            bind = session.sync_session.get_bind(clause=select(User))
+
+        assert pending == ["a@example.com"]
+        assert updated == ["b@example.com"]
+        assert after_rollback == []
+        assert bind is reader.sync_engine
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+def test_create_engines_in_memory_uses_one_engine():
+    """Test that in-memory SQLite shares one engine for reads and writes."""
+    writer, readers = create_engines("sqlite+aiosqlite:///:memory:")
+    assert readers == [writer]
+
+
+def test_write_sessions_read_from_primary_with_replicas(tmp_path):
+    """Test that only a local SQLite reader may serve reads of write sessions."""
+    writer, readers = create_engines(
+        "sqlite+aiosqlite:///:memory:",
+        [f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"],
+    )
+    session = _session_factory(writer, _local_reader(writer, readers))()
+
+    assert readers != [writer]
+    assert session.sync_session.get_bind(clause=select(User)) is writer.sync_engine
+
+
+def test_replica_set_round_robin_skips_unhealthy_replicas():
+    """Test round-robin order, cooldown and fallback to the primary."""
+    primary, first, second = MagicMock(), MagicMock(), MagicMock()
+    now = [0.0]
+    with patch("employee.connect.event"):
+        replicas = ReplicaSet(
+            [first, second], fallback=primary, cooldown=10, clock=lambda: now[0]
+        )
+
+    assert [replicas.choose() for _ in range(3)] == [first, second, first]
+
+    replicas.mark_unhealthy(second)
+    assert [replicas.choose() for _ in range(2)] == [first, first]
+
+    replicas.mark_unhealthy(first)
+    assert replicas.choose() is primary
+
+    now[0] = 11.0
+    assert {replicas.choose(), replicas.choose()} == {first, second}
+
+
+@pytest.mark.asyncio
+async def test_database_routes_reads_to_replicas(tmp_path):
+    """Test replica routing with two SQLite files standing in for replicas."""
+    primary_path = tmp_path / "primary.db"
+    primary_url = f"sqlite+aiosqlite:///{primary_path}"
+    replica_urls = [
+        f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}",
+        f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}",
+    ]
+    setup = create_async_engine(primary_url)
+    async with setup.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await setup.dispose()
+    shutil.copy(primary_path, tmp_path / "replica.db")
+
+    db = await Database.connect(primary_url, replica_urls)
+    try:
+        async with db.get_async_session() as session:
+            session.add(User(first_name="A", last_name="B", email="a@example.com"))
+            await session.commit()
+
+        emails = []
+        for _ in range(4):
+            async with db.get_async_session(read_only=True) as session:
+                emails.append((await session.scalars(select(User.email))).all())
+        write_session = db.get_async_session()
+
+        local_reader, replica, missing = db.replicas.engines
+        assert emails == [["a@example.com"], [], ["a@example.com"], []]
+        assert (
+            write_session.sync_session.get_bind(clause=select(User))
+            is local_reader.sync_engine
+        )
+        assert missing in db.replicas.unhealthy_until
+        assert replica not in db.replicas.unhealthy_until
+        assert local_reader is not db.engine
+    finally:
+        await db.disconnect()
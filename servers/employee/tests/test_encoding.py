@@ -0,0 +1,37 @@
+from employee.encoding import encode_page
+from employee.schemas import CsvPageDto, PageDto, TablePageDto
+
+PAGE = PageDto(
+    items=[
+        {"id": 1, "last_name": "Müller", "age": 30},
+        {"id": 2, "last_name": "Doe, Jr.", "age": None},
+    ],
+    next_cursor=2,
+)
+
+
+def test_encode_page_json_keeps_page():
+    """Test that the default format returns the page unchanged."""
+    assert encode_page(PAGE) is PAGE
+
+
+def test_encode_page_table():
+    """Test the header row plus value arrays encoding."""
+    assert encode_page(PAGE, "table") == TablePageDto(
+        columns=["id", "last_name", "age"],
+        rows=[[1, "Müller", 30], [2, "Doe, Jr.", None]],
+        next_cursor=2,
+    )
+
+
+def test_encode_page_csv():
+    """Test CSV encoding with quoting and empty cells for null values."""
+    assert encode_page(PAGE, "csv") == CsvPageDto(
+        csv='id,last_name,age\n1,Müller,30\n2,"Doe, Jr.",\n', next_cursor=2
+    )
+
+
+def test_encode_empty_page():
+    """Test that an empty page encodes to an empty table."""
+    page = encode_page(PageDto(items=[]), "table")
+    assert page == TablePageDto(columns=[], rows=[])
@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from employee.instrumentation import QueryStats, instrument, tagged
+from employee.models.base import Base
+from employee.models.user import User
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture(scope="function")
+async def engine():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def test_query_stats_percentiles():
+    """Test nearest-rank percentiles per tool."""
+    stats = QueryStats(sample_size=100)
+    for milliseconds in range(1, 101):
+        stats.record("Find all users", float(milliseconds))
+    stats.record("Count users", 2.0)
+
+    assert stats.percentiles() == {
+        "Count users": {"count": 1, "p50": 2.0, "p95": 2.0, "p99": 2.0},
+        "Find all users": {"count": 100, "p50": 50.0, "p95": 95.0, "p99": 99.0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_instrument_tags_statements_and_explains_slow_ones(engine, caplog):
+    """Test that statements are timed per tool and slow ones explained."""
+    stats = QueryStats()
+    instrument(engine, slow_query_ms=0, stats=stats)
+    session_factory = async_sessionmaker(bind=engine)
+
+    @tagged("Find user by last name")
+    async def find_user() -> User | None:
+        async with session_factory() as session:
+            result = await session.execute(select(User).where(User.last_name == "Doe"))
+            return result.scalars().first()
+
+    with caplog.at_level(logging.WARNING, logger="employee.instrumentation"):
+        await find_user()
+
+    assert stats.counts == {"Find user by last name": 1}
+    assert "Slow query" in caplog.text
+    assert "SEARCH users USING INDEX ix_users_last_name" in caplog.text
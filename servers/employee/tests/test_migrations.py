@@ -0,0 +1,54 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from employee.migrations import migrate
+from employee.models.base import Base
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture(scope="function")
+async def engine():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    yield engine
+    await engine.dispose()
+
+
+def _index_names(conn) -> set[str]:
+    inspector = inspect(conn)
+    return {
+        index["name"]
+        for table in inspector.get_table_names()
+        for index in inspector.get_indexes(table)
+    }
+
+
+@pytest.mark.asyncio
+async def test_migrate_updates_indexes_of_existing_database(engine):
+    """Test that missing indexes are created and obsolete ones dropped."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for name in ("ix_users_last_name", "ix_addresses_user_id"):
+            await conn.execute(text(f"DROP INDEX {name}"))
+        await conn.execute(
+            text("CREATE INDEX idx_user_email_lastname ON users (email, last_name)")
+        )
+
+        changes = await conn.run_sync(migrate)
+        indexes = await conn.run_sync(_index_names)
+        repeated = await conn.run_sync(migrate)
+
+    assert sorted(changes) == [
+        "created ix_addresses_user_id",
+        "created ix_users_last_name",
+        "dropped idx_user_email_lastname",
+    ]
+    assert {
+        "ix_users_last_name",
+        "ix_addresses_user_id",
+        "ix_addresses_country_code",
+    } <= indexes
+    assert "idx_user_email_lastname" not in indexes
+    assert repeated == []
@@ -109,3 +109,26 @@ async def test_base_repository_delete_all(async_db_session):
     # Verify empty
     users = await repo.get_all(async_db_session)
     assert len(users) == 0
+
+
+@pytest.mark.asyncio
+async def test_base_repository_get_page(async_db_session):
+    """Test BaseRepository keyset pagination, projection and count."""
+    repo = UserRepositoryForTesting()
+    async_db_session.add_all(
+        User(first_name="User", last_name=f"N{i}", email=f"u{i}@example.com")
+        for i in range(5)
+    )
+    await async_db_session.commit()
+
+    first = await repo.get_page(async_db_session, limit=2)
+    second = await repo.get_page(async_db_session, after_id=first[-1].id, limit=2)
+    assert [user.last_name for user in first + second] == ["N0", "N1", "N2", "N3"]
+
+    rows = await repo.get_page_columns(async_db_session, ["email"], after_id=4)
+    assert rows == [{"id": 5, "email": "u4@example.com"}]
+
+    with pytest.raises(ValueError, match="Unknown fields password"):
+        await repo.get_page_columns(async_db_session, ["password"])
+
+    assert await repo.count(async_db_session) == 5
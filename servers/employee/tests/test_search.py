@@ -0,0 +1,98 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from employee.models.address import Address
+from employee.models.base import Base
+from employee.models.user import User
+from employee.search import create_search_index, fts5_query, search_terms
+from employee.services.user_service import user_service
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+PEOPLE = [
+    ("Anna", "Müller", "Hamburg"),
+    ("Bernd", "Müller", "Berlin"),
+    ("Clara", "Schmidt", "Hamburg"),
+    ("Dieter", "Müllerschön", "Hamburg"),
+]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_db_session():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_local = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with async_session_local() as session:
+        session.add(_user(*PEOPLE[0]))
+        await session.commit()
+        async with engine.begin() as conn:
+            changes = await conn.run_sync(create_search_index)
+            repeated = await conn.run_sync(create_search_index)
+        assert (changes, repeated) == (["created user_search"], [])
+
+        session.add_all(_user(*person) for person in PEOPLE[1:])
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+def _user(first_name: str, last_name: str, city: str) -> User:
+    return User(
+        first_name=first_name,
+        last_name=last_name,
+        email=f"{first_name.lower()}@example.com",
+        address=Address(
+            street="Hauptstraße 1", city=city, postal_code="20095", country_code="DE"
+        ),
+    )
+
+
+async def _names(session, query: str) -> list[str]:
+    page = await user_service.search_users(session, query)
+    return [item["first_name"] for item in page.items]
+
+
+def test_search_terms_are_quoted_prefixes():
+    """Test that user input is tokenized and cannot inject FTS5 syntax."""
+    assert search_terms('Müller "OR" hamburg*') == ["müller", "or", "hamburg"]
+    assert fts5_query(["müller", "hamb"]) == '"müller"* "hamb"*'
+
+
+@pytest.mark.asyncio
+async def test_search_users_ranks_matches_of_all_terms(async_db_session):
+    """Test that all terms must match and exact words rank before prefixes."""
+    assert await _names(async_db_session, "Müller Hamburg") == ["Anna", "Dieter"]
+    assert await _names(async_db_session, "muller hamb") == ["Anna", "Dieter"]
+    assert await _names(async_db_session, "clara@example") == ["Clara"]
+    assert await _names(async_db_session, "  ") == []
+
+    page = await user_service.search_users(async_db_session, "Hamburg", limit=2)
+    assert len(page.items) == 2
+    assert page.items[0]["address"]["city"] == "Hamburg"
+    assert page.items[0]["score"] >= page.items[1]["score"]
+    next_page = await user_service.search_users(
+        async_db_session, "Hamburg", offset=page.next_cursor, limit=2
+    )
+    assert len(next_page.items) == 1
+    assert next_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_writes(async_db_session):
+    """Test that triggers keep the index in sync with users and addresses."""
+    await async_db_session.execute(
+        update(Address).where(Address.city == "Berlin").values(city="Hamburg")
+    )
+    await async_db_session.execute(
+        update(User).where(User.first_name == "Anna").values(last_name="Meier")
+    )
+    await async_db_session.execute(delete(User).where(User.first_name == "Dieter"))
+    await async_db_session.commit()
+
+    assert await _names(async_db_session, "Müller Hamburg") == ["Bernd"]
+    assert await _names(async_db_session, "Meier") == ["Anna"]
@@ -0,0 +1,50 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from employee.models.address import Address
+from employee.models.user import User
+from employee.models.work_status import WorkStatus
+from employee.seed import ValuePools, generate_batches, seed
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture(scope="function")
+async def engine():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    yield engine
+    await engine.dispose()
+
+
+def test_generate_batches_is_deterministic():
+    """Test that equal seeds generate equal rows in batches."""
+    pools = ValuePools.generate(7, size=20)
+
+    first = list(generate_batches(pools, 5, 1, 7, 2))
+    second = list(generate_batches(ValuePools.generate(7, size=20), 5, 1, 7, 2))
+
+    assert first == second
+    assert [len(users) for users, _, _ in first] == [2, 2, 1]
+    assert [user["id"] for users, _, _ in first for user in users] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_seed_inserts_users_with_details(engine):
+    """Test seeding users, addresses and work status in batches."""
+    report = await seed(engine, 25, batch_size=10)
+    await seed(engine, 5, batch_size=10)
+
+    async with engine.connect() as conn:
+        counts = [
+            (await conn.execute(select(func.count()).select_from(model))).scalar()
+            for model in (User, Address, WorkStatus)
+        ]
+        emails = (
+            await conn.execute(select(func.count(User.email.distinct())))
+        ).scalar()
+
+    assert report.rows == 75
+    assert counts == [30, 30, 30]
+    assert emails == 30
@@ -1,15 +1,21 @@
+import json
+
 import pytest
 import pytest_asyncio
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.future import select
 
+from employee.config import settings
 from employee.models.address import Address
 from employee.models.base import Base
 from employee.models.user import User, Gender
 from employee.server import (
     AppContext,
     find_all_users,
+    count_users,
+    export_users,
+    import_users,
     find_user_by_last_name,
     add_user,
     update_user,
@@ -17,6 +23,8 @@ from employee.server import (
     find_all_addresses,
     find_address_by_id,
     add_address,
+    update_address,
+    update_addresses_matching,
 )
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -48,7 +56,56 @@ async def mock_context(async_db_session):
 @pytest.mark.asyncio
 async def test_find_all_users_empty(mock_context):
     result = await find_all_users(mock_context)
-    assert result == []
+    assert result.items == []
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_find_all_users_paginated(mock_context, async_db_session):
+    async_db_session.add_all(
+        User(first_name="John", last_name=f"Doe{i}", email=f"john{i}@test.com")
+        for i in range(3)
+    )
+    await async_db_session.commit()
+
+    first = await find_all_users(mock_context, limit=2, fields=["last_name"])
+    second = await find_all_users(mock_context, after_id=first.next_cursor, limit=2)
+
+    assert first.items == [
+        {"id": 1, "last_name": "Doe0"},
+        {"id": 2, "last_name": "Doe1"},
+    ]
+    assert [item["last_name"] for item in second.items] == ["Doe2"]
+    assert second.next_cursor is None
+    assert await count_users(mock_context) == 3
+
+
+@pytest.mark.asyncio
+async def test_find_all_users_csv_with_enum_column(mock_context, async_db_session):
+    async_db_session.add(
+        User(
+            first_name="Jane",
+            last_name="Doe",
+            email="jane@test.com",
+            gender=Gender.FEMALE,
+        )
+    )
+    await async_db_session.commit()
+
+    page = await find_all_users(
+        mock_context, fields=["last_name", "gender"], response_format="csv"
+    )
+
+    assert page.csv == "id,last_name,gender\n1,Doe,female\n"
+
+
+@pytest.mark.asyncio
+async def test_cached_lookups_load_from_primary(mock_context):
+    await find_user_by_last_name(mock_context, "Doe")
+    await find_address_by_id(mock_context, 1)
+
+    db = mock_context.request_context.lifespan_context.db
+    assert [call.kwargs for call in db.get_async_session.call_args_list] == [{}, {}]
 
 
 @pytest.mark.asyncio
@@ -103,7 +160,7 @@ async def test_delete_user_by_last_name_success(mock_context, async_db_session):
 @pytest.mark.asyncio
 async def test_find_all_addresses_empty(mock_context):
     result = await find_all_addresses(mock_context)
-    assert result == []
+    assert result.items == []
 
 
 @pytest.mark.asyncio
@@ -120,6 +177,37 @@ async def test_add_address_success(mock_context, async_db_session):
     assert address is not None
 
 
+@pytest.mark.asyncio
+async def test_update_address_tools_leave_empty_values_unchanged(
+    mock_context, async_db_session
+):
+    async_db_session.add(
+        Address(
+            street="Main St 1",
+            city="Berlin",
+            postal_code="10115",
+            country_code="DE",
+            user_id=1,
+        )
+    )
+    await async_db_session.commit()
+
+    assert "updated" in await update_address(mock_context, 1, city="Hamburg")
+    assert "1 addresses updated" in await update_addresses_matching(
+        mock_context, {"city": "Hamburg"}, postal_code="20095"
+    )
+
+    address = await async_db_session.scalar(
+        select(Address).execution_options(populate_existing=True)
+    )
+    assert (address.street, address.city, address.postal_code) == (
+        "Main St 1",
+        "Hamburg",
+        "20095",
+    )
+    assert address.country_code == "DE"
+
+
 @pytest.mark.asyncio
 async def test_find_address_by_id_found(mock_context, async_db_session):
     address = Address(
@@ -136,3 +224,84 @@ async def test_find_address_by_id_found(mock_context, async_db_session):
     result = await find_address_by_id(mock_context, address.id)
     assert result is not None
     assert result.street == "123 Main St"
+
+
+@pytest.mark.asyncio
+async def test_export_users_streams_chunks(
+    mock_context, async_db_session, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "export_dir", tmp_path)
+    mock_context.report_progress = AsyncMock()
+    async_db_session.add_all(
+        User(first_name="John", last_name=f"Doe{i}", email=f"john{i}@test.com")
+        for i in range(3)
+    )
+    await async_db_session.commit()
+
+    result = await export_users(mock_context, "../export.jsonl")
+
+    lines = (tmp_path / "export.jsonl").read_text(encoding="utf-8").splitlines()
+    assert "3 users exported" in result
+    assert [json.loads(line)["last_name"] for line in lines] == [
+        "Doe0",
+        "Doe1",
+        "Doe2",
+    ]
+    mock_context.report_progress.assert_awaited_with(3, 3)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_name", ["", ".", "..", "exports/.."])
+async def test_export_users_rejects_directory_names(
+    mock_context, tmp_path, monkeypatch, file_name
+):
+    monkeypatch.setattr(settings, "export_dir", tmp_path)
+
+    result = await export_users(mock_context, file_name)
+
+    assert result == f"Invalid export file name '{file_name}'"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_import_users(mock_context, async_db_session):
+    result = await import_users(
+        mock_context,
+        users=[
+            {
+                "first_name": "John",
+                "last_name": "Doe",
+                "email": "john@test.com",
+                "age": 30,
+                "address": {
+                    "street": "Main St 1",
+                    "city": "Berlin",
+                    "postal_code": "10115",
+                    "country_code": "DE",
+                },
+            }
+        ],
+        payload='{"first_name": "Jo", "last_name": "Do", "email": "j@d.de", "age": 2}',
+        payload_format="jsonl",
+    )
+    assert result.imported == 2
+    assert result.errors == []
+
+    payload = "\n".join(
+        [
+            '{"first_name": "Jane", "last_name": "Roe", "email": "x", "age": 2}',
+            '{"first_name": "", "last_name": "Roe", "email": "r@d.com", "age": 2}',
+            '{"first_name": "Jim", "last_name": "Roe", "email": "r@d.com", "age": 151}',
+        ]
+    )
+    result = await import_users(mock_context, payload=payload, payload_format="jsonl")
+    assert result.imported == 0
+    assert [error.error.split(":")[0] for error in result.errors] == [
+        "email",
+        "first_name",
+        "age",
+    ]
+
+    assert "Invalid format" in await import_users(
+        mock_context, payload="a", payload_format="xml"
+    )
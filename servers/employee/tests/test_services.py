@@ -3,10 +3,13 @@ import pytest_asyncio
 
 from employee.models.address import Address
 from employee.models.base import Base
-from employee.models.user import User
-from employee.services.user_service import user_service
+from employee.models.user import Gender, User
+from employee.models.work_status import WorkStatus
+from employee.services.user_service import parse_import_payload, user_service
+from employee.validation import QueryUsersRequest
 from employee.services.address_service import address_service
 from employee.services.stats_service import stats_service
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -45,6 +48,22 @@ async def test_user_service_get_all_users(async_db_session):
     assert result[0].first_name == "John"
 
 
+@pytest.mark.asyncio
+async def test_user_service_stream_users(async_db_session):
+    """Test streaming users through service in chunks."""
+    async_db_session.add_all(
+        User(first_name="John", last_name=f"Doe{i}", email=f"john{i}@example.com")
+        for i in range(5)
+    )
+    await async_db_session.commit()
+
+    chunks = [
+        [user.last_name for user in users]
+        async for users in user_service.stream_users(async_db_session, chunk_size=2)
+    ]
+    assert chunks == [["Doe0", "Doe1"], ["Doe2", "Doe3"], ["Doe4"]]
+
+
 @pytest.mark.asyncio
 async def test_user_service_update_user(async_db_session):
     """Test updating user through service."""
@@ -87,3 +106,192 @@ async def test_stats_service(async_db_session):
     result = await stats_service.get_database_stats(async_db_session)
     assert "Total users: 1" in result
     assert "Total addresses: 1" in result
+
+
+@pytest.mark.asyncio
+async def test_stats_service_grouped_counts(async_db_session):
+    """Test grouped statistics computed in SQL."""
+    async_db_session.add_all(
+        [
+            User(first_name="A", last_name="A", email="a@example.com", age=17),
+            User(first_name="B", last_name="B", email="b@example.com", age=35),
+            User(
+                first_name="C",
+                last_name="C",
+                email="c@example.com",
+                age=70,
+                gender=Gender.FEMALE,
+            ),
+            Address(
+                street="S", city="C", postal_code="1", country_code="DE", user_id=1
+            ),
+            Address(
+                street="S", city="C", postal_code="1", country_code="DE", user_id=2
+            ),
+            Address(
+                street="S", city="C", postal_code="1", country_code="US", user_id=3
+            ),
+            WorkStatus(is_home_office=True, user_id=1),
+            WorkStatus(is_home_office=False, user_id=2),
+        ]
+    )
+    await async_db_session.commit()
+
+    stats = await stats_service.get_stats(async_db_session)
+
+    assert (stats.total_users, stats.total_addresses) == (3, 3)
+    assert stats.by_country == {"DE": 2, "US": 1}
+    assert stats.by_gender == {"unknown": 2, "female": 1}
+    assert stats.by_age_band == {"0-17": 1, "30-39": 1, "60+": 1}
+    assert stats.by_home_office == {"no": 1, "yes": 1}
+
+
+@pytest.mark.asyncio
+async def test_user_service_import_users(async_db_session):
+    """Test bulk import with batches and per-row errors."""
+    async_db_session.add(
+        User(first_name="Old", last_name="User", email="old@example.com")
+    )
+    await async_db_session.commit()
+    header = "first_name,last_name,email,age,gender,"
+    header += "street,city,postal_code,country_code,is_home_office"
+    payload = f"""{header}
+Anna,Schmidt,anna@example.com,30,female,Hauptstr. 1,Berlin,10115,de,true
+Ben,Meyer,ben@example.com,old,male,,,,,
+Carl,Old,old@example.com,50,,,,,,
+Dora,Wolf,dora@example.com,35,,,,,,false
+Emil,Fox,emil@example.com,28,other,Weg 2,Wien,1010,XX,
+Anna,Twice,anna@example.com,30,,,,,,
+"""
+
+    result = await user_service.import_users(
+        async_db_session, parse_import_payload(payload, "csv"), batch_size=2
+    )
+
+    assert result.imported == 2
+    assert [error.row for error in result.errors] == [2, 3, 5, 6]
+    assert result.errors[0].error.startswith("age:")
+    assert result.errors[1].error == "Email already exists"
+    assert result.errors[2].error.startswith("address.country_code:")
+    assert result.errors[3].error == "Email already exists"
+    addresses = (await async_db_session.execute(select(Address))).scalars().all()
+    assert [(a.city, a.country_code) for a in addresses] == [("Berlin", "DE")]
+    statuses = (await async_db_session.execute(select(WorkStatus))).scalars().all()
+    assert sorted(status.is_home_office for status in statuses) == [False, True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload, payload_format",
+    [
+        (
+            '[1, {"first_name": "A", "last_name": "B", "email": "a@b.de", "age": 3}]',
+            "json",
+        ),
+        (
+            '"x"\n{"first_name": "A", "last_name": "B", "email": "a@b.de", "age": 3}',
+            "jsonl",
+        ),
+    ],
+)
+async def test_user_service_import_reports_non_object_rows(
+    async_db_session, payload, payload_format
+):
+    """Test that rows that are not objects are reported, not fatal."""
+    result = await user_service.import_users(
+        async_db_session, parse_import_payload(payload, payload_format)
+    )
+
+    assert result.imported == 1
+    assert [(error.row, error.error) for error in result.errors] == [
+        (1, "Row must be an object")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_user_service_users_with_details_single_query(async_db_session):
+    """Test loading users with address and work status in one statement."""
+    async_db_session.add_all(
+        [
+            User(first_name="A", last_name="A", email="a@example.com"),
+            User(first_name="B", last_name="B", email="b@example.com"),
+            Address(
+                street="S", city="Berlin", postal_code="1", country_code="DE", user_id=1
+            ),
+            WorkStatus(is_home_office=True, user_id=2),
+        ]
+    )
+    await async_db_session.commit()
+    async_db_session.expunge_all()
+    statements = []
+    engine = async_db_session.bind.sync_engine
+
+    def count(*args):
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        page = await user_service.get_users_with_details_page(async_db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert len(statements) == 1
+    assert page.items[0]["address"]["city"] == "Berlin"
+    assert page.items[0]["work_status"] is None
+    assert page.items[1]["address"] is None
+    assert page.items[1]["work_status"] == {"is_home_office": True}
+
+
+@pytest.mark.asyncio
+async def test_user_service_query_users(async_db_session):
+    """Test filtering users by address, work status and age in one statement."""
+    people = [
+        ("A", "DE", True, 55, Gender.FEMALE),
+        ("B", "DE", True, 40, Gender.MALE),
+        ("C", "DE", False, 60, Gender.MALE),
+        ("D", "FR", True, 70, Gender.OTHER),
+        ("E", "DE", True, 52, Gender.MALE),
+    ]
+    async_db_session.add_all(
+        User(
+            first_name=name,
+            last_name=name,
+            email=f"{name}@example.com",
+            age=age,
+            gender=gender,
+            address=Address(
+                street="S", city="City", postal_code="1", country_code=country
+            ),
+            work_status=WorkStatus(is_home_office=home_office),
+        )
+        for name, country, home_office, age, gender in people
+    )
+    await async_db_session.commit()
+    async_db_session.expunge_all()
+    statements = []
+    engine = async_db_session.bind.sync_engine
+
+    def count(*args):
+        statements.append(args[2])
+
+    request = QueryUsersRequest(
+        country_code=["de"], is_home_office=True, min_age=50, sort_by="age"
+    )
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        result = await user_service.query_users(async_db_session, request)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert len(statements) == 1
+    assert [user.first_name for user in result.items] == ["E", "A"]
+    assert result.items[0].address.country_code == "DE"
+    assert result.items[0].work_status.is_home_office is True
+    assert result.truncated is False
+
+    request = QueryUsersRequest(
+        gender=["male", "other"], sort_by="age", descending=True, limit=2
+    )
+    result = await user_service.query_users(async_db_session, request)
+    assert [user.first_name for user in result.items] == ["D", "C"]
+    assert result.truncated is True
@@ -1,9 +1,12 @@
 import pytest
 import pytest_asyncio
 
+from employee.models.address import Address
 from employee.models.base import Base
-from employee.models.user import Gender
+from employee.models.user import Gender, User
+from employee.models.work_status import WorkStatus
 from employee.repositories.user_repository import user_repository
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
@@ -263,3 +266,66 @@ async def test_partial_update_user(async_db_session):
     assert user.email == "partial@example.com"  # unchanged
     assert user.gender == Gender.MALE  # unchanged
     assert user.age == 31  # changed
+
+
+@pytest.mark.asyncio
+async def test_update_user_by_last_name_is_one_statement(async_db_session):
+    """Test that updating a user runs a single UPDATE ... RETURNING."""
+    await user_repository.create(
+        async_db_session, "John", "Single", "single@example.com", 25
+    )
+    statements = []
+    engine = async_db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        updated = await user_repository.update_by_last_name(
+            async_db_session, last_name="Single", age=30
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert updated is True
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE users")
+    assert "RETURNING" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_set_home_office_by_country(async_db_session):
+    """Test setting the home office flag for all users in a country."""
+    for number, country_code in enumerate(["DE", "DE", "FR", "DE"]):
+        async_db_session.add(
+            User(
+                first_name="User",
+                last_name=f"Office{number}",
+                email=f"office{number}@example.com",
+                address=Address(
+                    street="Street",
+                    city="City",
+                    postal_code="12345",
+                    country_code=country_code,
+                ),
+                work_status=(
+                    WorkStatus(is_home_office=number == 1) if number < 3 else None
+                ),
+            )
+        )
+    async_db_session.add(
+        Address(
+            street="Second", city="City", postal_code="1", country_code="DE", user_id=4
+        )
+    )
+    await async_db_session.commit()
+
+    counts = await user_repository.set_home_office_by_country(
+        async_db_session, "de", True
+    )
+
+    flags = await async_db_session.execute(
+        select(WorkStatus.user_id, WorkStatus.is_home_office).order_by(
+            WorkStatus.user_id
+        )
+    )
+    assert counts == (1, 1)
+    assert flags.all() == [(1, True), (2, True), (3, False), (4, True)]
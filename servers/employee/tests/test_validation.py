@@ -2,7 +2,12 @@ import pytest
 from pydantic import ValidationError
 
 from employee.schemas import Gender
-from employee.validation import CreateUserRequest, UpdateUserRequest
+from employee.validation import (
+    CreateUserRequest,
+    ImportUserRequest,
+    QueryUsersRequest,
+    UpdateUserRequest,
+)
 
 
 def test_create_user_request_valid():
@@ -85,3 +90,40 @@ def test_all_gender_values():
             gender=gender_value,
         )
         assert request.gender == getattr(Gender, gender_value.upper())
+
+
+def test_query_users_request_normalizes_and_validates():
+    """Test gender and country normalization and the age range check."""
+    request = QueryUsersRequest(gender=["MALE"], country_code=["de", "fr"])
+    assert request.gender == [Gender.MALE]
+    assert request.country_code == ["DE", "FR"]
+
+    with pytest.raises(ValidationError, match="Invalid country codes XX"):
+        QueryUsersRequest(country_code=["XX"])
+    with pytest.raises(ValidationError, match="min_age must not be greater"):
+        QueryUsersRequest(min_age=60, max_age=50)
+    with pytest.raises(ValidationError):
+        QueryUsersRequest(sort_by="password")
+
+
+@pytest.mark.parametrize("gender", [1, ["male"], {"value": "male"}])
+def test_user_requests_reject_non_string_gender(gender):
+    """Test that a gender that is not a string raises ValidationError."""
+    with pytest.raises(ValidationError, match="Invalid gender"):
+        ImportUserRequest(
+            first_name="John",
+            last_name="Doe",
+            email="john@example.com",
+            age=30,
+            gender=gender,
+        )
+    with pytest.raises(ValidationError, match="Invalid gender"):
+        UpdateUserRequest(last_name="Doe", gender=gender)
+
+
+def test_query_users_request_rejects_non_string_gender():
+    """Test that query genders must be a list of strings."""
+    with pytest.raises(ValidationError, match="Invalid gender '1'"):
+        QueryUsersRequest(gender=["male", 1])
+    with pytest.raises(ValidationError, match="Gender must be a list"):
+        QueryUsersRequest(gender="male")
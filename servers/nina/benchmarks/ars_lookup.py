@@ -0,0 +1,41 @@
+import timeit
+from pathlib import Path
+
+from nina.ars_code_service import ArsCodeService
+
+GEMEINDE_FILE = Path(__file__).parent.parent / "resources" / "GV100AD_31082025.txt"
+QUERIES = ["Blankenfelde-Mahlow", "München", "Muenchen", "Heide", "Unbekannt"]
+NUMBER = 200
+
+
+def linear_lookup(codes: dict[str, str], gemeinde: str) -> str:
+    for name, code in codes.items():
+        if name.lower() == gemeinde.lower():
+            return code
+    return ""
+
+
+def main() -> None:
+    municipalities = ArsCodeService.parse_records(GEMEINDE_FILE)
+    codes = {municipality.name: municipality.ars for municipality in municipalities}
+    index = ArsCodeService.build_index(municipalities)
+    build = (
+        timeit.timeit(lambda: ArsCodeService.build_index(municipalities), number=5) / 5
+    )
+    linear = timeit.timeit(
+        lambda: [linear_lookup(codes, query) for query in QUERIES], number=NUMBER
+    )
+    indexed = timeit.timeit(
+        lambda: [ArsCodeService.lookup(index, query) for query in QUERIES],
+        number=NUMBER,
+    )
+    calls = NUMBER * len(QUERIES)
+    print(f"entries:        {len(municipalities)} records, {len(index)} keys")
+    print(f"index build:    {build * 1e3:.2f} ms")
+    print(f"linear lookup:  {linear / calls * 1e6:.2f} µs/call")
+    print(f"indexed lookup: {indexed / calls * 1e6:.2f} µs/call")
+    print(f"speedup:        {linear / indexed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import tempfile
+import timeit
+from pathlib import Path
+
+from nina.ars_code_service import ArsCodeService
+from nina.ars_snapshot import load_municipalities, write_snapshot, source_digest
+
+GEMEINDE_FILE = Path(__file__).parent.parent / "resources" / "GV100AD_31082025.txt"
+NUMBER = 20
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        target = Path(directory) / "gv100ad.bin"
+        municipalities = ArsCodeService.parse_records(GEMEINDE_FILE)
+        write_snapshot(municipalities, source_digest(GEMEINDE_FILE), target)
+
+        parse = timeit.timeit(
+            lambda: ArsCodeService.parse_records(GEMEINDE_FILE), number=NUMBER
+        )
+        load = timeit.timeit(
+            lambda: load_municipalities(GEMEINDE_FILE, target), number=NUMBER
+        )
+        print(f"records:       {len(municipalities)}")
+        print(f"text size:     {GEMEINDE_FILE.stat().st_size / 1024:.0f} KiB")
+        print(f"snapshot size: {target.stat().st_size / 1024:.0f} KiB")
+        print(f"text parse:    {parse / NUMBER * 1e3:.2f} ms")
+        print(f"snapshot load: {load / NUMBER * 1e3:.2f} ms (incl. source hash)")
+
+
+if __name__ == "__main__":
+    main()
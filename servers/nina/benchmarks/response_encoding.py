@@ -0,0 +1,60 @@
+import json
+import random
+import timeit
+from dataclasses import asdict
+
+from nina.encoding import encode_groups
+from nina.warning_store import PROVIDERS, StoredWarning
+
+REGIONS = 400
+WARNINGS_PER_REGION = 5
+NUMBER = 20
+
+
+def grouped_warnings(rng: random.Random) -> dict[str, list[StoredWarning]]:
+    groups = {}
+    for region in range(REGIONS):
+        ars = f"{region:05d}0000000"
+        groups[ars] = [
+            StoredWarning(
+                id=f"{provider}.{region}.{number}",
+                version=rng.randint(1, 5),
+                provider=provider,
+                severity=rng.choice(["Minor", "Moderate", "Severe", "Extreme"]),
+                type="Alert",
+                start_date="2025-08-31T12:00:00+02:00",
+                title=rng.choice(["Sturmböen", "Starkregen", "Glätte", "Hitze"]),
+                ars=[ars],
+            )
+            for number, provider in enumerate(
+                rng.choices(PROVIDERS, k=WARNINGS_PER_REGION)
+            )
+        ]
+    return groups
+
+
+def serialize(groups: dict[str, list[StoredWarning]], response_format: str) -> str:
+    encoded = encode_groups(groups, "query_ars", response_format)
+    if response_format == "json":
+        encoded = {ars: [asdict(w) for w in items] for ars, items in encoded.items()}
+    return json.dumps(encoded, ensure_ascii=False, separators=(",", ":"))
+
+
+def main() -> None:
+    groups = grouped_warnings(random.Random(42))
+    baseline = len(serialize(groups, "json").encode())
+    print(f"{REGIONS * WARNINGS_PER_REGION} warnings in {REGIONS} regions")
+    for response_format in ("json", "table", "csv"):
+        size = len(serialize(groups, response_format).encode())
+        seconds = (
+            timeit.timeit(lambda: serialize(groups, response_format), number=NUMBER)  # noqa: B023
+            / NUMBER
+        )
+        print(
+            f"{response_format:>5}: {size:>8} bytes ({size / baseline:5.0%}), "
+            f"{seconds * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import math
+import random
+import timeit
+
+from nina.spatial_index import Location, SpatialIndex, contains, polygons_from_geojson
+
+WARNINGS = 500
+LOCATIONS = 20_000
+VERTICES = 64
+NUMBER = 3
+
+
+def warning_polygon(rng: random.Random) -> dict:
+    lon, lat = rng.uniform(6, 15), rng.uniform(47.5, 55)
+    radius = rng.uniform(0.05, 0.8)
+    ring = [
+        [
+            lon + radius * math.cos(2 * math.pi * i / VERTICES),
+            lat + radius * math.sin(2 * math.pi * i / VERTICES),
+        ]
+        for i in range(VERTICES + 1)
+    ]
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def linear_match(shapes: dict, locations: list[Location]) -> dict[str, list[str]]:
+    return {
+        location.id: [
+            warning_id
+            for warning_id, polygons in shapes.items()
+            if any(contains(rings, location.lon, location.lat) for rings in polygons)
+        ]
+        for location in locations
+    }
+
+
+def main() -> None:
+    rng = random.Random(1)
+    geometries = {f"w{i}": warning_polygon(rng) for i in range(WARNINGS)}
+    locations = [
+        Location(str(i), rng.uniform(47.5, 55), rng.uniform(6, 15))
+        for i in range(LOCATIONS)
+    ]
+    shapes = {key: polygons_from_geojson(value) for key, value in geometries.items()}
+
+    def build() -> SpatialIndex:
+        index = SpatialIndex()
+        for warning_id, geometry in geometries.items():
+            index.add(warning_id, geometry)
+        return index
+
+    index = build()
+    build_time = timeit.timeit(build, number=NUMBER) / NUMBER
+    indexed = timeit.timeit(lambda: index.match(locations), number=NUMBER) / NUMBER
+    sample = locations[: LOCATIONS // 20]
+    linear = timeit.timeit(lambda: linear_match(shapes, sample), number=1) * 20
+    print(f"input:          {WARNINGS} polygons, {LOCATIONS} locations")
+    print(f"index build:    {build_time * 1e3:.2f} ms")
+    print(f"linear match:   {linear * 1e3:.0f} ms (extrapolated)")
+    print(f"indexed match:  {indexed * 1e3:.0f} ms")
+    print(f"speedup:        {linear / indexed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
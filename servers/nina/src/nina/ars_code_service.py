@@ -1,16 +1,45 @@
+import json
+from dataclasses import dataclass
+from operator import itemgetter
+from os.path import commonprefix
 from pathlib import Path
 from typing import Dict
 
+UMLAUT_TABLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue"})
+
+
+@dataclass(slots=True)
+class Municipality:
+    name: str
+    ars: str
+    land: str
+    regierungsbezirk: str
+    kreis: str
+    postal_code: str
+    # 12-digit ARS with the Gemeindeverband, as used by the NINA warnings;
+    # ars is the 8-digit AGS.
+    full_ars: str = ""
+
 
 class ArsCodeService:
     TYPE_START = 0
     TYPE_END = 2
     ARS_START = 10
     ARS_END = 18
+    LAND_END = 12
+    REGIERUNGSBEZIRK_END = 13
+    KREIS_END = 15
+    VERBAND_START = 18
+    VERBAND_END = 22
     MUNICIPALITY_START = 22
     MUNICIPALITY_END = 72
+    POSTAL_CODE_START = 165
+    POSTAL_CODE_END = 170
     MIN_LINE_LENGTH = MUNICIPALITY_END
 
+    LAND_RECORD_TYPE = "10"
+    REGIERUNGSBEZIRK_RECORD_TYPE = "20"
+    KREIS_RECORD_TYPE = "40"
     TARGET_RECORD_TYPE = "60"
 
     @staticmethod
@@ -19,26 +48,198 @@ class ArsCodeService:
 
         Returns dict with municipality name as key and ARS as value.
         """
-        result: Dict[str, str] = {}
+        return {
+            municipality.name: municipality.ars
+            for municipality in ArsCodeService.parse_records(file_path)
+        }
+
+    @staticmethod
+    def parse_records(file_path: str | Path) -> list[Municipality]:
+        """Parse AGS text file into municipality records.
+
+        Every municipality is kept, including those sharing a name, together
+        with the names of its Land, Regierungsbezirk and Kreis.
+        """
+        result: list[Municipality] = []
 
         if not file_path.exists():
-            return {}
+            return []
+
+        regions: Dict[str, str] = {}
+        region_ends = {
+            ArsCodeService.LAND_RECORD_TYPE: ArsCodeService.LAND_END,
+            ArsCodeService.KREIS_RECORD_TYPE: ArsCodeService.KREIS_END,
+            ArsCodeService.REGIERUNGSBEZIRK_RECORD_TYPE: (
+                ArsCodeService.REGIERUNGSBEZIRK_END
+            ),
+        }
 
-        with open(file_path, "r", encoding="utf-8") as file:
+        with open(file_path, "r", encoding="utf-8-sig") as file:
             for line in file:
-                if (
-                    len(line) >= ArsCodeService.MIN_LINE_LENGTH
-                    and line[ArsCodeService.TYPE_START : ArsCodeService.TYPE_END]
-                    == ArsCodeService.TARGET_RECORD_TYPE
-                ):
-                    ars = line[
-                        ArsCodeService.ARS_START : ArsCodeService.ARS_END
-                    ].strip()
-                    municipality = line[
-                        ArsCodeService.MUNICIPALITY_START : ArsCodeService.MUNICIPALITY_END
-                    ].strip()
-
-                    if municipality:  # Only add if municipality name exists
-                        result[municipality] = ars
+                if len(line) < ArsCodeService.MIN_LINE_LENGTH:
+                    continue
+
+                record_type = line[ArsCodeService.TYPE_START : ArsCodeService.TYPE_END]
+                name = line[
+                    ArsCodeService.MUNICIPALITY_START : ArsCodeService.MUNICIPALITY_END
+                ].strip()
+
+                if record_type in region_ends:
+                    regions[_region_key(line, region_ends[record_type])] = name
+                elif record_type == ArsCodeService.TARGET_RECORD_TYPE and name:
+                    result.append(_parse_municipality(line, name, regions))
 
         return result
+
+    @staticmethod
+    def normalize(name: str) -> list[str]:
+        """Return the lookup keys of a municipality name, most specific first.
+
+        Keys are the casefolded name, its umlaut-folded form ("München" and
+        "Muenchen" share a key) and both forms without a designation suffix
+        such as ", Stadt" or ", Landeshauptstadt".
+        """
+        exact = " ".join(name.split()).casefold()
+        base = exact.rsplit(",", 1)[0].rstrip()
+        return [
+            exact,
+            exact.translate(UMLAUT_TABLE),
+            base,
+            base.translate(UMLAUT_TABLE),
+        ]
+
+    @staticmethod
+    def build_index(
+        municipalities: list[Municipality],
+    ) -> Dict[str, list[Municipality]]:
+        """Build a normalized, multi-valued municipality index for O(1) lookups.
+
+        Each key lists every municipality it matches, exact name matches
+        before folded or suffix-stripped ones.
+        """
+        entries = []
+        for municipality in municipalities:
+            keys = ArsCodeService.normalize(municipality.name)
+            for key in dict.fromkeys(keys):
+                entries.append((keys.index(key), key, municipality))
+        entries.sort(key=itemgetter(0))
+
+        index: Dict[str, list[Municipality]] = {}
+        for _, key, municipality in entries:
+            index.setdefault(key, []).append(municipality)
+        return index
+
+    @staticmethod
+    def lookup(index: Dict[str, list[Municipality]], name: str) -> list[Municipality]:
+        """Return all municipalities matching a name, best match first."""
+        for key in ArsCodeService.normalize(name):
+            if key in index:
+                return index[key]
+        return []
+
+    @staticmethod
+    def disambiguate(
+        candidates: list[Municipality], postal_code: str = "", district: str = ""
+    ) -> list[Municipality]:
+        """Narrow down municipalities sharing a name by postal code or district.
+
+        A postal code keeps the candidates sharing the longest postal code
+        prefix with it. A district matches the name of the Kreis,
+        Regierungsbezirk or Land.
+        """
+        if district:
+            folded = ArsCodeService.normalize(district)[1]
+            candidates = [
+                candidate
+                for candidate in candidates
+                if any(
+                    folded in ArsCodeService.normalize(region)[1]
+                    for region in (
+                        candidate.kreis,
+                        candidate.regierungsbezirk,
+                        candidate.land,
+                    )
+                )
+            ]
+
+        postal_code = postal_code.strip()
+        if postal_code and candidates:
+            prefixes = [
+                len(commonprefix([candidate.postal_code, postal_code]))
+                for candidate in candidates
+            ]
+            best = max(prefixes)
+            candidates = (
+                [
+                    candidate
+                    for candidate, prefix in zip(candidates, prefixes, strict=True)
+                    if prefix == best
+                ]
+                if best
+                else []
+            )
+
+        return candidates
+
+    @staticmethod
+    def paginate(
+        municipalities: list[Municipality], prefix: str, page_size: int
+    ) -> Dict[str, str]:
+        """Pre-encode the municipalities whose ARS starts with prefix as pages.
+
+        Returns the JSON pages keyed by cursor: the first page by "", every
+        other page by the last ARS of the page before, which each page
+        carries as "next_cursor".
+        """
+        codes = sorted(
+            (municipality.ars, municipality.name)
+            for municipality in municipalities
+            if municipality.ars.startswith(prefix)
+        )
+        pages: Dict[str, str] = {}
+        cursor = ""
+        for start in range(0, max(len(codes), 1), page_size):
+            chunk = codes[start : start + page_size]
+            next_cursor = chunk[-1][0] if start + page_size < len(codes) else None
+            pages[cursor] = json.dumps(
+                {
+                    "prefix": prefix,
+                    "total": len(codes),
+                    "codes": [{"ars": ars, "gemeinde": name} for ars, name in chunk],
+                    "next_cursor": next_cursor,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            cursor = next_cursor or ""
+        return pages
+
+
+def _region_key(line: str, end: int) -> str:
+    return line[ArsCodeService.ARS_START : end]
+
+
+def _parse_municipality(line: str, name: str, regions: Dict[str, str]) -> Municipality:
+    postal_code = line[
+        ArsCodeService.POSTAL_CODE_START : ArsCodeService.POSTAL_CODE_END
+    ]
+    return Municipality(
+        name=name,
+        ars=line[ArsCodeService.ARS_START : ArsCodeService.ARS_END].strip(),
+        land=regions.get(_region_key(line, ArsCodeService.LAND_END), ""),
+        regierungsbezirk=regions.get(
+            _region_key(line, ArsCodeService.REGIERUNGSBEZIRK_END), ""
+        ),
+        kreis=regions.get(_region_key(line, ArsCodeService.KREIS_END), ""),
+        postal_code=postal_code.strip(),
+        full_ars=_full_ars(line),
+    )
+
+
+def _full_ars(line: str) -> str:
+    """Build the 12-digit ARS: Kreis, Gemeindeverband, then Gemeinde digits."""
+    return (
+        line[ArsCodeService.ARS_START : ArsCodeService.KREIS_END]
+        + line[ArsCodeService.VERBAND_START : ArsCodeService.VERBAND_END]
+        + line[ArsCodeService.KREIS_END : ArsCodeService.ARS_END]
+    )
@@ -0,0 +1,116 @@
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict
+
+from nina.ars_code_service import ArsCodeService, Municipality
+
+TERMINAL = ""
+
+
+@dataclass(slots=True)
+class SearchHit:
+    name: str
+    ars: str
+    land: str
+    kreis: str
+    score: float
+
+
+class MunicipalitySearch:
+    """Fuzzy and prefix search over municipality names.
+
+    Names are indexed by their umlaut-folded form without designation suffix,
+    in a prefix trie and in a trigram index. Prefix matches score by how much
+    of the name the query covers, trigram matches by their Dice coefficient.
+    """
+
+    def __init__(self, municipalities: list[Municipality]):
+        self.keys: list[str] = []
+        self.municipalities: list[list[Municipality]] = []
+        self.trie: Dict[str, Dict] = {}
+        self.trigrams: Dict[str, list[int]] = {}
+        self.trigram_counts: list[int] = []
+
+        key_ids: Dict[str, int] = {}
+        for municipality in municipalities:
+            key = _search_key(municipality.name)
+            if key not in key_ids:
+                key_ids[key] = len(self.keys)
+                self.keys.append(key)
+                self.municipalities.append([])
+                self._insert(key, key_ids[key])
+            self.municipalities[key_ids[key]].append(municipality)
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        key = _search_key(query)
+        if not key:
+            return []
+
+        scores: Dict[int, float] = {}
+        for key_id in self._prefix_matches(key):
+            scores[key_id] = 0.5 + 0.5 * len(key) / len(self.keys[key_id])
+
+        query_trigrams = _trigrams(key)
+        shared = Counter(
+            key_id
+            for trigram in query_trigrams
+            for key_id in self.trigrams.get(trigram, ())
+        )
+        for key_id, count in shared.items():
+            dice = 2 * count / (len(query_trigrams) + self.trigram_counts[key_id])
+            scores[key_id] = max(scores.get(key_id, 0.0), dice)
+
+        best = heapq.nsmallest(
+            limit, scores.items(), key=lambda item: (-item[1], self.keys[item[0]])
+        )
+        hits = [
+            SearchHit(
+                name=municipality.name,
+                ars=municipality.ars,
+                land=municipality.land,
+                kreis=municipality.kreis,
+                score=round(score, 3),
+            )
+            for key_id, score in best
+            for municipality in self.municipalities[key_id]
+        ]
+        return hits[:limit]
+
+    def _insert(self, key: str, key_id: int) -> None:
+        node = self.trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(TERMINAL, []).append(key_id)
+
+        trigrams = _trigrams(key)
+        self.trigram_counts.append(len(trigrams))
+        for trigram in trigrams:
+            self.trigrams.setdefault(trigram, []).append(key_id)
+
+    def _prefix_matches(self, prefix: str) -> list[int]:
+        node = self.trie
+        for char in prefix:
+            if char not in node:
+                return []
+            node = node[char]
+
+        matches: list[int] = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char == TERMINAL:
+                    matches.extend(child)
+                else:
+                    stack.append(child)
+        return matches
+
+
+def _search_key(name: str) -> str:
+    return ArsCodeService.normalize(name)[3]
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
@@ -0,0 +1,130 @@
+import argparse
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from dataclasses import astuple, fields
+from pathlib import Path
+
+from nina.ars_code_service import ArsCodeService, Municipality
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GV100AD\0"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<8sHB32sII")
+BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+FIELD_COUNT = len(fields(Municipality))
+
+
+def source_digest(source: Path) -> bytes:
+    return hashlib.sha256(source.read_bytes()).digest()
+
+
+def snapshot_path(source: Path) -> Path:
+    return source.with_suffix(".bin")
+
+
+def write_snapshot(
+    municipalities: list[Municipality], digest: bytes, target: Path
+) -> None:
+    """Write municipalities as a versioned, memory-mappable snapshot.
+
+    Layout: header, record table of string ids, NUL-terminated string pool.
+    Repeated strings such as Land or Kreis names are stored only once.
+    """
+    string_ids: dict[str, int] = {}
+    rows = array("I")
+    for municipality in municipalities:
+        for value in astuple(municipality):
+            rows.append(string_ids.setdefault(value, len(string_ids)))
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, BYTE_ORDER, digest, len(municipalities), len(string_ids)
+    )
+    temporary = target.with_suffix(f"{target.suffix}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as file:
+        file.write(header)
+        file.write(rows.tobytes())
+        file.write("".join(f"{value}\0" for value in string_ids).encode("utf-8"))
+    os.replace(temporary, target)
+
+
+def read_snapshot(target: Path, digest: bytes) -> list[Municipality] | None:
+    """Read a snapshot, or return None if it is missing or out of date."""
+    try:
+        with (
+            open(target, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return _decode(view, digest)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def load_municipalities(source: Path, target: Path | None = None) -> list[Municipality]:
+    """Load municipalities from the snapshot, rebuilding it if the source changed."""
+    if not source.exists():
+        return []
+
+    target = target or snapshot_path(source)
+    digest = source_digest(source)
+    municipalities = read_snapshot(target, digest)
+    if municipalities is not None:
+        return municipalities
+
+    logger.info(f"ARS-Snapshot wird neu erstellt: {target}")
+    municipalities = ArsCodeService.parse_records(source)
+    try:
+        write_snapshot(municipalities, digest, target)
+    except OSError as e:
+        logger.warning(f"ARS-Snapshot konnte nicht geschrieben werden: {e}")
+    return municipalities
+
+
+def _decode(view: memoryview, digest: bytes) -> list[Municipality] | None:
+    magic, version, byte_order, stored_digest, count, string_count = HEADER.unpack_from(
+        view
+    )
+    if (magic, version, byte_order, stored_digest) != (
+        MAGIC,
+        FORMAT_VERSION,
+        BYTE_ORDER,
+        digest,
+    ):
+        return None
+
+    rows_start = HEADER.size
+    pool_start = rows_start + count * FIELD_COUNT * 4
+    with view[rows_start:pool_start] as table, table.cast("I") as rows:
+        ids = rows.tolist()
+    with view[pool_start:] as pool:
+        strings = str(pool, "utf-8").split("\0")
+    if strings.pop() or len(strings) != string_count:
+        return None
+
+    values = [strings[i] for i in ids]
+    return list(
+        map(Municipality, *(values[i::FIELD_COUNT] for i in range(FIELD_COUNT)))
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile a GV100AD snapshot.")
+    parser.add_argument("source", type=Path, help="GV100AD text file")
+    parser.add_argument("target", type=Path, nargs="?", help="snapshot file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    target = args.target or snapshot_path(args.source)
+    municipalities = ArsCodeService.parse_records(args.source)
+    write_snapshot(municipalities, source_digest(args.source), target)
+    logger.info(f"{len(municipalities)} Gemeinden nach {target} geschrieben")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any, Dict
+
+import httpx
+
+MAX_CONCURRENCY = 10
+KREIS_ARS_LENGTH = 5
+DASHBOARD_ARS_LENGTH = 12
+
+
+def dashboard_ars(ars: str) -> str:
+    """Return the Kreis-level ARS expected by the dashboard endpoint.
+
+    The NINA dashboard only serves data per Kreis, so the last seven digits
+    of the 12-digit ARS are replaced with zeros.
+    """
+    return ars.strip()[:KREIS_ARS_LENGTH].ljust(DASHBOARD_ARS_LENGTH, "0")
+
+
+async def fetch_dashboards(
+    client: httpx.AsyncClient,
+    ars_codes: list[str],
+    concurrency: int = MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Fetch the dashboards of many ARS codes concurrently.
+
+    Codes are deduplicated on Kreis level and fetched with at most
+    `concurrency` requests in flight. The result is keyed by Kreis ARS; a
+    failed request yields {"error": ...} for its ARS instead of failing all.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(ars: str) -> tuple[str, Any]:
+        async with semaphore:
+            try:
+                response = await client.get(f"/dashboard/{ars}.json")
+                response.raise_for_status()
+                return ars, response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                return ars, {"error": str(e)}
+
+    unique = dict.fromkeys(dashboard_ars(ars) for ars in ars_codes if ars.strip())
+    return dict(await asyncio.gather(*(fetch(ars) for ars in unique)))
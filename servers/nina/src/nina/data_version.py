@@ -0,0 +1,58 @@
+import asyncio
+import logging
+
+import httpx
+
+from nina.http_cache import CachingTransport
+
+logger = logging.getLogger(__name__)
+
+DATA_VERSION_PATH = "/dynamic/version/dataVersion.json"
+POLL_INTERVAL = 30.0
+VERSIONED_PATHS = (
+    "*/dashboard/*",
+    "*/mapData.json",
+    "*/appdata/covid/*",
+    "*/appdata/gsb/eventCodes/*",
+)
+
+
+async def fetch_data_version(client: httpx.AsyncClient) -> str:
+    response = await client.get(DATA_VERSION_PATH)
+    response.raise_for_status()
+    data = response.json()
+    return f"{data['version']}:{data['hash']}"
+
+
+async def refresh_cache(
+    client: httpx.AsyncClient, cache: CachingTransport, known: str | None
+) -> str | None:
+    """Invalidate versioned responses if the NINA data version changed.
+
+    Returns the current data version, or the known one if it could not be
+    fetched, so that a failing check never drops the cache.
+    """
+    try:
+        version = await fetch_data_version(client)
+    except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"⚠️ Datenversion konnte nicht abgerufen werden: {e}")
+        return known
+
+    if known is not None and version != known:
+        dropped = sum(cache.invalidate(pattern) for pattern in VERSIONED_PATHS)
+        logger.info(f"🔄 Neue Datenversion {version}: {dropped} Einträge verworfen")
+    return version
+
+
+async def poll_data_version(
+    client: httpx.AsyncClient,
+    cache: CachingTransport,
+    interval: float = POLL_INTERVAL,
+) -> None:
+    version = None
+    while True:
+        try:
+            version = await refresh_cache(client, cache, version)
+        except Exception:
+            logger.exception("❌ Datenversion konnte nicht geprüft werden")
+        await asyncio.sleep(interval)
@@ -0,0 +1,36 @@
+import csv
+import io
+from dataclasses import astuple, fields
+from typing import Any, Dict, Literal
+
+ResponseFormat = Literal["json", "table", "csv"]
+
+
+def encode_groups(
+    groups: Dict[str, list[Any]], key: str, response_format: ResponseFormat = "json"
+) -> Dict[str, Any] | str:
+    """Encode dataclass rows grouped by key without repeating field names.
+
+    "table" returns one header row, starting with the group key column, and
+    one value array per row; "csv" the same as CSV text with list values
+    joined by spaces. "json" keeps the groups as they are.
+    """
+    if response_format == "json":
+        return groups
+    rows = [[group, *astuple(row)] for group, items in groups.items() for row in items]
+    columns = [key]
+    for items in groups.values():
+        if items:
+            columns.extend(field.name for field in fields(items[0]))
+            break
+    if response_format == "table":
+        return {"columns": columns, "rows": rows}
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(
+        [" ".join(value) if isinstance(value, list) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue()
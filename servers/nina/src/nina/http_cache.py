@@ -0,0 +1,165 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatch
+from typing import Dict
+
+import httpx
+
+DEFAULT_TTL = 60.0
+MAX_ENTRIES = 512
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    expires_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """HTTP transport caching GET responses in an LRU bounded memory cache.
+
+    Freshness follows Cache-Control (max-age, no-cache, no-store) unless a
+    TTL override matches the request path. Stale entries with an ETag or
+    Last-Modified header are revalidated with a conditional request.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        ttl_overrides: Dict[str, float] | None = None,
+        max_entries: int = MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.default_ttl = default_ttl
+        self.ttl_overrides = ttl_overrides or {}
+        self.max_entries = max_entries
+        self.clock = clock
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.stats = CacheStats()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self.transport.handle_async_request(request)
+
+        key = str(request.url)
+        entry = self.entries.get(key)
+        if entry and self.clock() < entry.expires_at:
+            self.entries.move_to_end(key)
+            self.stats.hits += 1
+            return _to_response(entry, request)
+
+        if entry and entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self.transport.handle_async_request(request)
+
+        if entry and response.status_code == httpx.codes.NOT_MODIFIED:
+            await response.aclose()
+            entry.headers.update(_revalidated_headers(response.headers))
+            entry.expires_at = self.clock() + self._ttl(request, entry.headers)
+            self.entries.move_to_end(key)
+            self.stats.revalidations += 1
+            return _to_response(entry, request)
+
+        self.stats.misses += 1
+        if response.status_code != httpx.codes.OK or _no_store(response.headers):
+            self.entries.pop(key, None)
+            return response
+
+        content = b"".join([chunk async for chunk in response.stream])
+        await response.aclose()
+        entry = CacheEntry(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=content,
+            expires_at=self.clock() + self._ttl(request, response.headers),
+        )
+        self._store(key, entry)
+        return _to_response(entry, request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def invalidate(self, pattern: str = "*") -> int:
+        """Drop all entries whose URL path matches the glob pattern."""
+        keys = [key for key in self.entries if fnmatch(httpx.URL(key).path, pattern)]
+        for key in keys:
+            del self.entries[key]
+        return len(keys)
+
+    def _ttl(self, request: httpx.Request, headers: httpx.Headers) -> float:
+        for pattern, ttl in self.ttl_overrides.items():
+            if fnmatch(request.url.path, pattern):
+                return ttl
+
+        directives = _cache_control(headers)
+        if "no-cache" in directives:
+            return 0.0
+        for directive in ("s-maxage", "max-age"):
+            if directives.get(directive, "").isdigit():
+                return float(directives[directive])
+        return self.default_ttl
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+def _to_response(entry: CacheEntry, request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        status_code=entry.status_code,
+        headers=entry.headers,
+        content=entry.content,
+        request=request,
+    )
+
+
+def _cache_control(headers: httpx.Headers) -> Dict[str, str]:
+    directives: Dict[str, str] = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def _no_store(headers: httpx.Headers) -> bool:
+    return "no-store" in _cache_control(headers)
+
+
+def _revalidated_headers(headers: httpx.Headers) -> Dict[str, str]:
+    return {
+        name: headers[name]
+        for name in ("cache-control", "etag", "last-modified", "expires", "date")
+        if name in headers
+    }
@@ -1,36 +1,165 @@
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
 import httpx
 import yaml
 from fastmcp import FastMCP
 
-from nina.ars_code_service import ArsCodeService
+from nina.ars_code_service import ArsCodeService, Municipality
+from nina.ars_search import MunicipalitySearch, SearchHit
+from nina.ars_snapshot import load_municipalities
+from nina.dashboard_service import KREIS_ARS_LENGTH, fetch_dashboards
+from nina.data_version import DATA_VERSION_PATH, poll_data_version
+from nina.encoding import ResponseFormat, encode_groups
+from nina.http_cache import CachingTransport
+from nina.spatial_index import Location
+from nina.warning_store import AGS_LENGTH, WarningStore, poll_warnings
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://warnung.bund.de/api31"
 OPENAPI_SPEC_PATH = Path(__file__).parent.parent.parent / "openapi.yaml"
-GEMEINDE_FILE = Path(__file__).parent.parent / "resources" / "GV100AD_31082025.txt"
+SEARCH_LIMIT = 10
+PAGE_SIZE = 500
+ALL_REGIONS = "DE"
+CACHE_TTL_OVERRIDES = {
+    DATA_VERSION_PATH: 0.0,
+    "*/dashboard/*": 3600.0,
+    "*/mapData.json": 3600.0,
+    "*/appdata/*": 3600.0,
+}
+RESPONSE_FORMAT_DESCRIPTION = (
+    "Mit response_format 'table' kommen eine Kopfzeile 'columns' und je Warnung "
+    "eine Werteliste, mit 'csv' dieselben Zeilen als CSV-Text; beides ist "
+    "kleiner als das Standardformat 'json'."
+)
+GEMEINDE_FILE = (
+    Path(__file__).parent.parent.parent / "resources" / "GV100AD_31082025.txt"
+)
 
 with open(OPENAPI_SPEC_PATH, "r", encoding="utf-8") as f:
     openapi_spec = yaml.safe_load(f)
 
+http_cache = CachingTransport(ttl_overrides=CACHE_TTL_OVERRIDES)
+http_client = httpx.AsyncClient(base_url=BASE_URL, transport=http_cache)
+warning_store = WarningStore()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    pollers = [
+        asyncio.create_task(poll_data_version(http_client, http_cache)),
+        asyncio.create_task(poll_warnings(http_client, warning_store)),
+    ]
+    try:
+        yield
+    finally:
+        for poller in pollers:
+            poller.cancel()
+        with suppress(asyncio.CancelledError):
+            await asyncio.gather(*pollers)
+
+
 mcp = FastMCP.from_openapi(
-    openapi_spec=openapi_spec, client=httpx.AsyncClient(base_url=BASE_URL)
+    openapi_spec=openapi_spec, client=http_client, lifespan=lifespan
+)
+
+
+@mcp.tool(
+    name="getDashboards",
+    description="Meldungsübersicht für mehrere ARS in einem Aufruf. Die ARS "
+    "werden auf Kreisebene zusammengefasst und parallel abgefragt; das "
+    "Ergebnis ist nach Kreis-ARS (12-stellig) geordnet.",
+    tags={"Warnings"},
 )
+async def get_dashboards(ars_codes: list[str]) -> Dict[str, Any]:
+    return await fetch_dashboards(http_client, ars_codes)
+
+
+@mcp.tool(
+    name="getWarnings",
+    description="Aktuelle Warnungen aller Warnsysteme (Katwarn, Biwapp, MoWaS, "
+    "DWD, LHP, Polizei) für mehrere ARS aus dem lokalen Warnungsspeicher, ohne "
+    "Aufrufe der NINA API. Optional gefiltert nach Warnsystem (z.B. 'dwd') und "
+    "Schweregrad (z.B. 'Severe'); das Ergebnis ist nach ARS geordnet. Neben "
+    "12-stelligen ARS werden 8-stellige Gemeindeschlüssel (AGS) angenommen. "
+    "Ist der Speicher noch nicht geladen oder veraltet, gibt es einen Fehler "
+    f"statt einer leeren Liste. {RESPONSE_FORMAT_DESCRIPTION}",
+    tags={"Warnings"},
+)
+async def get_warnings(
+    ars_codes: list[str],
+    provider: str = "",
+    severity: str = "",
+    response_format: ResponseFormat = "json",
+) -> Dict[str, Any] | str:
+    await warning_store.ensure_current()
+    warnings = {
+        ars: warning_store.find(_to_full_ars(ars), provider, severity)
+        for ars in dict.fromkeys(ars_codes)
+    }
+    return encode_groups(warnings, "query_ars", response_format)
+
+
+@mcp.tool(
+    name="getWarningsForLocations",
+    description="Ordnet viele Standorte (id, lat, lon in WGS84) in einem Aufruf "
+    "den aktuellen Warnungen zu, deren Warngebiet (GeoJSON-Polygon) den "
+    "Standort enthält. Das Ergebnis ist nach Standort-id geordnet. Ist der "
+    "Warnungsspeicher noch nicht geladen oder veraltet, gibt es einen Fehler. "
+    f"{RESPONSE_FORMAT_DESCRIPTION}",
+    tags={"Warnings"},
+)
+async def get_warnings_for_locations(
+    locations: list[Location], response_format: ResponseFormat = "json"
+) -> Dict[str, Any] | str:
+    await warning_store.ensure_current()
+    return encode_groups(
+        warning_store.find_at(locations), "location_id", response_format
+    )
 
 
 @mcp.resource(
     uri="ars://codes",
     name="amtliche_regionalschlüssel",
     description="Gibt alle Amtlichen Regionalschlüssel (ARS) zurück.",
+    mime_type="application/json",
     tags={"ARS"},
 )
-async def get_ars_codes() -> Dict[str, str]:
-    return _get_ars_codes()
+async def get_ars_codes() -> str:
+    return _get_encoded_ars_codes()
+
+
+@mcp.resource(
+    uri="ars://codes/region/{prefix}",
+    name="amtliche_regionalschlüssel_nach_region",
+    description="Gibt die erste Seite der Amtlichen Regionalschlüssel (ARS) "
+    "zurück, die mit dem Präfix beginnen (Land z.B. '09', Regierungsbezirk "
+    f"'091', Kreis '09162', '{ALL_REGIONS}' für alle). Weitere Seiten über "
+    "ars://codes/region/{prefix}/{next_cursor}.",
+    mime_type="application/json",
+    tags={"ARS"},
+)
+async def get_ars_codes_by_region(prefix: str) -> str:
+    return _get_ars_page(prefix, "")
+
+
+@mcp.resource(
+    uri="ars://codes/region/{prefix}/{cursor}",
+    name="amtliche_regionalschlüssel_seite",
+    description="Gibt die Seite der Amtlichen Regionalschlüssel (ARS) mit dem "
+    "Präfix nach dem Cursor 'next_cursor' der vorherigen Seite zurück.",
+    mime_type="application/json",
+    tags={"ARS"},
+)
+async def get_ars_codes_page(prefix: str, cursor: str) -> str:
+    return _get_ars_page(prefix, cursor)
 
 
 @mcp.resource(
@@ -40,29 +169,88 @@ async def get_ars_codes() -> Dict[str, str]:
     tags={"ARS"},
 )
 async def get_ars_code_by_municipality(gemeinde: str) -> str:
-    codes = _get_ars_codes()
-    for name, code in codes.items():
-        if name.lower() == gemeinde.lower():
-            return code
-    return ""
+    candidates = ArsCodeService.lookup(_get_ars_index(), gemeinde)
+    return candidates[0].ars if candidates else ""
+
+
+@mcp.resource(
+    uri="ars://gemeinden/{gemeinde}",
+    name="gemeinden",
+    description="Gibt alle Gemeinden mit diesem Namen samt ARS, Land, "
+    "Regierungsbezirk, Kreis und Postleitzahl zurück.",
+    tags={"ARS"},
+)
+async def get_municipalities(gemeinde: str) -> list[Municipality]:
+    return ArsCodeService.lookup(_get_ars_index(), gemeinde)
+
+
+@mcp.resource(
+    uri="ars://gemeinden/{gemeinde}/plz/{postleitzahl}",
+    name="gemeinden_nach_postleitzahl",
+    description="Gibt die Gemeinden mit diesem Namen zurück, deren Postleitzahl "
+    "am besten zur angegebenen Postleitzahl passt.",
+    tags={"ARS"},
+)
+async def get_municipalities_by_postal_code(
+    gemeinde: str, postleitzahl: str
+) -> list[Municipality]:
+    return ArsCodeService.disambiguate(
+        ArsCodeService.lookup(_get_ars_index(), gemeinde), postal_code=postleitzahl
+    )
+
+
+@mcp.resource(
+    uri="ars://gemeinden/{gemeinde}/kreis/{kreis}",
+    name="gemeinden_nach_kreis",
+    description="Gibt die Gemeinden mit diesem Namen im angegebenen Kreis, "
+    "Regierungsbezirk oder Land zurück.",
+    tags={"ARS"},
+)
+async def get_municipalities_by_district(
+    gemeinde: str, kreis: str
+) -> list[Municipality]:
+    return ArsCodeService.disambiguate(
+        ArsCodeService.lookup(_get_ars_index(), gemeinde), district=kreis
+    )
+
+
+@mcp.resource(
+    uri="ars://search/{query}",
+    name="gemeindesuche",
+    description="Sucht Gemeinden per Präfix- und unscharfer Suche und gibt die "
+    f"besten {SEARCH_LIMIT} Treffer mit ARS und Score zurück.",
+    tags={"ARS"},
+)
+async def search_municipalities(query: str) -> list[SearchHit]:
+    return _get_municipality_search().search(query, SEARCH_LIMIT)
+
+
+@mcp.resource(
+    uri="nina://cache",
+    name="http_cache_statistik",
+    description="Gibt Treffer, Fehlschläge, Revalidierungen und Verdrängungen "
+    "des HTTP-Caches vor der NINA API zurück.",
+)
+async def get_cache_stats() -> Dict[str, int]:
+    return {**http_cache.stats.to_dict(), "entries": len(http_cache.entries)}
 
 
 @mcp.prompt(name="ars_lookup", description="ARS-Codes nachschlagen")
 async def ars_lookup_prompt(query: str = "") -> str:
     return f"""WICHTIGE ANWEISUNG FÜR GEMINI:
 
-Du hast Zugriff auf eine MCP-Ressource mit der URI: ars://codes
+Du hast Zugriff auf eine MCP-Ressource mit der URI: ars://search/{{query}}
 
-Diese Ressource enthält alle deutschen Amtlichen Regionalschlüssel.
+Diese Ressource durchsucht alle deutschen Amtlichen Regionalschlüssel und
+liefert die besten Treffer mit Score.
 
 VERWENDE AUSSCHLIESSLICH DIESE RESSOURCE - keine Websuche!
 
 Schritte:
-1. Lade die MCP-Ressource ars://codes
-2. Suche in den Daten nach: {query}
-3. Gib die Ergebnisse aus
+1. Lade die MCP-Ressource ars://search/{query}
+2. Gib die Ergebnisse aus
 
-Beginne JETZT mit dem Laden der Ressource ars://codes"""
+Beginne JETZT mit dem Laden der Ressource ars://search/{query}"""
 
 
 @mcp.prompt("zeige-notfall-warnungen")
@@ -70,25 +258,80 @@ async def emergency_response_prompt(country: str) -> str:
     return f"""Prüfe auf Notfall-Warnungen für alle Mitarbeiter am Standort {country}!
 
 DATENQUELLE:
-- Verwende ausschließlich die MCP-Ressource "ars://codes"
+- Verwende ausschließlich die MCP-Ressourcen "ars://gemeinden/..."
 - KEINE Websuche für ARS-Codes oder Gemeindedaten!
 
 1. Ermittle alle Mitarbeiter aus der Mitarbeiterdatenbank, die ihren Wohnsitz
    in Deutschland haben.
-2. Ermittle für jeden Wohnort den Amtliche Regionalschlüssel ARS.
-3. Suche mit dem ARS nach aktuellen Warnungen mit der NINA API.
+2. Ermittle für jeden Wohnort den 12-stelligen Amtlichen Regionalschlüssel
+   (Feld "full_ars") mit der Ressource
+   "ars://gemeinden/{{gemeinde}}/plz/{{postleitzahl}}".
+3. Suche mit allen ARS gemeinsam in einem Aufruf des Tools "getWarnings"
+   nach aktuellen Warnungen.
 4. Geben den Namen des Mitarbeiters mit Adresse und amtlicher Warnung aus.
 """
 
 
 @lru_cache(maxsize=1)
-def _get_ars_codes() -> Dict[str, str]:
+def _get_municipalities() -> list[Municipality]:
     try:
         logger.debug("ARS-Codes werden geladen...")
-        codes = ArsCodeService.parse_file(GEMEINDE_FILE)
-        logger.info(f"{len(codes)} ARS-Codes erfolgreich geladen")
-        return codes
+        municipalities = load_municipalities(GEMEINDE_FILE)
+        logger.info(f"{len(municipalities)} ARS-Codes erfolgreich geladen")
+        return municipalities
     except FileNotFoundError as e:
         raise RuntimeError(f"Gemeinde-Datei nicht gefunden: {GEMEINDE_FILE}") from e
     except Exception as e:
         raise RuntimeError(f"Fehler beim Parsen der ARS-Codes: {str(e)}") from e
+
+
+@lru_cache(maxsize=1)
+def _get_ars_codes() -> Dict[str, str]:
+    return {
+        municipality.name: municipality.ars for municipality in _get_municipalities()
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_full_ars_by_ags() -> Dict[str, str]:
+    return {
+        municipality.ars: municipality.full_ars
+        for municipality in _get_municipalities()
+    }
+
+
+def _to_full_ars(code: str) -> str:
+    """Convert an 8-digit AGS to its 12-digit ARS; unknown AGS to the Kreis."""
+    code = code.strip()
+    if len(code) != AGS_LENGTH:
+        return code
+    return _get_full_ars_by_ags().get(code, code[:KREIS_ARS_LENGTH])
+
+
+@lru_cache(maxsize=1)
+def _get_encoded_ars_codes() -> str:
+    return json.dumps(_get_ars_codes(), ensure_ascii=False, separators=(",", ":"))
+
+
+def _get_ars_page(prefix: str, cursor: str) -> str:
+    pages = _get_ars_pages("" if prefix == ALL_REGIONS else prefix)
+    if cursor not in pages:
+        raise ValueError(f"Ungültiger Cursor: {cursor}")
+    return pages[cursor]
+
+
+@lru_cache(maxsize=128)
+def _get_ars_pages(prefix: str) -> Dict[str, str]:
+    if prefix and not prefix.isdigit():
+        raise ValueError(f"Ungültiges ARS-Präfix: {prefix}")
+    return ArsCodeService.paginate(_get_municipalities(), prefix, PAGE_SIZE)
+
+
+@lru_cache(maxsize=1)
+def _get_ars_index() -> Dict[str, list[Municipality]]:
+    return ArsCodeService.build_index(_get_municipalities())
+
+
+@lru_cache(maxsize=1)
+def _get_municipality_search() -> MunicipalitySearch:
+    return MunicipalitySearch(_get_municipalities())
@@ -0,0 +1,130 @@
+import math
+from dataclasses import dataclass
+from typing import Any, Dict
+
+CELL_SIZE = 0.25
+
+Ring = list[tuple[float, float]]
+BoundingBox = tuple[float, float, float, float]
+
+
+@dataclass(slots=True)
+class Location:
+    id: str
+    lat: float
+    lon: float
+
+
+@dataclass(slots=True)
+class IndexedPolygon:
+    warning_id: str
+    rings: list[Ring]
+    bbox: BoundingBox
+
+
+def polygons_from_geojson(geojson: Dict[str, Any]) -> list[list[Ring]]:
+    """Collect the polygons of a GeoJSON object as lists of (lon, lat) rings.
+
+    Features, feature collections and geometry collections are flattened;
+    geometries other than Polygon and MultiPolygon are ignored.
+    """
+    kind = geojson.get("type")
+    if kind == "FeatureCollection":
+        return [
+            polygon
+            for feature in geojson.get("features", [])
+            for polygon in polygons_from_geojson(feature)
+        ]
+    if kind == "Feature":
+        return polygons_from_geojson(geojson.get("geometry") or {})
+    if kind == "GeometryCollection":
+        return [
+            polygon
+            for geometry in geojson.get("geometries", [])
+            for polygon in polygons_from_geojson(geometry)
+        ]
+    if kind == "Polygon":
+        return [_rings(geojson.get("coordinates", []))]
+    if kind == "MultiPolygon":
+        return [_rings(polygon) for polygon in geojson.get("coordinates", [])]
+    return []
+
+
+def bounding_box(rings: list[Ring]) -> BoundingBox:
+    lons = [lon for lon, _ in rings[0]]
+    lats = [lat for _, lat in rings[0]]
+    return min(lons), min(lats), max(lons), max(lats)
+
+
+def contains(rings: list[Ring], lon: float, lat: float) -> bool:
+    """Even-odd point-in-polygon test; inner rings are holes."""
+    inside = False
+    for ring in rings:
+        x1, y1 = ring[-1]
+        for x2, y2 in ring:
+            if (y1 > lat) != (y2 > lat) and lon < (x2 - x1) * (lat - y1) / (
+                y2 - y1
+            ) + x1:
+                inside = not inside
+            x1, y1 = x2, y2
+    return inside
+
+
+class SpatialIndex:
+    """Uniform grid over the bounding boxes of warning polygons.
+
+    Each polygon is registered in every grid cell its bounding box overlaps.
+    Locations are grouped by cell so that each cell's candidate polygons are
+    tested against all of its locations in one pass: bounding box first,
+    then an exact point-in-polygon test.
+    """
+
+    def __init__(self, cell_size: float = CELL_SIZE):
+        self.cell_size = cell_size
+        self.polygons: list[IndexedPolygon] = []
+        self.cells: Dict[tuple[int, int], list[int]] = {}
+
+    def add(self, warning_id: str, geojson: Dict[str, Any]) -> None:
+        for rings in polygons_from_geojson(geojson):
+            if not rings or len(rings[0]) < 3:
+                continue
+            polygon_id = len(self.polygons)
+            polygon = IndexedPolygon(warning_id, rings, bounding_box(rings))
+            self.polygons.append(polygon)
+
+            min_lon, min_lat, max_lon, max_lat = polygon.bbox
+            min_x, min_y = self._cell(min_lon, min_lat)
+            max_x, max_y = self._cell(max_lon, max_lat)
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    self.cells.setdefault((x, y), []).append(polygon_id)
+
+    def match(self, locations: list[Location]) -> Dict[str, list[str]]:
+        """Return the ids of the warnings containing each location."""
+        by_cell: Dict[tuple[int, int], list[Location]] = {}
+        for location in locations:
+            by_cell.setdefault(self._cell(location.lon, location.lat), []).append(
+                location
+            )
+
+        matches: Dict[str, list[str]] = {location.id: [] for location in locations}
+        for cell, cell_locations in by_cell.items():
+            for polygon_id in self.cells.get(cell, ()):
+                polygon = self.polygons[polygon_id]
+                min_lon, min_lat, max_lon, max_lat = polygon.bbox
+                for location in cell_locations:
+                    if (
+                        min_lon <= location.lon <= max_lon
+                        and min_lat <= location.lat <= max_lat
+                        and polygon.warning_id not in matches[location.id]
+                        and contains(polygon.rings, location.lon, location.lat)
+                    ):
+                        matches[location.id].append(polygon.warning_id)
+        return matches
+
+    def _cell(self, lon: float, lat: float) -> tuple[int, int]:
+        return math.floor(lon / self.cell_size), math.floor(lat / self.cell_size)
+
+
+def _rings(coordinates: list[list[list[float]]]) -> list[Ring]:
+    return [[(point[0], point[1]) for point in ring] for ring in coordinates]
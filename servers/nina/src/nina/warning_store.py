@@ -0,0 +1,289 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+import httpx
+
+from nina.dashboard_service import MAX_CONCURRENCY
+from nina.spatial_index import Location, SpatialIndex
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = ("katwarn", "biwapp", "mowas", "dwd", "lhp", "police")
+REFRESH_INTERVAL = 60.0
+FIRST_REFRESH_TIMEOUT = 20.0
+MAX_AGE = 5 * REFRESH_INTERVAL
+ARS_LENGTH = 12
+AGS_LENGTH = 8
+REGION_LENGTHS = (2, 3, 5, 9, 12)
+
+
+@dataclass(slots=True)
+class StoredWarning:
+    id: str
+    version: int
+    provider: str
+    severity: str
+    type: str
+    start_date: str
+    title: str
+    ars: list[str] = field(default_factory=list)
+
+
+def region_prefix(ars: str) -> str:
+    """Return the shortest region prefix (Land, RB, Kreis, ...) naming an ARS.
+
+    "091620000000" covers Kreis "09162", "090000000000" all of Land "09".
+    """
+    for length in REGION_LENGTHS:
+        if not ars[length:].strip("0"):
+            return ars[:length]
+    return ars
+
+
+def affected_ars(detail: Dict[str, Any]) -> list[str]:
+    """Extract the 12-digit ARS geocodes of all areas of a warning detail."""
+    codes = (
+        geocode.get("value", "")
+        for info in detail.get("info", [])
+        for area in info.get("area", [])
+        for geocode in area.get("geocode", [])
+    )
+    return list(
+        dict.fromkeys(
+            code for code in codes if len(code) == ARS_LENGTH and code.isdigit()
+        )
+    )
+
+
+class WarningStore:
+    """In-memory store of the current warnings of all mapData feeds.
+
+    Warnings are indexed by id, provider, severity and the region prefix of
+    every affected ARS, and spatially by their GeoJSON polygons. Details and
+    GeoJSON are fetched once per warning id and version. `loaded` is set and
+    `refreshed_at` stamped by every refresh that loaded at least one feed.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.loaded = asyncio.Event()
+        self.refreshed_at: float | None = None
+        self.warnings: Dict[str, StoredWarning] = {}
+        self.by_provider: Dict[str, set[str]] = {}
+        self.by_severity: Dict[str, set[str]] = {}
+        self.by_region: Dict[str, set[str]] = {}
+        self.geometries: Dict[str, Dict[str, Any]] = {}
+        self.spatial_index = SpatialIndex()
+        self.unresolved: set[str] = set()
+
+    async def refresh(
+        self, client: httpx.AsyncClient, concurrency: int = MAX_CONCURRENCY
+    ) -> None:
+        feeds = await asyncio.gather(
+            *(_fetch_feed(client, provider) for provider in PROVIDERS)
+        )
+
+        warnings: Dict[str, StoredWarning] = {}
+        for provider, items in zip(PROVIDERS, feeds, strict=True):
+            if items is None:
+                for warning_id in self.by_provider.get(provider, ()):
+                    warnings[warning_id] = self.warnings[warning_id]
+                continue
+            for item in items:
+                try:
+                    warning = _parse_warning(provider, item)
+                except (KeyError, TypeError, AttributeError) as e:
+                    logger.warning(
+                        f"⚠️ Ungültige {provider}-Meldung übersprungen: {e!r}"
+                    )
+                    continue
+                known = self.warnings.get(warning.id)
+                if known and known.version == warning.version:
+                    warning.ars = known.ars
+                warnings[warning.id] = warning
+
+        stale = [
+            warning
+            for warning_id, warning in warnings.items()
+            if warning_id not in self.warnings
+            or warning_id in self.unresolved
+            or self.warnings[warning_id].version != warning.version
+        ]
+        geometries = {
+            warning_id: geometry
+            for warning_id, geometry in self.geometries.items()
+            if warning_id in warnings
+        }
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def enrich(warning: StoredWarning) -> str | None:
+            async with semaphore:
+                ars, geometry = await asyncio.gather(
+                    _fetch_affected_ars(client, warning.id),
+                    _fetch_geojson(client, warning.id),
+                )
+            warning.ars = ars or []
+            geometries[warning.id] = geometry or {}
+            return warning.id if ars is None or geometry is None else None
+
+        unresolved = await asyncio.gather(*(enrich(warning) for warning in stale))
+        self.unresolved = set(unresolved) - {None}
+        self._index(warnings, geometries)
+        if any(items is not None for items in feeds):
+            self._mark_refreshed()
+        logger.info(
+            f"🗺️ {len(warnings)} Warnungen gespeichert, {len(stale)} neu abgerufen"
+        )
+
+    async def ensure_current(
+        self, timeout: float = FIRST_REFRESH_TIMEOUT, max_age: float = MAX_AGE
+    ) -> None:
+        """Wait for the first refresh and check that the warnings are current.
+
+        Raises RuntimeError if no feed was loaded within timeout or the last
+        successful refresh is older than max_age, so that missing data is
+        never reported as "no warnings".
+        """
+        if not self.loaded.is_set():
+            try:
+                await asyncio.wait_for(self.loaded.wait(), timeout)
+            except TimeoutError:
+                raise RuntimeError(
+                    "Warnungen sind noch nicht geladen, bitte später erneut versuchen"
+                ) from None
+        age = self.clock() - self.refreshed_at
+        if age > max_age:
+            raise RuntimeError(
+                f"Warnungen sind veraltet, letzte Aktualisierung vor {age:.0f} s"
+            )
+
+    def find(
+        self, ars: str = "", provider: str = "", severity: str = ""
+    ) -> list[StoredWarning]:
+        """Return the warnings affecting an ARS, filtered by provider and severity.
+
+        A warning affects an ARS if one of its areas is the ARS itself or the
+        Gemeindeverband, Kreis, Regierungsbezirk or Land containing it. The
+        ARS is a 12-digit ARS or a region prefix; an 8-digit AGS lacks the
+        Gemeindeverband digits and is rejected.
+        """
+        ids = set(self.warnings)
+        if ars:
+            ars = ars.strip()
+            if len(ars) == AGS_LENGTH:
+                raise ValueError(f"AGS {ars} must be converted to a 12-digit ARS")
+            ars = ars.ljust(ARS_LENGTH, "0")
+            ids &= set().union(
+                *(self.by_region.get(ars[:length], ()) for length in REGION_LENGTHS)
+            )
+        if provider:
+            ids &= self.by_provider.get(provider.lower(), set())
+        if severity:
+            ids &= self.by_severity.get(severity.lower(), set())
+        return sorted(
+            (self.warnings[warning_id] for warning_id in ids),
+            key=lambda warning: warning.start_date,
+            reverse=True,
+        )
+
+    def find_at(self, locations: list[Location]) -> Dict[str, list[StoredWarning]]:
+        """Return the warnings whose polygons contain each location, by id."""
+        return {
+            location_id: [self.warnings[warning_id] for warning_id in warning_ids]
+            for location_id, warning_ids in self.spatial_index.match(locations).items()
+        }
+
+    def _mark_refreshed(self) -> None:
+        self.refreshed_at = self.clock()
+        self.loaded.set()
+
+    def _index(
+        self, warnings: Dict[str, StoredWarning], geometries: Dict[str, Dict[str, Any]]
+    ) -> None:
+        by_provider: Dict[str, set[str]] = {}
+        by_severity: Dict[str, set[str]] = {}
+        by_region: Dict[str, set[str]] = {}
+        for warning in warnings.values():
+            by_provider.setdefault(warning.provider, set()).add(warning.id)
+            by_severity.setdefault(warning.severity.lower(), set()).add(warning.id)
+            for ars in warning.ars:
+                by_region.setdefault(region_prefix(ars), set()).add(warning.id)
+
+        spatial_index = SpatialIndex()
+        for warning_id, geometry in geometries.items():
+            spatial_index.add(warning_id, geometry)
+
+        self.warnings = warnings
+        self.geometries = geometries
+        self.spatial_index = spatial_index
+        self.by_provider = by_provider
+        self.by_severity = by_severity
+        self.by_region = by_region
+
+
+async def poll_warnings(
+    client: httpx.AsyncClient,
+    store: WarningStore,
+    interval: float = REFRESH_INTERVAL,
+) -> None:
+    while True:
+        try:
+            await store.refresh(client)
+        except Exception:
+            logger.exception("❌ Warnungen konnten nicht aktualisiert werden")
+        await asyncio.sleep(interval)
+
+
+async def _fetch_feed(
+    client: httpx.AsyncClient, provider: str
+) -> list[Dict[str, Any]] | None:
+    try:
+        response = await client.get(f"/{provider}/mapData.json")
+        response.raise_for_status()
+        items = response.json()
+        if not isinstance(items, list):
+            raise ValueError("mapData ist keine Liste")
+        return items
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning(f"⚠️ {provider}-Meldungen konnten nicht geladen werden: {e}")
+        return None
+
+
+async def _fetch_affected_ars(
+    client: httpx.AsyncClient, warning_id: str
+) -> list[str] | None:
+    try:
+        response = await client.get(f"/warnings/{warning_id}.json")
+        response.raise_for_status()
+        return affected_ars(response.json())
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning(f"⚠️ Warnung {warning_id} konnte nicht geladen werden: {e}")
+        return None
+
+
+async def _fetch_geojson(
+    client: httpx.AsyncClient, warning_id: str
+) -> Dict[str, Any] | None:
+    try:
+        response = await client.get(f"/warnings/{warning_id}.geojson")
+        response.raise_for_status()
+        return response.json()
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning(f"⚠️ Geometrie {warning_id} konnte nicht geladen werden: {e}")
+        return None
+
+
+def _parse_warning(provider: str, item: Dict[str, Any]) -> StoredWarning:
+    return StoredWarning(
+        id=item["id"],
+        version=item.get("version", 0),
+        provider=provider,
+        severity=item.get("severity", ""),
+        type=item.get("type", ""),
+        start_date=item.get("startDate", ""),
+        title=item.get("i18nTitle", {}).get("de", ""),
+    )
@@ -1,6 +1,7 @@
+import json
 from pathlib import Path
 
-from nina.ars_code_service import ArsCodeService
+from nina.ars_code_service import ArsCodeService, Municipality
 
 GEMEINDE_FILE = Path(__file__).parent.parent / "resources" / "GV100AD_31082025.txt"
 
@@ -33,3 +34,107 @@ def test_ars_code_lookup():
 def test_file_exists():
     """Test that the gemeinde file exists"""
     assert GEMEINDE_FILE.exists(), f"File not found: {GEMEINDE_FILE}"
+
+
+def _lookup_ars(index, name: str) -> str:
+    candidates = ArsCodeService.lookup(index, name)
+    return candidates[0].ars if candidates else ""
+
+
+def test_ars_index_lookup_normalized():
+    """Test folded and suffix-stripped municipality lookup"""
+    index = ArsCodeService.build_index(ArsCodeService.parse_records(GEMEINDE_FILE))
+
+    assert _lookup_ars(index, "München, Landeshauptstadt") == "09162000"
+    assert _lookup_ars(index, "münchen") == "09162000"
+    assert _lookup_ars(index, "Muenchen") == "09162000"
+    assert _lookup_ars(index, "  HEIDE ") == "01051044"
+    assert _lookup_ars(index, "Gibt es nicht") == ""
+
+
+def test_ars_index_prefers_exact_name():
+    """Test that exact names are listed before stripped matches"""
+    index = ArsCodeService.build_index(
+        [
+            Municipality("Halle, Stadt", "1", "", "", "", ""),
+            Municipality("Halle", "2", "", "", "", ""),
+        ]
+    )
+
+    assert [m.ars for m in ArsCodeService.lookup(index, "Halle")] == ["2", "1"]
+    assert [m.ars for m in ArsCodeService.lookup(index, "Halle, Stadt")] == ["1"]
+
+
+def test_parse_records_keeps_duplicate_names():
+    """Test that municipalities sharing a name are all kept with context"""
+    records = ArsCodeService.parse_records(GEMEINDE_FILE)
+    index = ArsCodeService.build_index(records)
+
+    candidates = ArsCodeService.lookup(index, "Altenkirchen")
+    assert len(candidates) > 1
+    assert len({candidate.ars for candidate in candidates}) == len(candidates)
+
+    munich = ArsCodeService.lookup(index, "München")[0]
+    assert munich.land == "Bayern"
+    assert munich.regierungsbezirk == "Oberbayern"
+    assert munich.kreis == "München, Landeshauptstadt"
+    assert munich.postal_code == "80313"
+
+    flensburg = ArsCodeService.lookup(index, "Flensburg")[0]
+    assert flensburg.land == "Schleswig-Holstein"
+
+
+def test_disambiguate_by_postal_code_and_district():
+    """Test narrowing duplicate municipality names"""
+    index = ArsCodeService.build_index(ArsCodeService.parse_records(GEMEINDE_FILE))
+    candidates = ArsCodeService.lookup(index, "Altenkirchen")
+    target = candidates[-1]
+
+    by_postal_code = ArsCodeService.disambiguate(
+        candidates, postal_code=target.postal_code
+    )
+    assert target in by_postal_code
+    assert len(by_postal_code) < len(candidates)
+
+    by_district = ArsCodeService.disambiguate(candidates, district=target.kreis)
+    assert target in by_district
+    assert all(candidate.kreis == target.kreis for candidate in by_district)
+
+    assert ArsCodeService.disambiguate(candidates, district="Atlantis") == []
+
+
+def test_paginate_by_prefix():
+    """Test cursor pagination of the ARS codes of one region"""
+    municipalities = ArsCodeService.parse_records(GEMEINDE_FILE)
+    pages = ArsCodeService.paginate(municipalities, "09162", 1)
+
+    first = json.loads(pages[""])
+    assert first["total"] == 1
+    assert first["codes"] == [
+        {"ars": "09162000", "gemeinde": "München, Landeshauptstadt"}
+    ]
+    assert first["next_cursor"] is None
+
+
+def test_paginate_follows_cursors():
+    """Test that following next_cursor visits every code exactly once"""
+    municipalities = ArsCodeService.parse_records(GEMEINDE_FILE)
+    pages = ArsCodeService.paginate(municipalities, "01", 100)
+
+    codes = []
+    cursor = ""
+    while cursor is not None:
+        page = json.loads(pages[cursor or ""])
+        codes.extend(code["ars"] for code in page["codes"])
+        cursor = page["next_cursor"]
+
+    expected = sorted(m.ars for m in municipalities if m.ars.startswith("01"))
+    assert codes == expected
+    assert len(pages) == -(-len(expected) // 100)
+
+
+def test_paginate_unknown_prefix():
+    """Test that an unknown prefix yields one empty page"""
+    pages = ArsCodeService.paginate([], "99", 10)
+
+    assert json.loads(pages[""])["codes"] == []
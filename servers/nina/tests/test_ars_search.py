@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from nina.ars_code_service import ArsCodeService, Municipality
+from nina.ars_search import MunicipalitySearch
+
+GEMEINDE_FILE = Path(__file__).parent.parent / "resources" / "GV100AD_31082025.txt"
+
+
+@pytest.fixture(scope="module")
+def search() -> MunicipalitySearch:
+    return MunicipalitySearch(ArsCodeService.parse_records(GEMEINDE_FILE))
+
+
+def test_search_exact_name_scores_highest(search):
+    """Test that an exact (folded) name is the top hit"""
+    hits = search.search("Muenchen")
+
+    assert hits[0].name == "München, Landeshauptstadt"
+    assert hits[0].ars == "09162000"
+    assert hits[0].score == 1.0
+
+
+def test_search_prefix(search):
+    """Test prefix search"""
+    hits = search.search("Blankenfel", limit=3)
+
+    assert hits[0].name == "Blankenfelde-Mahlow"
+    assert len(hits) == 3
+
+
+def test_search_fuzzy(search):
+    """Test search with a typo"""
+    names = [hit.name for hit in search.search("Frankfrt am Main")]
+
+    assert "Frankfurt am Main, Stadt" in names
+
+
+def test_search_limit_and_order():
+    """Test that hits are ordered by score and limited"""
+    search = MunicipalitySearch(
+        [
+            Municipality("Heide, Stadt", "1", "", "", "", ""),
+            Municipality("Heidenau", "2", "", "", "", ""),
+            Municipality("Heidelberg, Stadt", "3", "", "", "", ""),
+        ]
+    )
+
+    hits = search.search("heide", limit=2)
+
+    assert [hit.ars for hit in hits] == ["1", "2"]
+    assert hits[0].score > hits[1].score
+    assert search.search("") == []
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from nina.ars_code_service import ArsCodeService
+from nina.ars_snapshot import (
+    load_municipalities,
+    read_snapshot,
+    source_digest,
+    write_snapshot,
+)
+
+GEMEINDE_FILE = Path(__file__).parent.parent / "resources" / "GV100AD_31082025.txt"
+
+
+def test_snapshot_roundtrip(tmp_path):
+    """Test that a snapshot restores the parsed municipalities"""
+    municipalities = ArsCodeService.parse_records(GEMEINDE_FILE)
+    digest = source_digest(GEMEINDE_FILE)
+    target = tmp_path / "gv100ad.bin"
+
+    write_snapshot(municipalities, digest, target)
+
+    assert read_snapshot(target, digest) == municipalities
+
+
+def test_snapshot_roundtrip_without_municipalities(tmp_path):
+    """Test that an empty snapshot is read back instead of treated as corrupt"""
+    source = tmp_path / "gemeinden.txt"
+    target = tmp_path / "gemeinden.bin"
+    source.write_text("", encoding="utf-8")
+
+    write_snapshot([], source_digest(source), target)
+
+    assert read_snapshot(target, source_digest(source)) == []
+    assert load_municipalities(source, target) == []
+    assert read_snapshot(target, source_digest(source)) == []
+
+
+def test_snapshot_rejects_other_source(tmp_path):
+    """Test that a snapshot of another source file is ignored"""
+    target = tmp_path / "gv100ad.bin"
+    write_snapshot(ArsCodeService.parse_records(GEMEINDE_FILE), b"0" * 32, target)
+
+    assert read_snapshot(target, b"1" * 32) is None
+    assert read_snapshot(tmp_path / "missing.bin", b"1" * 32) is None
+
+
+def test_load_municipalities_rebuilds_on_change(tmp_path):
+    """Test that the snapshot is regenerated when the text file changes"""
+    lines = GEMEINDE_FILE.read_text(encoding="utf-8-sig").splitlines(keepends=True)
+    source = tmp_path / "gemeinden.txt"
+    target = tmp_path / "gemeinden.bin"
+
+    source.write_text("".join(lines[:100]), encoding="utf-8")
+    first = load_municipalities(source, target)
+    assert target.exists()
+    assert load_municipalities(source, target) == first
+
+    source.write_text("".join(lines[:200]), encoding="utf-8")
+    second = load_municipalities(source, target)
+    assert len(second) > len(first)
+    assert read_snapshot(target, source_digest(source)) == second
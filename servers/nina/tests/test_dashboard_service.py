@@ -0,0 +1,64 @@
+import asyncio
+
+import httpx
+import pytest
+
+from nina.dashboard_service import dashboard_ars, fetch_dashboards
+
+
+def test_dashboard_ars():
+    """Test normalization to Kreis-level ARS"""
+    assert dashboard_ars("09162000") == "091620000000"
+    assert dashboard_ars("091620000000") == "091620000000"
+    assert dashboard_ars(" 01051044 ") == "010510000000"
+
+
+@pytest.mark.asyncio
+async def test_fetch_dashboards_deduplicates_and_merges():
+    """Test that each Kreis is requested once and merged by ARS"""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if "010510000000" in request.url.path:
+            return httpx.Response(500)
+        return httpx.Response(200, json=[{"id": request.url.path}])
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(handler)
+    ) as client:
+        result = await fetch_dashboards(
+            client, ["09162000", "09162001", "01051044", ""]
+        )
+
+    assert sorted(requested) == [
+        "/dashboard/010510000000.json",
+        "/dashboard/091620000000.json",
+    ]
+    assert result["091620000000"] == [{"id": "/dashboard/091620000000.json"}]
+    assert "error" in result["010510000000"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_dashboards_bounds_concurrency():
+    """Test that no more requests than allowed are in flight"""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=[])
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(handler)
+    ) as client:
+        result = await fetch_dashboards(
+            client, [f"{i:05d}000" for i in range(20)], concurrency=3
+        )
+
+    assert len(result) == 20
+    assert peak == 3
@@ -0,0 +1,88 @@
+import asyncio
+
+import httpx
+import pytest
+
+from nina import data_version
+from nina.data_version import DATA_VERSION_PATH, refresh_cache
+from nina.http_cache import CachingTransport
+
+
+class StubServer:
+    def __init__(self):
+        self.version = 1
+        self.fail = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == DATA_VERSION_PATH:
+            if self.fail:
+                return httpx.Response(503)
+            return httpx.Response(
+                200, json={"version": self.version, "hash": "abc", "entries": []}
+            )
+        return httpx.Response(200, json={"path": request.url.path})
+
+
+@pytest.mark.asyncio
+async def test_refresh_cache_invalidates_only_on_version_change():
+    """Test that versioned responses are dropped once per data version change"""
+    server = StubServer()
+    cache = CachingTransport(
+        httpx.MockTransport(server),
+        default_ttl=3600,
+        ttl_overrides={DATA_VERSION_PATH: 0},
+    )
+
+    async with httpx.AsyncClient(base_url="https://nina.test", transport=cache) as c:
+        version = await refresh_cache(c, cache, None)
+        await c.get("/dashboard/091620000000.json")
+        await c.get("/dwd/mapData.json")
+        await c.get("/appdata/gsb/faqs/DE/faq.json")
+
+        version = await refresh_cache(c, cache, version)
+        assert len(cache.entries) == 4
+
+        server.fail = True
+        version = await refresh_cache(c, cache, version)
+        assert version == "1:abc"
+        assert len(cache.entries) == 3
+
+        server.fail = False
+        server.version = 2
+        version = await refresh_cache(c, cache, version)
+
+    assert version == "2:abc"
+    assert [httpx.URL(key).path for key in cache.entries] == [
+        "/appdata/gsb/faqs/DE/faq.json",
+        DATA_VERSION_PATH,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_cache_keeps_version_on_non_object_body():
+    """Test that a JSON body that is not an object keeps the known version"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=["not", "an", "object"])
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(handler)
+    ) as client:
+        assert await refresh_cache(client, CachingTransport(), "1:abc") == "1:abc"
+
+
+@pytest.mark.asyncio
+async def test_poll_data_version_survives_unexpected_errors(monkeypatch):
+    """Test that an unexpected error does not end the poller"""
+    calls = []
+
+    async def failing_refresh(client, cache, known):
+        calls.append(known)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(data_version, "refresh_cache", failing_refresh)
+    with pytest.raises(asyncio.CancelledError):
+        await data_version.poll_data_version(None, CachingTransport(), interval=0)
+    assert calls == [None, None]
@@ -0,0 +1,114 @@
+import httpx
+import pytest
+
+from nina.http_cache import CachingTransport
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubServer:
+    def __init__(self, headers: dict[str, str] | None = None):
+        self.headers = headers or {}
+        self.requests: list[httpx.Request] = []
+        self.version = 1
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"v{self.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(
+            200,
+            headers={"etag": etag, **self.headers},
+            json={"path": request.url.path, "version": self.version},
+        )
+
+
+def _client(transport: CachingTransport) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url="https://nina.test", transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_fresh_response_is_served_from_cache():
+    """Test that a fresh response is not requested twice"""
+    server = StubServer({"cache-control": "max-age=30"})
+    clock = Clock()
+    cache = CachingTransport(httpx.MockTransport(server), clock=clock)
+
+    async with _client(cache) as client:
+        first = await client.get("/dashboard/1.json")
+        second = await client.get("/dashboard/1.json")
+
+    assert first.json() == second.json()
+    assert len(server.requests) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_stale_response_is_revalidated_with_etag():
+    """Test conditional revalidation with If-None-Match"""
+    server = StubServer({"cache-control": "max-age=30"})
+    clock = Clock()
+    cache = CachingTransport(httpx.MockTransport(server), clock=clock)
+
+    async with _client(cache) as client:
+        await client.get("/dashboard/1.json")
+        clock.now = 31
+        revalidated = await client.get("/dashboard/1.json")
+        server.version = 2
+        clock.now = 62
+        changed = await client.get("/dashboard/1.json")
+
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+    assert revalidated.status_code == 200
+    assert revalidated.json()["version"] == 1
+    assert changed.json()["version"] == 2
+    assert cache.stats.revalidations == 1
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_no_store_and_errors_are_not_cached():
+    """Test that no-store responses and errors bypass the cache"""
+    server = StubServer({"cache-control": "no-store"})
+    cache = CachingTransport(httpx.MockTransport(server), clock=Clock())
+
+    async with _client(cache) as client:
+        await client.get("/warnings/1.json")
+        await client.get("/warnings/1.json")
+
+    assert len(server.requests) == 2
+    assert not cache.entries
+
+
+@pytest.mark.asyncio
+async def test_ttl_override_and_lru_eviction():
+    """Test per-endpoint TTL overrides and the LRU size bound"""
+    server = StubServer({"cache-control": "no-cache"})
+    clock = Clock()
+    cache = CachingTransport(
+        httpx.MockTransport(server),
+        ttl_overrides={"*/mapData.json": 60},
+        max_entries=2,
+        clock=clock,
+    )
+
+    async with _client(cache) as client:
+        await client.get("/dwd/mapData.json")
+        await client.get("/dwd/mapData.json")
+        await client.get("/lhp/mapData.json")
+        await client.get("/police/mapData.json")
+
+    assert cache.stats.hits == 1
+    assert cache.stats.evictions == 1
+    assert [httpx.URL(key).path for key in cache.entries] == [
+        "/lhp/mapData.json",
+        "/police/mapData.json",
+    ]
+    assert cache.invalidate("/police/*") == 1
@@ -0,0 +1,62 @@
+from nina.encoding import encode_groups
+from nina.warning_store import StoredWarning
+
+WARNING = StoredWarning(
+    id="dwd.1",
+    version=2,
+    provider="dwd",
+    severity="Severe",
+    type="Alert",
+    start_date="2025-01-01",
+    title="Sturm, Orkanböen",
+    ars=["091620000000", "091840000000"],
+)
+GROUPS = {"091620000000": [WARNING], "051110000000": []}
+
+
+def test_encode_groups_json_keeps_groups():
+    assert encode_groups(GROUPS, "query_ars") is GROUPS
+
+
+def test_encode_groups_table():
+    assert encode_groups(GROUPS, "query_ars", "table") == {
+        "columns": [
+            "query_ars",
+            "id",
+            "version",
+            "provider",
+            "severity",
+            "type",
+            "start_date",
+            "title",
+            "ars",
+        ],
+        "rows": [
+            [
+                "091620000000",
+                "dwd.1",
+                2,
+                "dwd",
+                "Severe",
+                "Alert",
+                "2025-01-01",
+                "Sturm, Orkanböen",
+                ["091620000000", "091840000000"],
+            ]
+        ],
+    }
+
+
+def test_encode_groups_csv():
+    assert encode_groups(GROUPS, "query_ars", "csv") == (
+        "query_ars,id,version,provider,severity,type,start_date,title,ars\n"
+        "091620000000,dwd.1,2,dwd,Severe,Alert,2025-01-01,"
+        '"Sturm, Orkanböen",091620000000 091840000000\n'
+    )
+
+
+def test_encode_groups_without_rows():
+    assert encode_groups({"051110000000": []}, "query_ars", "table") == {
+        "columns": ["query_ars"],
+        "rows": [],
+    }
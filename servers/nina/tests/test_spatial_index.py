@@ -0,0 +1,69 @@
+import random
+
+from nina.spatial_index import Location, SpatialIndex, contains, polygons_from_geojson
+
+SQUARE = [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]]
+HOLE = [[1.0, 1.0], [3.0, 1.0], [3.0, 3.0], [1.0, 3.0], [1.0, 1.0]]
+
+
+def test_polygons_from_geojson_flattens_features():
+    """Test extraction of polygons from nested GeoJSON objects"""
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [SQUARE]},
+            },
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "MultiPolygon",
+                    "coordinates": [[SQUARE], [SQUARE, HOLE]],
+                },
+            },
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [1, 1]}},
+        ],
+    }
+
+    polygons = polygons_from_geojson(geojson)
+
+    assert [len(rings) for rings in polygons] == [1, 1, 2]
+    assert polygons[0][0][1] == (4.0, 0.0)
+
+
+def test_contains_respects_holes():
+    """Test the point-in-polygon test with an inner ring"""
+    rings = polygons_from_geojson({"type": "Polygon", "coordinates": [SQUARE, HOLE]})[0]
+
+    assert contains(rings, 0.5, 0.5)
+    assert not contains(rings, 2.0, 2.0)
+    assert not contains(rings, 5.0, 2.0)
+
+
+def test_spatial_index_matches_brute_force():
+    """Test that the grid index finds the same warnings as a linear scan"""
+    rng = random.Random(42)
+    index = SpatialIndex(cell_size=0.5)
+    shapes = {}
+    for i in range(50):
+        lon, lat = rng.uniform(5, 15), rng.uniform(47, 55)
+        size = rng.uniform(0.1, 2)
+        ring = [[lon, lat], [lon + size, lat], [lon, lat + size], [lon, lat]]
+        shapes[f"w{i}"] = polygons_from_geojson(
+            {"type": "Polygon", "coordinates": [ring]}
+        )[0]
+        index.add(f"w{i}", {"type": "Polygon", "coordinates": [ring]})
+    locations = [
+        Location(str(i), rng.uniform(47, 55), rng.uniform(5, 15)) for i in range(2000)
+    ]
+
+    matches = index.match(locations)
+
+    for location in locations:
+        expected = {
+            warning_id
+            for warning_id, rings in shapes.items()
+            if contains(rings, location.lon, location.lat)
+        }
+        assert set(matches[location.id]) == expected
@@ -0,0 +1,255 @@
+import asyncio
+
+import httpx
+import pytest
+
+from nina.dashboard_service import MAX_CONCURRENCY
+from nina.spatial_index import Location
+from nina.warning_store import (
+    MAX_AGE,
+    PROVIDERS,
+    StoredWarning,
+    WarningStore,
+    affected_ars,
+    poll_warnings,
+    region_prefix,
+)
+
+
+def _detail(*codes: str) -> dict:
+    return {
+        "info": [
+            {"area": [{"geocode": [{"valueName": "SHN", "value": c}]} for c in codes]}
+        ]
+    }
+
+
+class StubServer:
+    def __init__(self):
+        self.feeds = {
+            "mowas": [
+                {"id": "mow.1", "version": 1, "severity": "Severe", "startDate": "1"},
+            ],
+            "dwd": [
+                {"id": "dwd.1", "version": 1, "severity": "Minor", "startDate": "2"},
+            ],
+        }
+        self.details = {
+            "mow.1": _detail("091620000000"),
+            "dwd.1": _detail("090000000000", "noars"),
+        }
+        self.geometries = {
+            "mow.1": {
+                "type": "Polygon",
+                "coordinates": [[[11, 48], [12, 48], [12, 49], [11, 49], [11, 48]]],
+            },
+        }
+        self.requests: list[str] = []
+        self.failing: set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append(path)
+        provider = path.split("/")[1]
+        if path.endswith("/mapData.json"):
+            if provider in self.failing:
+                return httpx.Response(500)
+            return httpx.Response(200, json=self.feeds.get(provider, []))
+        warning_id, _, suffix = path.removeprefix("/warnings/").rpartition(".")
+        if suffix == "geojson":
+            return httpx.Response(
+                200, json=self.geometries.get(warning_id, {"type": "Polygon"})
+            )
+        return httpx.Response(200, json=self.details[warning_id])
+
+
+def test_region_prefix_and_affected_ars():
+    """Test region prefixes and ARS extraction from warning details"""
+    assert region_prefix("090000000000") == "09"
+    assert region_prefix("091620000000") == "09162"
+    assert region_prefix("091620000001") == "091620000001"
+    assert affected_ars(_detail("091620000000", "091620000000", "123")) == [
+        "091620000000"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_indexes_feeds_and_enriches_once_per_version():
+    """Test that feeds are merged and details fetched once per id and version"""
+    server = StubServer()
+    store = WarningStore()
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(server)
+    ) as client:
+        await store.refresh(client)
+        await store.refresh(client)
+        server.feeds["mowas"][0]["version"] = 2
+        await store.refresh(client)
+
+    details = [path for path in server.requests if path.endswith(".json")]
+    details = [path for path in details if path.startswith("/warnings/")]
+    assert sorted(details) == [
+        "/warnings/dwd.1.json",
+        "/warnings/mow.1.json",
+        "/warnings/mow.1.json",
+    ]
+    assert [w.id for w in store.find("091620000000")] == ["dwd.1", "mow.1"]
+    assert [w.id for w in store.find("09162")] == ["dwd.1", "mow.1"]
+    assert [w.id for w in store.find("091610000000")] == ["dwd.1"]
+    assert [w.id for w in store.find("091620000000", severity="severe")] == ["mow.1"]
+    assert [w.id for w in store.find(provider="mowas")] == ["mow.1"]
+    assert store.find("010510000000") == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_warnings_of_failing_feeds():
+    """Test that a failing feed keeps its previous warnings"""
+    server = StubServer()
+    store = WarningStore()
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(server)
+    ) as client:
+        await store.refresh(client)
+        server.failing.add("dwd")
+        server.feeds["mowas"] = []
+        await store.refresh(client)
+
+    assert list(store.warnings) == ["dwd.1"]
+    assert [w.id for w in store.find("091620000000")] == ["dwd.1"]
+
+
+@pytest.mark.asyncio
+async def test_find_at_matches_locations_against_warning_polygons():
+    """Test that locations are matched against the stored warning polygons"""
+    server = StubServer()
+    store = WarningStore()
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(server)
+    ) as client:
+        await store.refresh(client)
+
+    result = store.find_at(
+        [Location("inside", 48.5, 11.5), Location("outside", 52.5, 13.4)]
+    )
+
+    assert [w.id for w in result["inside"]] == ["mow.1"]
+    assert result["outside"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_warnings_resolves_ags_of_municipality_resource(monkeypatch):
+    """Test that the AGS from ars://gemeinden/... finds Verband-level warnings"""
+    from nina import server
+
+    store = WarningStore()
+    warning = StoredWarning(
+        id="mow.2",
+        version=1,
+        provider="mowas",
+        severity="Severe",
+        type="Alert",
+        start_date="1",
+        title="Gefahr",
+        ars=["010550032032"],
+    )
+    store._index({"mow.2": warning}, {})
+    store._mark_refreshed()
+    monkeypatch.setattr(server, "warning_store", store)
+
+    municipality = await server.get_municipalities_by_postal_code.fn(
+        "Neustadt in Holstein", "23730"
+    )
+    ags = municipality[0].ars
+    result = await server.get_warnings.fn([ags, municipality[0].full_ars])
+
+    assert (ags, municipality[0].full_ars) == ("01055032", "010550032032")
+    assert [w.id for w in result[ags]] == ["mow.2"]
+    assert [w.id for w in result["010550032032"]] == ["mow.2"]
+    with pytest.raises(ValueError, match="AGS 01055032"):
+        store.find(ags)
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_invalid_items_and_feeds():
+    """Test that malformed items are skipped and non-list feeds kept as failed"""
+    server = StubServer()
+    store = WarningStore()
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(server)
+    ) as client:
+        await store.refresh(client)
+        server.feeds["mowas"].append({"version": 1})
+        server.feeds["mowas"].append("mow.3")
+        server.feeds["dwd"] = {"error": "unavailable"}
+        await store.refresh(client)
+
+    assert sorted(store.warnings) == ["dwd.1", "mow.1"]
+
+
+@pytest.mark.asyncio
+async def test_poll_warnings_survives_failing_refresh():
+    """Test that an unexpected refresh error does not end the poller"""
+    calls = []
+
+    class FailingStore(WarningStore):
+        async def refresh(self, client, concurrency=MAX_CONCURRENCY):
+            calls.append(1)
+            if len(calls) == 1:
+                raise KeyError("id")
+            raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await poll_warnings(None, FailingStore(), interval=0)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_store_is_not_current_before_a_feed_loaded_or_when_stale():
+    """Test that missing or stale data raises instead of finding no warnings"""
+    server = StubServer()
+    server.failing.update(PROVIDERS)
+    now = [0.0]
+    store = WarningStore(clock=lambda: now[0])
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(server)
+    ) as client:
+        with pytest.raises(RuntimeError, match="noch nicht geladen"):
+            await store.ensure_current(timeout=0)
+        await store.refresh(client)
+        with pytest.raises(RuntimeError, match="noch nicht geladen"):
+            await store.ensure_current(timeout=0)
+
+        server.failing.clear()
+        await store.refresh(client)
+        await store.ensure_current(timeout=0)
+
+        server.failing.update(PROVIDERS)
+        now[0] = MAX_AGE + 1
+        await store.refresh(client)
+        with pytest.raises(RuntimeError, match="veraltet"):
+            await store.ensure_current(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_get_warnings_waits_for_first_refresh(monkeypatch):
+    """Test that getWarnings answers only once the store has been loaded"""
+    from nina import server as nina_server
+
+    store = WarningStore()
+    monkeypatch.setattr(nina_server, "warning_store", store)
+    pending = asyncio.create_task(nina_server.get_warnings.fn(["091620000000"]))
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    async with httpx.AsyncClient(
+        base_url="https://nina.test", transport=httpx.MockTransport(StubServer())
+    ) as client:
+        await store.refresh(client)
+
+    result = await pending
+    assert [w.id for w in result["091620000000"]] == ["dwd.1", "mow.1"]